@@ -3,6 +3,8 @@ from django.db.models import Count, Avg, F, Q, Sum, Case, When, FloatField
 from django.db.models.functions import TruncMonth, ExtractHour
 from django.utils import timezone
 from datetime import timedelta
+from backend.async_db import fetch_aggregate, fetch_list
+from backend.reports import compose_report
 from ..models import User
 from subscriptions.models import Subscription
 from attendance.models import Attendance
@@ -19,29 +21,33 @@ class StudentAnalyticsService:
             query = query.filter(date_joined__lte=end_date)
 
         # 월별 신규 등록 수강생 수
-        monthly_signups = await query.annotate(
+        monthly_signups = query.annotate(
             month=TruncMonth('date_joined')
         ).values('month').annotate(
             new_students=Count('id')
         ).order_by('month')
 
         # 활성/비활성 수강생 수
-        status_counts = await Subscription.objects.filter(
+        status_counts = Subscription.objects.filter(
             student__in=query
         ).values('student').annotate(
             active_count=Count('id', filter=Q(status='active')),
             expired_count=Count('id', filter=Q(status='expired')),
             cancelled_count=Count('id', filter=Q(status='cancelled'))
-        ).aggregate(
-            total_active=Sum('active_count'),
-            total_expired=Sum('expired_count'),
-            total_cancelled=Sum('cancelled_count')
         )
 
-        return {
-            'monthly_signups': monthly_signups,
-            'status_counts': status_counts
-        }
+        return await compose_report(
+            {
+                'monthly_signups': fetch_list(monthly_signups),
+                'status_counts': fetch_aggregate(
+                    status_counts,
+                    total_active=Sum('active_count'),
+                    total_expired=Sum('expired_count'),
+                    total_cancelled=Sum('cancelled_count')
+                ),
+            },
+            defaults={'monthly_signups': [], 'status_counts': {}}
+        )
 
     @staticmethod
     async def get_retention_analysis(months=6):
@@ -50,7 +56,7 @@ class StudentAnalyticsService:
         start_date = now - timedelta(days=30 * months)
         
         # 코호트 분석: 등록 월별로 그룹화하여 유지율 계산
-        cohorts = await User.objects.filter(
+        cohorts = await fetch_list(User.objects.filter(
             user_type='student',
             date_joined__gte=start_date
         ).annotate(
@@ -61,7 +67,7 @@ class StudentAnalyticsService:
                 'subscription',
                 filter=Q(subscription__status='active')
             )
-        ).order_by('cohort_month')
+        ).order_by('cohort_month'))
 
         # 월별 유지율 계산
         for cohort in cohorts:
@@ -76,7 +82,7 @@ class StudentAnalyticsService:
     async def get_class_preferences():
         """수강생 선호도 분석"""
         # 수업 유형별 수강생 수
-        class_preferences = await Subscription.objects.filter(
+        class_preferences = Subscription.objects.filter(
             status='active'
         ).values(
             'dance_class__name',
@@ -97,7 +103,7 @@ class StudentAnalyticsService:
         ).order_by('-student_count')
 
         # 시간대별 선호도
-        time_preferences = await Attendance.objects.filter(
+        time_preferences = Attendance.objects.filter(
             status='present'
         ).annotate(
             hour=ExtractHour('schedule__start_time')
@@ -105,23 +111,26 @@ class StudentAnalyticsService:
             attendance_count=Count('id')
         ).order_by('hour')
 
-        return {
-            'class_preferences': class_preferences,
-            'time_preferences': time_preferences
-        }
+        return await compose_report(
+            {
+                'class_preferences': fetch_list(class_preferences),
+                'time_preferences': fetch_list(time_preferences),
+            },
+            defaults={'class_preferences': [], 'time_preferences': []}
+        )
 
     @staticmethod
     async def get_student_behavior(student_id):
         """개별 수강생 행동 분석"""
         # 출석 패턴
-        attendance_pattern = await Attendance.objects.filter(
+        attendance_pattern = Attendance.objects.filter(
             student_id=student_id
         ).values('status').annotate(
             count=Count('id')
         ).order_by('status')
         
         # 선호 수업 시간
-        preferred_times = await Attendance.objects.filter(
+        preferred_times = Attendance.objects.filter(
             student_id=student_id,
             status='present'
         ).annotate(
@@ -131,7 +140,7 @@ class StudentAnalyticsService:
         ).order_by('-count')[:3]
         
         # 수강 이력
-        subscription_history = await Subscription.objects.filter(
+        subscription_history = Subscription.objects.filter(
             student_id=student_id
         ).values(
             'dance_class__name',
@@ -140,8 +149,15 @@ class StudentAnalyticsService:
             'status'
         ).order_by('-start_date')
 
-        return {
-            'attendance_pattern': attendance_pattern,
-            'preferred_times': preferred_times,
-            'subscription_history': subscription_history
-        }
\ No newline at end of file
+        return await compose_report(
+            {
+                'attendance_pattern': fetch_list(attendance_pattern),
+                'preferred_times': fetch_list(preferred_times),
+                'subscription_history': fetch_list(subscription_history),
+            },
+            defaults={
+                'attendance_pattern': [],
+                'preferred_times': [],
+                'subscription_history': [],
+            }
+        )
\ No newline at end of file
@@ -0,0 +1,48 @@
+# backend/accounts/services/student_service.py
+from datetime import timedelta
+
+from django.db.models import Count, FloatField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from subscriptions.models import Subscription
+from attendance.models import Attendance
+from attendance.services.rollup_service import attendance_rate_aggregate
+
+# 출석률 계산 기간(일)
+ATTENDANCE_RATE_DAYS = 30
+
+
+class StudentService:
+    @staticmethod
+    def annotate_list_metrics(queryset, today=None):
+        """
+        수강생 목록용 지표 추가
+
+        - active_subscriptions_count: 이용중 수강권 수
+        - attendance_rate: 최근 ATTENDANCE_RATE_DAYS일 출석률(%). 출결 통계와 같은 정의
+          (출석+지각) / (출석+지각+결석)이며, 대상 기록이 없으면 None
+
+        지표마다 수강생별 상관 서브쿼리로 따로 계산해, 수강권 × 출결 행이 곱해지는 JOIN 없이
+        수강생 수에 비례하는 비용으로 조회한다.
+        """
+        today = today or timezone.localdate()
+
+        active_subscriptions = Subscription.objects.filter(
+            student=OuterRef('pk'),
+            status='active'
+        ).order_by().values('student').annotate(
+            count=Count('id')
+        ).values('count')
+
+        attendance_rate = Attendance.objects.filter(
+            student=OuterRef('pk'),
+            date__gt=today - timedelta(days=ATTENDANCE_RATE_DAYS),
+            date__lte=today
+        ).order_by().values('student').annotate(
+            rate=attendance_rate_aggregate()
+        ).values('rate')
+
+        return queryset.annotate(
+            active_subscriptions_count=Coalesce(Subquery(active_subscriptions), Value(0)),
+            attendance_rate=Subquery(attendance_rate, output_field=FloatField())
+        )
@@ -1,3 +1,137 @@
-from django.test import TestCase
+import asyncio
+from datetime import time, timedelta
+from time import monotonic
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.db import OperationalError, connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from attendance.models import Attendance
+from backend.async_db import fetch_list, query_deadline, run_query
+from backend.reports import compose_report
+from classes.models import ClassSchedule, DanceClass
+from subscriptions.models import Subscription
+from .models import User
+from .services.analytics_service import StudentAnalyticsService
+
+
+class StudentListMetricsTest(TestCase):
+    def setUp(self):
+        today = timezone.localdate()
+        instructor = User.objects.create(username='instructor', user_type='instructor')
+        self.student = User.objects.create(username='student', user_type='student')
+        self.idle = User.objects.create(username='idle', user_type='student')
+
+        classes = [
+            DanceClass.objects.create(name=f'class{i}', instructor=instructor, capacity=10)
+            for i in range(3)
+        ]
+        for dance_class, status in zip(classes, ('active', 'active', 'expired')):
+            Subscription.objects.create(
+                student=self.student,
+                dance_class=dance_class,
+                subscription_type='days',
+                start_date=today - timedelta(days=60),
+                end_date=today + timedelta(days=30),
+                status=status,
+            )
+        schedule = ClassSchedule.objects.create(
+            dance_class=classes[0], weekday=0,
+            start_time=time(18), end_time=time(19), room='A'
+        )
+        # 최근 30일: 출석 2 / 지각 1 / 결석 1 / 사유결석 1, 그 이전 기록은 제외
+        # (출결 통계와 같이 지각은 출석으로, 사유결석은 분모에서 제외)
+        records = (
+            (1, 'present'), (2, 'present'), (3, 'late'), (4, 'absent'), (5, 'excused'),
+            (40, 'absent'),
+        )
+        for days, status in records:
+            Attendance.objects.create(
+                student=self.student, dance_class=classes[0], schedule=schedule,
+                date=today - timedelta(days=days), status=status
+            )
+
+        self.client = APIClient()
+        self.client.force_authenticate(instructor)
+
+    def test_metrics_are_computed_independently(self):
+        response = self.client.get('/api/students/')
+        self.assertEqual(response.status_code, 200)
+        rows = {row['id']: row for row in response.data['results']}
+
+        self.assertEqual(rows[self.student.id]['active_subscriptions_count'], 2)
+        self.assertEqual(rows[self.student.id]['attendance_rate'], 75.0)
+        self.assertEqual(rows[self.idle.id]['active_subscriptions_count'], 0)
+        self.assertIsNone(rows[self.idle.id]['attendance_rate'])
+
+
+class ReportTimeoutTest(TestCase):
+    """제한 시간을 넘긴 리포트 항목은 기본값과 partial_errors로 응답"""
+
+    def test_slow_and_failed_parts_fall_back_to_defaults(self):
+        async def fast():
+            return [1]
+
+        async def slow():
+            await asyncio.sleep(5)
+            return [2]
+
+        async def failing():
+            raise ValueError('잘못된 값')
+
+        with self.assertLogs('backend.reports', 'WARNING'):
+            report = async_to_sync(compose_report)(
+                {'fast': fast(), 'slow': slow(), 'failing': failing()},
+                defaults={'slow': [], 'failing': {}},
+                timeout=0.05
+            )
+        self.assertEqual(report, {
+            'fast': [1],
+            'slow': [],
+            'failing': {},
+            'partial_errors': {'slow': '시간 초과', 'failing': '잘못된 값'},
+        })
+
+    @override_settings(REPORT_TIMEOUT_SECONDS=0.05)
+    def test_slow_section_of_class_preferences(self):
+        async def slow_attendance(queryset):
+            if queryset.model is Attendance:
+                await asyncio.sleep(5)
+            return await fetch_list(queryset)
+
+        with mock.patch(
+            'accounts.services.analytics_service.fetch_list', side_effect=slow_attendance
+        ):
+            report = async_to_sync(StudentAnalyticsService.get_class_preferences)()
+
+        self.assertEqual(report['class_preferences'], [])
+        self.assertEqual(report['time_preferences'], [])
+        self.assertEqual(report['partial_errors'], {'time_preferences': '시간 초과'})
+
+    @skipUnless(connection.vendor == 'sqlite', 'SQLite 진행 핸들러 확인')
+    def test_query_is_interrupted_at_deadline(self):
+        def slow_query():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 100000000) '
+                    'SELECT count(*) FROM n'
+                )
+                return cursor.fetchone()
+
+        async def run():
+            # async_to_sync는 컨텍스트 변경을 호출자에게 되돌려 주므로 반드시 복원
+            token = query_deadline.set(monotonic() + 0.05)
+            try:
+                return await run_query(slow_query)
+            finally:
+                query_deadline.reset(token)
+
+        started = monotonic()
+        with self.assertRaises(OperationalError):
+            async_to_sync(run)()
+        self.assertLess(monotonic() - started, 2)
+        # 중단 후에도 같은 연결로 조회 가능
+        self.assertEqual(User.objects.count(), 0)
@@ -1,13 +1,11 @@
 # backend/accounts/views/analytics_views.py
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from backend.async_views import async_api_view
 from ..services.analytics_service import StudentAnalyticsService
 from datetime import datetime
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@async_api_view
 async def enrollment_trends(request):
     """수강생 등록 동향 조회"""
     try:
@@ -32,8 +30,7 @@ async def enrollment_trends(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@async_api_view
 async def retention_analysis(request):
     """수강생 유지율 분석 조회"""
     try:
@@ -53,8 +50,7 @@ async def retention_analysis(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@async_api_view
 async def class_preferences(request):
     """수강생 선호도 분석 조회"""
     try:
@@ -66,8 +62,7 @@ async def class_preferences(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@async_api_view
 async def student_behavior(request, student_id):
     """개별 수강생 행동 분석 조회"""
     try:
@@ -1,24 +1,26 @@
 # backend/accounts/views/auth.py
 
 from django.contrib.auth import get_user_model
-from rest_framework import status, viewsets, filters
+from rest_framework import status, viewsets
 from rest_framework.decorators import api_view, permission_classes, action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework_simplejwt.views import TokenObtainPairView
 from ..serializers import CustomTokenObtainPairSerializer, UserSerializer, StudentCreateSerializer, StudentDetailSerializer, StudentListSerializer, StudentProfile
-from django.db.models import Count, Avg, Q, Case, When, FloatField
 from django.utils import timezone
 
 from django.contrib.auth import get_user_model 
 from subscriptions.models import Subscription
 from attendance.models import Attendance
+from search.filters import IndexedSearchFilter
+from ..services.student_service import StudentService
 
 
 from ..serializers import (
     CustomTokenObtainPairSerializer, 
     UserSerializer
 )
+from backend.pagination import KeysetPagination
 
 User = get_user_model()
 
@@ -46,11 +48,17 @@ def get_user_info(request):
     return Response(serializer.data)
 
 
+class StudentPagination(KeysetPagination):
+    ordering = ('-created_at', '-id')
+
+
 class StudentViewSet(viewsets.ModelViewSet):
     serializer_class = StudentListSerializer
+    pagination_class = StudentPagination
     queryset = User.objects.filter(user_type='student')
-    filter_backends = [filters.SearchFilter]
-    search_fields = ['username', 'email', 'phone_number', 'student_profile__emergency_contact']
+    # 검색: 아이디, 이름, 이메일, 전화번호
+    filter_backends = [IndexedSearchFilter]
+    search_index_fields = {'id': 'user'}
 
     def get_serializer_class(self):
         if self.action == 'create':
@@ -60,33 +68,9 @@ class StudentViewSet(viewsets.ModelViewSet):
         return StudentDetailSerializer
 
     def get_queryset(self):
-        return User.objects.filter(user_type='student').select_related('profile').annotate(
-            active_subscriptions_count=Count(
-                'subscription',
-                filter=Q(subscription__status='active')
-            ),
-            attendance_rate=Avg('attendance__status',
-                filter=Q(attendance__status='present')
-            )
+        return StudentService.annotate_list_metrics(
+            User.objects.filter(user_type='student').select_related('profile')
         )
-        
-        # 출석률 계산 (최근 30일)
-        thirty_days_ago = timezone.now() - timezone.timedelta(days=30)
-        queryset = queryset.annotate(
-            attendance_rate=Avg(
-                Case(
-                    When(
-                        attendance__status='present',
-                        attendance__date__gte=thirty_days_ago,
-                        then=100
-                    ),
-                    default=0,
-                    output_field=FloatField(),
-                )
-            )
-        )
-
-        return queryset
 
     @action(detail=True, methods=['get'])
     def subscriptions(self, request, pk=None):
@@ -1,7 +1,7 @@
 # backend/attendance/admin.py
 
 from django.contrib import admin
-from .models import Attendance, MakeupClass
+from .models import Attendance, MakeupClass, AttendanceDailySummary, AttendanceMonthlyStudent
 
 @admin.register(Attendance)
 class AttendanceAdmin(admin.ModelAdmin):
@@ -36,4 +36,18 @@ class MakeupClassAdmin(admin.ModelAdmin):
         ('상태', {
             'fields': ('status',)
         })
-    )
\ No newline at end of file
+    )
+
+@admin.register(AttendanceDailySummary)
+class AttendanceDailySummaryAdmin(admin.ModelAdmin):
+    list_display = ('date', 'dance_class', 'total_count', 'present_count',
+                    'late_count', 'absent_count', 'excused_count', 'makeup_count')
+    list_filter = ('dance_class',)
+    date_hierarchy = 'date'
+    readonly_fields = ('updated_at',)
+
+@admin.register(AttendanceMonthlyStudent)
+class AttendanceMonthlyStudentAdmin(admin.ModelAdmin):
+    list_display = ('month', 'dance_class', 'student', 'days')
+    list_filter = ('dance_class',)
+    date_hierarchy = 'month'
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.7 on 2026-10-18 20:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, Q
+
+
+def backfill_daily_summary(apps, schema_editor):
+    Attendance = apps.get_model('attendance', 'Attendance')
+    AttendanceDailySummary = apps.get_model('attendance', 'AttendanceDailySummary')
+
+    status_fields = {
+        'present': 'present_count',
+        'late': 'late_count',
+        'absent': 'absent_count',
+        'excused': 'excused_count',
+        'makeup': 'makeup_count',
+    }
+    aggregates = {'total_count': Count('id')}
+    for status, field in status_fields.items():
+        aggregates[field] = Count('id', filter=Q(status=status))
+
+    rows = Attendance.objects.order_by().values('date', 'dance_class_id').annotate(**aggregates)
+    AttendanceDailySummary.objects.bulk_create(
+        (AttendanceDailySummary(**row) for row in rows.iterator()),
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classes', '0003_danceclass_current_students_count'),
+        ('attendance', '0002_alter_attendance_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceDailySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='날짜')),
+                ('total_count', models.PositiveIntegerField(default=0, verbose_name='전체')),
+                ('present_count', models.PositiveIntegerField(default=0, verbose_name='출석')),
+                ('late_count', models.PositiveIntegerField(default=0, verbose_name='지각')),
+                ('absent_count', models.PositiveIntegerField(default=0, verbose_name='결석')),
+                ('excused_count', models.PositiveIntegerField(default=0, verbose_name='사유결석')),
+                ('makeup_count', models.PositiveIntegerField(default=0, verbose_name='보강')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('dance_class', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_summaries', to='classes.danceclass', verbose_name='수업')),
+            ],
+            options={
+                'verbose_name': '일별 출석 집계',
+                'verbose_name_plural': '일별 출석 집계 목록',
+                'db_table': 'attendance_daily_summary',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='attendancedailysummary',
+            constraint=models.UniqueConstraint(fields=('date', 'dance_class'), name='unique_daily_attendance_summary'),
+        ),
+        migrations.RunPython(backfill_daily_summary, migrations.RunPython.noop),
+    ]
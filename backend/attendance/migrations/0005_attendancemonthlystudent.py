@@ -0,0 +1,56 @@
+# Generated by Django 4.2.7 on 2026-10-18 20:44
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_monthly_students(apps, schema_editor):
+    Attendance = apps.get_model('attendance', 'Attendance')
+    AttendanceMonthlyStudent = apps.get_model('attendance', 'AttendanceMonthlyStudent')
+
+    rows = {}
+    for student_id, class_id, date in Attendance.objects.order_by().values_list(
+        'student_id', 'dance_class_id', 'date'
+    ).iterator():
+        key = (date.replace(day=1), class_id, student_id)
+        rows[key] = rows.get(key, 0) | 1 << (date.day - 1)
+
+    AttendanceMonthlyStudent.objects.bulk_create([
+        AttendanceMonthlyStudent(
+            month=month, dance_class_id=class_id, student_id=student_id, days=days
+        )
+        for (month, class_id, student_id), days in rows.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classes', '0003_danceclass_current_students_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('attendance', '0004_attendance_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceMonthlyStudent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(verbose_name='월 (1일)')),
+                ('days', models.PositiveIntegerField(default=0, verbose_name='출결 기록일')),
+                ('dance_class', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_months', to='classes.danceclass', verbose_name='수업')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_months', to=settings.AUTH_USER_MODEL, verbose_name='수강생')),
+            ],
+            options={
+                'verbose_name': '수강생별 월간 출석 집계',
+                'verbose_name_plural': '수강생별 월간 출석 집계 목록',
+                'db_table': 'attendance_monthly_student',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='attendancemonthlystudent',
+            constraint=models.UniqueConstraint(fields=('dance_class', 'month', 'student'), name='unique_monthly_attendance_student'),
+        ),
+        migrations.RunPython(backfill_monthly_students, migrations.RunPython.noop),
+    ]
@@ -51,6 +51,16 @@ class Attendance(models.Model):
                 name='unique_daily_attendance'
             )
         ]
+        indexes = [
+            # 수업 출석부/수업 통계: dance_class + date
+            models.Index(fields=['dance_class', 'date'], name='attendance_class_date_idx'),
+            # 학생 출석 이력/학생 통계: student + date 범위
+            models.Index(fields=['student', 'date'], name='attendance_student_date_idx'),
+            # 상태별 집계 (출석 패턴 분석 등)
+            models.Index(fields=['status', 'date'], name='attendance_status_date_idx'),
+            # 전체 목록 키셋 페이지네이션 (-date, -id)
+            models.Index(fields=['-date', '-id'], name='attendance_date_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.student.username} - {self.dance_class.name} ({self.date})"
@@ -98,4 +108,73 @@ class MakeupClass(models.Model):
         verbose_name_plural = '보강 목록'
 
     def __str__(self):
-        return f"{self.student.username}의 보강 신청 ({self.original_date} → {self.makeup_date})"
\ No newline at end of file
+        return f"{self.student.username}의 보강 신청 ({self.original_date} → {self.makeup_date})"
+
+class AttendanceDailySummary(models.Model):
+    """수업/날짜별 출결 상태 집계 (통계 조회용 롤업 테이블)"""
+
+    date = models.DateField(verbose_name='날짜')
+    dance_class = models.ForeignKey(
+        'classes.DanceClass',
+        on_delete=models.CASCADE,
+        related_name='attendance_summaries',
+        verbose_name='수업'
+    )
+    total_count = models.PositiveIntegerField(default=0, verbose_name='전체')
+    present_count = models.PositiveIntegerField(default=0, verbose_name='출석')
+    late_count = models.PositiveIntegerField(default=0, verbose_name='지각')
+    absent_count = models.PositiveIntegerField(default=0, verbose_name='결석')
+    excused_count = models.PositiveIntegerField(default=0, verbose_name='사유결석')
+    makeup_count = models.PositiveIntegerField(default=0, verbose_name='보강')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'attendance_daily_summary'
+        verbose_name = '일별 출석 집계'
+        verbose_name_plural = '일별 출석 집계 목록'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date', 'dance_class'],
+                name='unique_daily_attendance_summary'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.dance_class_id} ({self.date}): {self.present_count}/{self.total_count}"
+
+class AttendanceMonthlyStudent(models.Model):
+    """
+    수업/수강생/월별 출석일 (기간 내 수강생 수 집계용 롤업 테이블)
+
+    days는 그 달에 출결 기록이 있는 날의 비트(1일 = 1 << 0)라서, 기간 경계에 걸친 달도
+    비트 마스크로 정확히 판별할 수 있다. 행 수는 (수업, 수강생, 월) 단위로 줄어든다.
+    """
+
+    month = models.DateField(verbose_name='월 (1일)')
+    dance_class = models.ForeignKey(
+        'classes.DanceClass',
+        on_delete=models.CASCADE,
+        related_name='attendance_months',
+        verbose_name='수업'
+    )
+    student = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='attendance_months',
+        verbose_name='수강생'
+    )
+    days = models.PositiveIntegerField(default=0, verbose_name='출결 기록일')
+
+    class Meta:
+        db_table = 'attendance_monthly_student'
+        verbose_name = '수강생별 월간 출석 집계'
+        verbose_name_plural = '수강생별 월간 출석 집계 목록'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['dance_class', 'month', 'student'],
+                name='unique_monthly_attendance_student'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.dance_class_id}/{self.student_id} ({self.month:%Y-%m})"
@@ -0,0 +1,168 @@
+# backend/attendance/services/bulk_service.py
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from classes.models import DanceClass, ClassSchedule
+from ..models import Attendance
+from .rollup_service import AttendanceRollupService
+
+User = get_user_model()
+
+UPSERT_FIELDS = ['schedule', 'status', 'memo', 'updated_at']
+
+
+class AttendanceBulkUpsertService:
+    @staticmethod
+    def _parse_row(data):
+        """요청 한 건을 (키, 값) 형태로 변환. 형식 오류 시 ValueError"""
+        if not isinstance(data, dict):
+            raise ValueError('출석 데이터 형식이 올바르지 않습니다.')
+
+        missing = [key for key in ('student', 'dance_class', 'schedule', 'date') if data.get(key) in (None, '')]
+        if missing:
+            raise ValueError(f"필수 항목이 누락되었습니다: {', '.join(missing)}")
+
+        try:
+            student_id = int(data['student'])
+            class_id = int(data['dance_class'])
+            schedule_id = int(data['schedule'])
+        except (TypeError, ValueError):
+            raise ValueError('수강생/수업/일정 ID는 정수여야 합니다.')
+
+        try:
+            date = parse_date(str(data['date']))
+        except ValueError:
+            date = None
+        if date is None:
+            raise ValueError('날짜 형식이 올바르지 않습니다.')
+
+        status = data.get('status', 'absent')
+        if status not in dict(Attendance.STATUS_CHOICES):
+            raise ValueError(f'올바르지 않은 출결 상태입니다: {status}')
+
+        return (student_id, class_id, date), {
+            'schedule_id': schedule_id,
+            'status': status,
+            'memo': data.get('memo', '') or '',
+        }
+
+    @staticmethod
+    def _existing_queryset(keys):
+        """키 목록을 포함하는 기존 출석 기록 (키 단위 필터는 호출 측에서 수행)"""
+        return Attendance.objects.filter(
+            student_id__in={key[0] for key in keys},
+            dance_class_id__in={key[1] for key in keys},
+            date__in={key[2] for key in keys},
+        )
+
+    @staticmethod
+    def upsert(rows):
+        """
+        출석 데이터 일괄 생성/업데이트
+
+        전체 요청을 먼저 검증한 뒤 기존 기록을 한 번에 조회하고,
+        하나의 트랜잭션 안에서 bulk_create/bulk_update로 저장한다.
+        반환값: (created, updated, errors)
+        """
+        errors = []
+        valid = {}
+
+        for data in rows:
+            try:
+                key, values = AttendanceBulkUpsertService._parse_row(data)
+            except ValueError as e:
+                errors.append({'data': data, 'error': str(e)})
+                continue
+            # 같은 키가 여러 번 들어오면 마지막 값이 반영된다
+            valid[key] = (data, values)
+
+        if not valid:
+            return [], [], errors
+
+        # 참조 대상 존재 여부를 한 번에 확인
+        student_ids = set(User.objects.filter(
+            id__in={key[0] for key in valid},
+            user_type='student'
+        ).values_list('id', flat=True))
+        class_ids = set(DanceClass.objects.filter(
+            id__in={key[1] for key in valid}
+        ).values_list('id', flat=True))
+        schedule_classes = dict(ClassSchedule.objects.filter(
+            id__in={values['schedule_id'] for _, values in valid.values()}
+        ).values_list('id', 'dance_class_id'))
+
+        for key, (data, values) in list(valid.items()):
+            student_id, class_id, _ = key
+            error = None
+            if student_id not in student_ids:
+                error = f'존재하지 않는 수강생입니다: {student_id}'
+            elif class_id not in class_ids:
+                error = f'존재하지 않는 수업입니다: {class_id}'
+            elif schedule_classes.get(values['schedule_id']) != class_id:
+                error = f"해당 수업의 일정이 아닙니다: {values['schedule_id']}"
+            if error:
+                errors.append({'data': data, 'error': error})
+                del valid[key]
+
+        if not valid:
+            return [], [], errors
+
+        with transaction.atomic():
+            existing = {
+                (attendance.student_id, attendance.dance_class_id, attendance.date): attendance
+                for attendance in AttendanceBulkUpsertService._existing_queryset(valid).select_for_update()
+            }
+
+            to_update = []
+            to_create = []
+            for key, (_, values) in valid.items():
+                attendance = existing.get(key)
+                if attendance is None:
+                    attendance = Attendance(
+                        student_id=key[0],
+                        dance_class_id=key[1],
+                        date=key[2],
+                    )
+                    to_create.append(attendance)
+                else:
+                    to_update.append(attendance)
+                for field, value in values.items():
+                    setattr(attendance, field, value)
+
+            if to_update:
+                # auto_now 필드는 bulk_update에서 자동 갱신되지 않는다
+                now = timezone.now()
+                for attendance in to_update:
+                    attendance.updated_at = now
+                Attendance.objects.bulk_update(to_update, UPSERT_FIELDS)
+            if to_create:
+                # 조회와 저장 사이에 다른 요청이 같은 키를 저장한 경우에도 충돌 없이 갱신
+                Attendance.objects.bulk_create(
+                    to_create,
+                    update_conflicts=True,
+                    unique_fields=['student', 'dance_class', 'date'],
+                    update_fields=UPSERT_FIELDS,
+                )
+
+            # bulk 작업은 signal을 발생시키지 않으므로 집계 테이블을 직접 갱신
+            AttendanceRollupService.refresh(
+                {(date, class_id, student_id) for student_id, class_id, date in valid}
+            )
+
+        # 응답 직렬화를 위해 저장된 기록을 관련 객체와 함께 한 번에 다시 조회
+        created = []
+        updated = []
+        saved = AttendanceBulkUpsertService._existing_queryset(valid).select_related(
+            'student', 'dance_class', 'schedule'
+        )
+        for attendance in saved:
+            key = (attendance.student_id, attendance.dance_class_id, attendance.date)
+            if key not in valid:
+                continue
+            if key in existing:
+                updated.append(attendance)
+            else:
+                created.append(attendance)
+
+        return created, updated, errors
@@ -0,0 +1,240 @@
+# backend/attendance/services/rollup_service.py
+from calendar import monthrange
+
+from django.db import transaction
+from django.db.models import Avg, Case, Count, F, FloatField, Q, Value, When
+from ..models import Attendance, AttendanceDailySummary, AttendanceMonthlyStudent
+
+STATUS_COUNT_FIELDS = {
+    'present': 'present_count',
+    'late': 'late_count',
+    'absent': 'absent_count',
+    'excused': 'excused_count',
+    'makeup': 'makeup_count',
+}
+SUMMARY_FIELDS = ['total_count', *STATUS_COUNT_FIELDS.values(), 'updated_at']
+
+
+def summary_aggregates():
+    """출석 기록을 상태별 집계 컬럼으로 변환하는 annotate 인자"""
+    aggregates = {'total_count': Count('id')}
+    for status, field in STATUS_COUNT_FIELDS.items():
+        aggregates[field] = Count('id', filter=Q(status=status))
+    return aggregates
+
+
+def attendance_rate(present, late, absent):
+    """출석률 (출석+지각) / (출석+지각+결석). 사유결석/보강은 제외"""
+    denominator = present + late + absent
+    if not denominator:
+        return None
+    return (present + late) / denominator * 100
+
+
+def attendance_rate_aggregate():
+    """attendance_rate와 같은 정의의 출결 기록 집계식. 대상 기록이 없으면 NULL"""
+    return Avg(
+        Case(
+            When(status__in=['present', 'late'], then=Value(100.0)),
+            default=Value(0.0),
+            output_field=FloatField()
+        ),
+        filter=Q(status__in=['present', 'late', 'absent'])
+    )
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def month_end(day):
+    return day.replace(day=monthrange(day.year, day.month)[1])
+
+
+def day_mask(first_day, last_day):
+    """first_day~last_day일(같은 달) 비트"""
+    return ((1 << last_day) - 1) ^ ((1 << (first_day - 1)) - 1)
+
+
+def students_in_period(queryset, start_date=None, end_date=None):
+    """
+    AttendanceMonthlyStudent queryset을 기간 내 출결 기록이 있는 행으로 한정
+
+    기간 안에 완전히 포함된 달은 행만으로, 경계에 걸친 달은 출결일 비트로 판별한다.
+    """
+    if start_date and end_date and start_date > end_date:
+        return queryset.none()
+    if not start_date and not end_date:
+        return queryset
+
+    start_month = month_start(start_date) if start_date else None
+    end_month = month_start(end_date) if end_date else None
+
+    if start_month and start_month == end_month:
+        return queryset.annotate(
+            period_days=F('days').bitand(day_mask(start_date.day, end_date.day))
+        ).filter(month=start_month, period_days__gt=0)
+
+    inner = Q()
+    condition = Q(pk__in=[])
+    if start_month:
+        inner &= Q(month__gt=start_month)
+        queryset = queryset.annotate(
+            start_days=F('days').bitand(day_mask(start_date.day, month_end(start_date).day))
+        )
+        condition |= Q(month=start_month, start_days__gt=0)
+    if end_month:
+        inner &= Q(month__lt=end_month)
+        queryset = queryset.annotate(end_days=F('days').bitand(day_mask(1, end_date.day)))
+        condition |= Q(month=end_month, end_days__gt=0)
+    return queryset.filter(condition | inner)
+
+
+class AttendanceRollupService:
+    @staticmethod
+    def refresh(keys):
+        """
+        (date, dance_class_id, student_id) 단위로 집계 행을 다시 계산
+
+        출석 기록이 저장/삭제될 때 영향을 받은 키만 원본에서 재집계한다.
+        일별 집계는 (date, dance_class_id), 월간 집계는 해당 수강생 행만 갱신한다.
+        """
+        keys = set(keys)
+        if not keys:
+            return
+
+        with transaction.atomic():
+            AttendanceRollupService.refresh_days(
+                {(date, class_id) for date, class_id, _ in keys}
+            )
+            AttendanceRollupService.refresh_months(
+                {(month_start(date), class_id, student_id) for date, class_id, student_id in keys}
+            )
+
+    @staticmethod
+    def refresh_days(keys):
+        """(date, dance_class_id) 단위로 일별 집계 행을 다시 계산"""
+        query = Q()
+        for date, class_id in keys:
+            query |= Q(date=date, dance_class_id=class_id)
+
+        rows = Attendance.objects.filter(query).order_by().values(
+            'date', 'dance_class_id'
+        ).annotate(**summary_aggregates())
+
+        summaries = [AttendanceDailySummary(**row) for row in rows]
+        if summaries:
+            AttendanceDailySummary.objects.bulk_create(
+                summaries,
+                update_conflicts=True,
+                unique_fields=['date', 'dance_class'],
+                update_fields=SUMMARY_FIELDS,
+            )
+
+        # 기록이 모두 삭제된 키는 집계 행도 제거
+        remaining = {(summary.date, summary.dance_class_id) for summary in summaries}
+        empty_query = Q()
+        for date, class_id in keys - remaining:
+            empty_query |= Q(date=date, dance_class_id=class_id)
+        if empty_query:
+            AttendanceDailySummary.objects.filter(empty_query).delete()
+
+    @staticmethod
+    def refresh_months(keys):
+        """(월, dance_class_id, student_id) 단위로 수강생별 월간 집계를 원본에서 다시 계산"""
+        query = Q()
+        for month, class_id, student_id in keys:
+            query |= Q(
+                dance_class_id=class_id, student_id=student_id,
+                date__range=(month, month_end(month))
+            )
+
+        rows = {}
+        for student_id, class_id, date in Attendance.objects.filter(query).order_by().values_list(
+            'student_id', 'dance_class_id', 'date'
+        ):
+            key = (month_start(date), class_id, student_id)
+            rows[key] = rows.get(key, 0) | 1 << (date.day - 1)
+
+        if rows:
+            AttendanceMonthlyStudent.objects.bulk_create(
+                [
+                    AttendanceMonthlyStudent(
+                        month=month, dance_class_id=class_id, student_id=student_id, days=days
+                    )
+                    for (month, class_id, student_id), days in rows.items()
+                ],
+                update_conflicts=True,
+                unique_fields=['dance_class', 'month', 'student'],
+                update_fields=['days'],
+            )
+
+        # 그 달의 기록이 모두 삭제된 수강생은 월간 행도 제거
+        empty_query = Q()
+        for month, class_id, student_id in keys - rows.keys():
+            empty_query |= Q(month=month, dance_class_id=class_id, student_id=student_id)
+        if empty_query:
+            AttendanceMonthlyStudent.objects.filter(empty_query).delete()
+
+    @staticmethod
+    def rebuild(start_date=None, end_date=None, batch_size=1000):
+        """기간 내 집계 테이블 전체 재생성. 생성된 집계 행 수 반환"""
+        attendance = Attendance.objects.all()
+        summaries = AttendanceDailySummary.objects.all()
+        if start_date:
+            attendance = attendance.filter(date__gte=start_date)
+            summaries = summaries.filter(date__gte=start_date)
+        if end_date:
+            attendance = attendance.filter(date__lte=end_date)
+            summaries = summaries.filter(date__lte=end_date)
+
+        summaries.delete()
+
+        rows = attendance.order_by().values(
+            'date', 'dance_class_id'
+        ).annotate(**summary_aggregates())
+
+        created = 0
+        batch = []
+        for row in rows.iterator(chunk_size=batch_size):
+            batch.append(AttendanceDailySummary(**row))
+            if len(batch) >= batch_size:
+                AttendanceDailySummary.objects.bulk_create(batch)
+                created += len(batch)
+                batch = []
+        if batch:
+            AttendanceDailySummary.objects.bulk_create(batch)
+            created += len(batch)
+
+        AttendanceRollupService.rebuild_months(start_date, end_date, batch_size)
+
+        return created
+
+    @staticmethod
+    def rebuild_months(start_date=None, end_date=None, batch_size=1000):
+        """기간에 걸친 달 전체의 수강생별 월간 집계 재생성"""
+        attendance = Attendance.objects.all()
+        months = AttendanceMonthlyStudent.objects.all()
+        if start_date:
+            attendance = attendance.filter(date__gte=month_start(start_date))
+            months = months.filter(month__gte=month_start(start_date))
+        if end_date:
+            attendance = attendance.filter(date__lte=month_end(end_date))
+            months = months.filter(month__lte=month_start(end_date))
+
+        months.delete()
+
+        rows = {}
+        for student_id, class_id, date in attendance.order_by().values_list(
+            'student_id', 'dance_class_id', 'date'
+        ).iterator(chunk_size=batch_size):
+            key = (month_start(date), class_id, student_id)
+            rows[key] = rows.get(key, 0) | 1 << (date.day - 1)
+
+        AttendanceMonthlyStudent.objects.bulk_create([
+            AttendanceMonthlyStudent(
+                month=month, dance_class_id=class_id, student_id=student_id, days=days
+            )
+            for (month, class_id, student_id), days in rows.items()
+        ], batch_size=batch_size)
+        return len(rows)
@@ -1,9 +1,21 @@
 # backend/attendance/services/stats_service.py
-from django.db.models import Count, F, FloatField, Avg, Q, Case, When
-from django.db.models.functions import TruncDate
-from django.utils import timezone
-from datetime import timedelta
-from ..models import Attendance
+from django.db.models import Count, Q, Sum
+from ..models import Attendance, AttendanceDailySummary, AttendanceMonthlyStudent
+from backend.async_db import fetch_aggregate, fetch_count, fetch_list, gather_queries
+from .rollup_service import attendance_rate, students_in_period
+
+# 수업/강사 통계는 일별 집계 테이블(AttendanceDailySummary)에서 조회하고,
+# 기간 내 수강생 수는 수강생별 월간 집계(AttendanceMonthlyStudent)에서 센다.
+# 학생 통계는 (학생, 수업, 날짜)가 곧 원본의 유일 키라 학생 단위 롤업이
+# 원본과 같은 크기가 되므로, student_id로 한정된 원본 기록을 그대로 집계한다.
+
+SUMMARY_SUMS = {
+    'total_count': Sum('total_count'),
+    'present_count': Sum('present_count'),
+    'late_count': Sum('late_count'),
+    'absent_count': Sum('absent_count'),
+}
+
 
 class AttendanceStatsService:
     @staticmethod
@@ -16,7 +28,8 @@ class AttendanceStatsService:
         if end_date:
             query = query.filter(date__lte=end_date)
             
-        stats = await query.aggregate(
+        stats = await fetch_aggregate(
+            query,
             total_classes=Count('id'),
             present_count=Count('id', filter=Q(status='present')),
             late_count=Count('id', filter=Q(status='late')),
@@ -39,40 +52,44 @@ class AttendanceStatsService:
     @staticmethod
     async def get_class_attendance_stats(class_id, start_date=None, end_date=None):
         """수업별 출석 통계"""
-        query = Attendance.objects.filter(dance_class_id=class_id)
-        
+        summaries = AttendanceDailySummary.objects.filter(dance_class_id=class_id)
+        students = students_in_period(
+            AttendanceMonthlyStudent.objects.filter(dance_class_id=class_id),
+            start_date, end_date
+        )
+
         if start_date:
-            query = query.filter(date__gte=start_date)
+            summaries = summaries.filter(date__gte=start_date)
         if end_date:
-            query = query.filter(date__lte=end_date)
-            
-        daily_stats = await query.values('date').annotate(
-            total_students=Count('student_id'),
-            present_count=Count('id', filter=Q(status='present')),
-            late_count=Count('id', filter=Q(status='late')),
-            absent_count=Count('id', filter=Q(status='absent')),
-            attendance_rate=Avg(
-                Case(
-                    When(Q(status='present') | Q(status='late'), then=100),
-                    When(status='absent', then=0),
-                    output_field=FloatField(),
-                )
-            )
-        ).order_by('date')
-        
-        # 전체 통계
-        overall_stats = await query.aggregate(
-            total_classes=Count('date', distinct=True),
-            total_students=Count('student_id', distinct=True),
-            average_attendance=Avg(
-                Case(
-                    When(Q(status='present') | Q(status='late'), then=100),
-                    When(status='absent', then=0),
-                    output_field=FloatField(),
-                )
-            )
+            summaries = summaries.filter(date__lte=end_date)
+
+        summaries, total_students = await gather_queries(
+            fetch_list(summaries.order_by('date')),
+            fetch_count(students.order_by().values('student_id').distinct())
         )
-        
+
+        daily_stats = [{
+            'date': summary.date,
+            'total_students': summary.total_count,
+            'present_count': summary.present_count,
+            'late_count': summary.late_count,
+            'absent_count': summary.absent_count,
+            'attendance_rate': attendance_rate(
+                summary.present_count, summary.late_count, summary.absent_count
+            ),
+        } for summary in summaries]
+
+        # 전체 통계
+        overall_stats = {
+            'total_classes': len(daily_stats),
+            'total_students': total_students,
+            'average_attendance': attendance_rate(
+                sum(row['present_count'] for row in daily_stats),
+                sum(row['late_count'] for row in daily_stats),
+                sum(row['absent_count'] for row in daily_stats),
+            ),
+        }
+
         return {
             'daily_stats': daily_stats,
             'overall_stats': overall_stats
@@ -81,27 +98,41 @@ class AttendanceStatsService:
     @staticmethod
     async def get_instructor_attendance_stats(instructor_id, start_date=None, end_date=None):
         """강사별 수업 출석 통계"""
-        query = Attendance.objects.filter(
+        summaries = AttendanceDailySummary.objects.filter(
             dance_class__instructor_id=instructor_id
         )
-        
+        students = students_in_period(
+            AttendanceMonthlyStudent.objects.filter(dance_class__instructor_id=instructor_id),
+            start_date, end_date
+        )
+
         if start_date:
-            query = query.filter(date__gte=start_date)
+            summaries = summaries.filter(date__gte=start_date)
         if end_date:
-            query = query.filter(date__lte=end_date)
-            
-        class_stats = await query.values(
-            'dance_class__name'
-        ).annotate(
-            total_classes=Count('date', distinct=True),
-            total_students=Count('student_id', distinct=True),
-            average_attendance=Avg(
-                Case(
-                    When(Q(status='present') | Q(status='late'), then=100),
-                    When(status='absent', then=0),
-                    output_field=FloatField(),
-                )
-            )
-        ).order_by('-average_attendance')
-        
-        return class_stats
\ No newline at end of file
+            summaries = summaries.filter(date__lte=end_date)
+
+        student_counts, class_rows = await gather_queries(
+            fetch_list(students.order_by().values('dance_class_id').annotate(
+                total_students=Count('student_id', distinct=True)
+            )),
+            fetch_list(summaries.order_by().values(
+                'dance_class_id', 'dance_class__name'
+            ).annotate(total_classes=Count('id'), **SUMMARY_SUMS))
+        )
+        student_counts = {
+            row['dance_class_id']: row['total_students'] for row in student_counts
+        }
+
+        class_stats = [{
+            'dance_class__name': row['dance_class__name'],
+            'total_classes': row['total_classes'],
+            'total_students': student_counts.get(row['dance_class_id'], 0),
+            'average_attendance': attendance_rate(
+                row['present_count'], row['late_count'], row['absent_count']
+            ),
+        } for row in class_rows]
+
+        class_stats.sort(
+            key=lambda row: (row['average_attendance'] is None, -(row['average_attendance'] or 0))
+        )
+        return class_stats
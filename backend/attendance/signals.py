@@ -0,0 +1,31 @@
+# backend/attendance/signals.py
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from .models import Attendance
+from .services.rollup_service import AttendanceRollupService
+
+
+@receiver(pre_save, sender=Attendance)
+def remember_previous_summary_key(sender, instance, **kwargs):
+    """날짜/수업/수강생이 변경되면 이전 집계 행도 다시 계산해야 하므로 기록"""
+    instance._previous_summary_key = None
+    if instance.pk:
+        instance._previous_summary_key = Attendance.objects.filter(
+            pk=instance.pk
+        ).values_list('date', 'dance_class_id', 'student_id').first()
+
+
+@receiver(post_save, sender=Attendance)
+def refresh_summary_on_save(sender, instance, **kwargs):
+    keys = {(instance.date, instance.dance_class_id, instance.student_id)}
+    previous = getattr(instance, '_previous_summary_key', None)
+    if previous:
+        keys.add(previous)
+    AttendanceRollupService.refresh(keys)
+
+
+@receiver(post_delete, sender=Attendance)
+def refresh_summary_on_delete(sender, instance, **kwargs):
+    AttendanceRollupService.refresh(
+        {(instance.date, instance.dance_class_id, instance.student_id)}
+    )
@@ -1,3 +1,388 @@
+from datetime import date, time
+from io import StringIO
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count, Q
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+from rest_framework.throttling import UserRateThrottle
+
+from backend.async_views import AsyncAPIView
+from backend.testing import QueryPlanAssertionsMixin
+from classes.models import ClassSchedule, DanceClass
+from .models import Attendance, AttendanceDailySummary, AttendanceMonthlyStudent
+from .services.rollup_service import attendance_rate
+from .services.stats_service import AttendanceStatsService
+from .views import AttendanceViewSet
+
+User = get_user_model()
+
+
+class AttendanceIndexUsageTest(QueryPlanAssertionsMixin, TestCase):
+    def _list_queryset(self, **params):
+        view = AttendanceViewSet()
+        view.request = Request(APIRequestFactory().get('/api/attendance/', params))
+        return view.get_queryset()
+
+    def test_class_attendance_sheet_uses_class_date_index(self):
+        queryset = self._list_queryset(class_id=1, date='2024-01-01')
+        self.assertUsesIndex(queryset, 'attendance_class_date_idx')
+
+    def test_rollup_refresh_uses_class_date_index(self):
+        queryset = Attendance.objects.filter(dance_class_id=1, date=date(2024, 1, 1))
+        self.assertUsesIndex(queryset, 'attendance_class_date_idx')
+
+    def test_student_history_uses_student_date_index(self):
+        queryset = Attendance.objects.filter(student_id=1, date__gte=date(2024, 1, 1))
+        self.assertUsesIndex(queryset, 'attendance_student_date_idx')
+
+    def test_list_ordering_uses_date_id_index(self):
+        queryset = Attendance.objects.order_by('-date', '-id')[:10]
+        self.assertUsesIndex(queryset, 'attendance_date_id_idx')
+
+
+class AttendanceBulkUpsertTest(TestCase):
+    def setUp(self):
+        instructor = User.objects.create(username='instructor', user_type='instructor')
+        self.dance_class = DanceClass.objects.create(name='class', instructor=instructor, capacity=50)
+        self.schedule = ClassSchedule.objects.create(
+            dance_class=self.dance_class, weekday=0,
+            start_time=time(18), end_time=time(19), room='A'
+        )
+        self.students = [
+            User.objects.create(username=f'student{i}', user_type='student')
+            for i in range(8)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(instructor)
+
+    def _row(self, student, day, status='present', **overrides):
+        return {
+            'student': student.id,
+            'dance_class': self.dance_class.id,
+            'schedule': self.schedule.id,
+            'date': day.isoformat(),
+            'status': status,
+            **overrides,
+        }
+
+    def _post(self, rows):
+        response = self.client.post('/api/attendance/bulk_create/', rows, format='json')
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_mixed_batch_creates_updates_and_reports_errors(self):
+        day = date(2024, 1, 1)
+        Attendance.objects.create(
+            student=self.students[0], dance_class=self.dance_class,
+            schedule=self.schedule, date=day, status='absent'
+        )
+        invalid_status = self._row(self.students[2], day, status='sleeping')
+        missing_date = self._row(self.students[3], day, date='')
+        not_student = self._row(self.dance_class.instructor, day)
+
+        data = self._post([
+            self._row(self.students[0], day, status='late', memo='지각'),
+            self._row(self.students[1], day),
+            invalid_status,
+            missing_date,
+            not_student,
+        ])
+
+        self.assertEqual([row['student'] for row in data['created']], [self.students[1].id])
+        self.assertEqual([row['status'] for row in data['updated']], ['late'])
+        self.assertEqual(Attendance.objects.get(student=self.students[0]).memo, '지각')
+        # 오류 항목은 원본 요청과 메시지만 담는다
+        self.assertEqual(
+            [error['data'] for error in data['errors']],
+            [invalid_status, missing_date, not_student]
+        )
+        for error in data['errors']:
+            self.assertEqual(set(error), {'data', 'error'})
+            self.assertIsInstance(error['error'], str)
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        def count_queries(rows):
+            with CaptureQueriesContext(connection) as queries:
+                self._post(rows)
+            return len(queries)
+
+        existing_day, new_day = date(2024, 1, 1), date(2024, 1, 8)
+        for student in self.students:
+            Attendance.objects.create(
+                student=student, dance_class=self.dance_class,
+                schedule=self.schedule, date=existing_day, status='absent'
+            )
+
+        small = count_queries([
+            self._row(self.students[0], existing_day),
+            self._row(self.students[0], new_day),
+        ])
+        large = count_queries(
+            [self._row(student, existing_day, status='late') for student in self.students[1:]]
+            + [self._row(student, new_day) for student in self.students[1:]]
+        )
+        self.assertEqual(small, large)
+
+
+class AttendanceRollupStatsTest(TestCase):
+    """집계 테이블로 계산한 통계가 원본 출석 기록으로 계산한 값과 같은지 확인"""
+
+    PERIODS = [
+        (None, None),
+        (date(2024, 1, 31), date(2024, 2, 14)),
+        (date(2024, 2, 1), date(2024, 2, 29)),
+        (date(2024, 1, 15), date(2024, 3, 1)),
+        (date(2024, 2, 10), None),
+        (None, date(2024, 2, 2)),
+    ]
+
+    def setUp(self):
+        self.instructor = User.objects.create(username='instructor', user_type='instructor')
+        self.classes = [
+            DanceClass.objects.create(name=f'class{i}', instructor=self.instructor, capacity=50)
+            for i in range(2)
+        ]
+        self.schedules = [
+            ClassSchedule.objects.create(
+                dance_class=dance_class, weekday=0,
+                start_time=time(18), end_time=time(19), room=f'room{i}'
+            )
+            for i, dance_class in enumerate(self.classes)
+        ]
+        self.students = [
+            User.objects.create(username=f'student{i}', user_type='student') for i in range(4)
+        ]
+        rows = [
+            (0, 0, date(2024, 1, 30), 'present'),
+            (0, 1, date(2024, 1, 30), 'absent'),
+            (0, 0, date(2024, 2, 2), 'late'),
+            (0, 2, date(2024, 2, 15), 'present'),
+            (0, 3, date(2024, 3, 1), 'absent'),
+            (1, 1, date(2024, 2, 2), 'present'),
+            (1, 3, date(2024, 2, 29), 'excused'),
+        ]
+        self.attendance = [
+            Attendance.objects.create(
+                dance_class=self.classes[class_index],
+                schedule=self.schedules[class_index],
+                student=self.students[student_index],
+                date=day, status=status
+            )
+            for class_index, student_index, day, status in rows
+        ]
+
+    def _raw(self, queryset, start_date, end_date):
+        if start_date:
+            queryset = queryset.filter(date__gte=start_date)
+        if end_date:
+            queryset = queryset.filter(date__lte=end_date)
+        return queryset
+
+    def _raw_class_stats(self, dance_class, start_date, end_date):
+        attendance = self._raw(Attendance.objects.filter(dance_class=dance_class), start_date, end_date)
+        daily = attendance.order_by('date').values('date').annotate(
+            total=Count('id'),
+            present=Count('id', filter=Q(status='present')),
+            late=Count('id', filter=Q(status='late')),
+            absent=Count('id', filter=Q(status='absent')),
+        )
+        return {
+            'daily': [
+                (row['date'], row['total'], row['present'], row['late'], row['absent'])
+                for row in daily
+            ],
+            'total_students': attendance.values('student_id').distinct().count(),
+            'average_attendance': attendance_rate(
+                attendance.filter(status='present').count(),
+                attendance.filter(status='late').count(),
+                attendance.filter(status='absent').count(),
+            ),
+        }
+
+    def _class_stats(self, dance_class, start_date, end_date):
+        stats = async_to_sync(AttendanceStatsService.get_class_attendance_stats)(
+            dance_class.id, start_date, end_date
+        )
+        return {
+            'daily': [
+                (row['date'], row['total_students'], row['present_count'],
+                 row['late_count'], row['absent_count'])
+                for row in stats['daily_stats']
+            ],
+            'total_students': stats['overall_stats']['total_students'],
+            'average_attendance': stats['overall_stats']['average_attendance'],
+        }
+
+    def _instructor_student_counts(self, start_date, end_date):
+        stats = async_to_sync(AttendanceStatsService.get_instructor_attendance_stats)(
+            self.instructor.id, start_date, end_date
+        )
+        return {row['dance_class__name']: row['total_students'] for row in stats}
+
+    def _raw_instructor_student_counts(self, start_date, end_date):
+        return {
+            dance_class.name: self._raw(
+                Attendance.objects.filter(dance_class=dance_class), start_date, end_date
+            ).values('student_id').distinct().count()
+            for dance_class in self.classes
+            if self._raw(Attendance.objects.filter(dance_class=dance_class), start_date, end_date).exists()
+        }
+
+    def assertMatchesRaw(self):
+        for start_date, end_date in self.PERIODS:
+            with self.subTest(start_date=start_date, end_date=end_date):
+                for dance_class in self.classes:
+                    self.assertEqual(
+                        self._class_stats(dance_class, start_date, end_date),
+                        self._raw_class_stats(dance_class, start_date, end_date)
+                    )
+                self.assertEqual(
+                    self._instructor_student_counts(start_date, end_date),
+                    self._raw_instructor_student_counts(start_date, end_date)
+                )
+
+    def test_stats_match_raw_attendance(self):
+        self.assertMatchesRaw()
+
+    def test_stats_follow_update_and_delete(self):
+        moved = self.attendance[0]
+        moved.date = date(2024, 2, 20)
+        moved.student = self.students[3]
+        moved.status = 'absent'
+        moved.save()
+        self.attendance[3].delete()
+        self.assertMatchesRaw()
+
+    def test_save_refreshes_only_the_saved_students_month(self):
+        january = date(2024, 1, 1)
+        months = AttendanceMonthlyStudent.objects.filter(month=january, dance_class=self.classes[0])
+        # 다른 수강생의 행은 건드리지 않는다
+        months.filter(student=self.students[1]).update(days=0)
+        # 동시에 다른 저장이 먼저 넣은 행이 있어도 충돌 없이 갱신된다
+        AttendanceMonthlyStudent.objects.create(
+            month=january, dance_class=self.classes[0], student=self.students[2], days=0
+        )
+
+        Attendance.objects.create(
+            dance_class=self.classes[0], schedule=self.schedules[0],
+            student=self.students[2], date=date(2024, 1, 3), status='present'
+        )
+
+        self.assertEqual(
+            dict(months.values_list('student__username', 'days')),
+            {'student0': 1 << 29, 'student1': 0, 'student2': 1 << 2}
+        )
+
+    def test_rebuild_command_restores_rollups(self):
+        AttendanceDailySummary.objects.all().delete()
+        AttendanceMonthlyStudent.objects.all().delete()
+        call_command('rebuild_attendance_summary', stdout=StringIO())
+        self.assertMatchesRaw()
+
+        # 기간을 지정하면 걸친 달 전체를 다시 만든다
+        AttendanceMonthlyStudent.objects.filter(month=date(2024, 2, 1)).delete()
+        call_command(
+            'rebuild_attendance_summary', '--start-date', '2024-02-10',
+            '--end-date', '2024-02-12', stdout=StringIO()
+        )
+        self.assertMatchesRaw()
+
+
+class AttendanceStatsViewTest(TestCase):
+    """비동기 통계 뷰가 동기 뷰와 같은 인증/권한/응답 규칙을 따르는지 확인"""
+
+    def setUp(self):
+        self.instructor = User.objects.create(username='instructor', user_type='instructor')
+        self.dance_class = DanceClass.objects.create(
+            name='class', instructor=self.instructor, capacity=10
+        )
+        schedule = ClassSchedule.objects.create(
+            dance_class=self.dance_class, weekday=0,
+            start_time=time(18), end_time=time(19), room='room'
+        )
+        student = User.objects.create(username='student', user_type='student')
+        Attendance.objects.create(
+            dance_class=self.dance_class, schedule=schedule, student=student,
+            date=date(2024, 2, 5), status='present'
+        )
+        self.client = APIClient()
+        self.url = f'/api/attendance/stats/class/{self.dance_class.id}/'
+
+    def test_requires_authentication(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+        self.assertIn('detail', response.json())
+
+    def test_returns_stats(self):
+        self.client.force_authenticate(self.instructor)
+        response = self.client.get(self.url, {'start_date': '2024-02-01', 'end_date': '2024-02-29'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['overall_stats']['total_students'], 1)
+
+    def test_invalid_date(self):
+        self.client.force_authenticate(self.instructor)
+        response = self.client.get(self.url, {'start_date': '2024/02/01'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': '날짜 형식이 올바르지 않습니다.'})
+
+    def test_only_get_is_allowed(self):
+        self.client.force_authenticate(self.instructor)
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 405)
+
+    def test_view_policies_are_applied(self):
+        class AdminOnlyThrottledView(AsyncAPIView):
+            permission_classes = [IsAdminUser]
+            throttle_classes = [type('OnePerMinute', (UserRateThrottle,), {'rate': '1/min'})]
+
+            async def get(self, request):
+                return Response({'ok': True})
+
+        view = AdminOnlyThrottledView.as_view()
+        admin = User.objects.create(username='admin', is_staff=True)
+
+        def call(user):
+            request = APIRequestFactory().get('/')
+            force_authenticate(request, user)
+            return async_to_sync(view)(request)
+
+        self.assertEqual(call(self.instructor).status_code, 403)
+        response = call(admin)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.rendered_content, b'{"ok":true}')
+        self.assertEqual(call(admin).status_code, 429)
+
+
+class AttendanceKeysetPaginationTest(TestCase):
+    def test_cursor_round_trip_over_equal_dates(self):
+        instructor = User.objects.create(username='instructor', user_type='instructor')
+        dance_class = DanceClass.objects.create(name='class', instructor=instructor, capacity=10)
+        schedule = ClassSchedule.objects.create(
+            dance_class=dance_class, weekday=0,
+            start_time=time(18), end_time=time(19), room='room'
+        )
+        for i in range(3):
+            student = User.objects.create(username=f'student{i}', user_type='student')
+            for day in (date(2024, 3, 4), date(2024, 3, 11)):
+                Attendance.objects.create(
+                    dance_class=dance_class, schedule=schedule, student=student,
+                    date=day, status='present'
+                )
+        expected = list(Attendance.objects.order_by('-date', '-id').values_list('id', flat=True))
 
-# Create your tests here.
+        client = APIClient()
+        client.force_authenticate(instructor)
+        response = client.get('/api/attendance/', {'pagination': 'cursor', 'page_size': 4})
+        ids = [row['id'] for row in response.json()['results']]
+        while response.json()['next']:
+            response = client.get(response.json()['next'])
+            ids += [row['id'] for row in response.json()['results']]
+        self.assertEqual(ids, expected)
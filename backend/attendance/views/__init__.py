@@ -0,0 +1,2 @@
+# backend/attendance/views/__init__.py
+from .attendance import AttendanceViewSet, MakeupClassViewSet
@@ -1,4 +1,4 @@
-# backend/attendance/views.py
+# backend/attendance/views/attendance.py
 
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
@@ -6,15 +6,27 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.db.models import Q
 from datetime import datetime
-from .models import Attendance, MakeupClass
-from .serializers import (
+from ..models import Attendance, MakeupClass
+from ..serializers import (
     AttendanceSerializer,
     AttendanceCreateSerializer,
     MakeupClassSerializer
 )
+from ..services.bulk_service import AttendanceBulkUpsertService
+from backend.pagination import KeysetPagination
+from search.filters import IndexedSearchFilter
+
+
+class AttendancePagination(KeysetPagination):
+    ordering = ('-date', '-id')
+
 
 class AttendanceViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
+    pagination_class = AttendancePagination
+    # 검색: 수강생 아이디 또는 수업명
+    filter_backends = [IndexedSearchFilter]
+    search_index_fields = {'student_id': 'username', 'dance_class_id': 'class_name'}
     
     def get_serializer_class(self):
         if self.action == 'create':
@@ -39,45 +51,19 @@ class AttendanceViewSet(viewsets.ModelViewSet):
         if student_id:
             queryset = queryset.filter(student_id=student_id)
 
-        # 검색 기능
-        search = self.request.query_params.get('search', None)
-        if search:
-            queryset = queryset.filter(
-                Q(student__username__icontains=search) |
-                Q(dance_class__name__icontains=search)
-            )
-
         return queryset.select_related('student', 'dance_class', 'schedule')
 
     @action(detail=False, methods=['post'])
     def bulk_create(self, request):
         """여러 출석 데이터를 한 번에 생성/업데이트"""
         attendance_data = request.data
-        created = []
-        updated = []
-        errors = []
-
-        for data in attendance_data:
-            try:
-                attendance, created_flag = Attendance.objects.update_or_create(
-                    student_id=data['student'],
-                    dance_class_id=data['dance_class'],
-                    date=data['date'],
-                    defaults={
-                        'schedule_id': data['schedule'],
-                        'status': data.get('status', 'absent'),
-                        'memo': data.get('memo', '')
-                    }
-                )
-                if created_flag:
-                    created.append(attendance)
-                else:
-                    updated.append(attendance)
-            except Exception as e:
-                errors.append({
-                    'data': data,
-                    'error': str(e)
-                })
+        if not isinstance(attendance_data, list):
+            return Response(
+                {'error': '출석 데이터 목록이 필요합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        created, updated, errors = AttendanceBulkUpsertService.upsert(attendance_data)
 
         return Response({
             'created': AttendanceSerializer(created, many=True).data,
@@ -1,14 +1,12 @@
 # backend/attendance/views/stats_views.py
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from backend.async_views import async_api_view
 from ..services.stats_service import AttendanceStatsService
 from django.utils import timezone
 from datetime import datetime
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@async_api_view
 async def student_attendance_stats(request, student_id):
     """학생 출석 통계 조회"""
     try:
@@ -35,8 +33,7 @@ async def student_attendance_stats(request, student_id):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@async_api_view
 async def class_attendance_stats(request, class_id):
     """수업 출석 통계 조회"""
     try:
@@ -63,8 +60,7 @@ async def class_attendance_stats(request, class_id):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@async_api_view
 async def instructor_attendance_stats(request, instructor_id):
     """강사별 수업 출석 통계 조회"""
     try:
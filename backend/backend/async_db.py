@@ -0,0 +1,106 @@
+# backend/backend/async_db.py
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from concurrent.futures import ThreadPoolExecutor
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+# 비동기 뷰/서비스에서 ORM 쿼리를 실행하기 위한 제한된 스레드 풀.
+# Django의 a* ORM 메서드는 모두 하나의 스레드에서 순차 실행되므로,
+# 서로 독립적인 쿼리를 동시에 실행하려면 스레드별 DB 연결을 사용하는 풀이 필요하다.
+
+_executor = None
+
+# 쿼리를 끝내야 하는 시각(time.monotonic 기준). compose_report가 리포트 단위로 설정하며,
+# 제한 시간이 지난 쿼리는 DB가 중단하므로 결과를 버린 쿼리가 워커 스레드를 계속 점유하지 않는다.
+query_deadline = ContextVar('query_deadline', default=None)
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.ASYNC_DB_MAX_WORKERS,
+            thread_name_prefix='async-db'
+        )
+    return _executor
+
+
+@contextmanager
+def statement_timeout(seconds):
+    """
+    현재 스레드의 연결에서 실행되는 쿼리를 seconds초 뒤 DB가 중단하도록 설정
+
+    PostgreSQL은 트랜잭션 범위의 statement_timeout, SQLite는 진행 핸들러로 중단한다.
+    """
+    if seconds is None:
+        yield
+        return
+
+    connection.ensure_connection()
+    if connection.vendor == 'postgresql':
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT set_config('statement_timeout', %s, true)",
+                    [str(max(int(seconds * 1000), 1))]
+                )
+            yield
+    elif connection.vendor == 'sqlite':
+        deadline = time.monotonic() + seconds
+        connection.connection.set_progress_handler(lambda: time.monotonic() > deadline, 1000)
+        try:
+            yield
+        finally:
+            connection.connection.set_progress_handler(None, 1000)
+    else:
+        yield
+
+
+def _run_with_timeout(func, timeout, *args, **kwargs):
+    with statement_timeout(timeout):
+        return func(*args, **kwargs)
+
+
+def _run_with_connection(func, timeout, *args, **kwargs):
+    """워커 스레드에서 실행 후 해당 스레드의 DB 연결을 CONN_MAX_AGE 설정에 따라 정리"""
+    close_old_connections()
+    try:
+        return _run_with_timeout(func, timeout, *args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+async def run_query(func, *args, **kwargs):
+    """동기 ORM 호출을 스레드 풀에서 실행"""
+    deadline = query_deadline.get()
+    timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+
+    if not settings.ASYNC_DB_MAX_WORKERS:
+        # 풀을 끈 경우(테스트 등) 요청 스레드와 같은 연결에서 순차 실행
+        return await sync_to_async(_run_with_timeout)(func, timeout, *args, **kwargs)
+    return await sync_to_async(
+        _run_with_connection,
+        thread_sensitive=False,
+        executor=get_executor()
+    )(func, timeout, *args, **kwargs)
+
+
+async def fetch_list(queryset):
+    return await run_query(list, queryset)
+
+
+async def fetch_aggregate(queryset, **aggregates):
+    return await run_query(queryset.aggregate, **aggregates)
+
+
+async def fetch_count(queryset):
+    return await run_query(queryset.count)
+
+
+async def gather_queries(*coroutines):
+    """서로 독립적인 쿼리들을 동시에 실행하고 순서대로 결과 반환"""
+    return await asyncio.gather(*coroutines)
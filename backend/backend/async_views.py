@@ -0,0 +1,57 @@
+# backend/backend/async_views.py
+import asyncio
+from asgiref.sync import sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    async 핸들러를 실행하는 APIView
+
+    DRF의 APIView.dispatch는 핸들러를 동기로 호출하므로, 같은 단계(initialize_request,
+    initial, handle_exception, finalize_response)를 거치되 핸들러만 await 한다.
+    인증/권한/스로틀/콘텐츠 협상과 예외 응답, 렌더러는 동기 뷰와 같은 설정을 따른다.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            # 인증 클래스와 스로틀이 DB/캐시를 조회하므로 동기 컨텍스트에서 실행
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+def async_api_view(view_func):
+    """
+    비동기 조회(GET) API 뷰 데코레이터
+
+    DRF의 @api_view는 async 함수를 지원하지 않으므로 AsyncAPIView의 GET 핸들러로 감싼다.
+    ASGI에서는 리포트 쿼리를 기다리는 동안 워커를 점유하지 않는다.
+    """
+    async def get(self, request, *args, **kwargs):
+        return await view_func(request, *args, **kwargs)
+
+    view_class = type(view_func.__name__, (AsyncAPIView,), {
+        '__module__': view_func.__module__,
+        '__doc__': view_func.__doc__,
+        'get': get,
+    })
+    return view_class.as_view()
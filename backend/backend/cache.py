@@ -0,0 +1,14 @@
+# backend/backend/cache.py
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+
+def is_shared(alias='default'):
+    """
+    캐시를 여러 프로세스(웹 워커, Celery 워커)가 함께 보는지
+
+    CACHE_URL이 없을 때의 로컬 메모리 캐시는 프로세스마다 따로 있으므로,
+    다른 프로세스가 쓴 값(카운터, 버전 키 등)을 전제로 하는 기능은 이 값을 확인해야 한다.
+    """
+    return not isinstance(caches[alias], (LocMemCache, DummyCache))
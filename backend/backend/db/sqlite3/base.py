@@ -0,0 +1,42 @@
+# backend/backend/db/sqlite3/base.py
+from django.db.backends.sqlite3 import base
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    동시 쓰기에 맞춘 SQLite 백엔드
+
+    - journal_mode=WAL: 쓰는 동안에도 다른 연결이 읽을 수 있다
+    - synchronous=NORMAL: WAL에서 안전한 수준으로 fsync 횟수를 줄인다
+    - busy_timeout: 쓰기 잠금이 풀릴 때까지 OPTIONS['timeout']초 대기
+    - OPTIONS['transaction_mode']='IMMEDIATE' (DB_SQLITE_TRANSACTION_MODE)를 지정하면
+      트랜잭션을 BEGIN IMMEDIATE로 시작해 읽기 잠금에서 쓰기 잠금으로 올리다
+      대기 없이 'database is locked'가 나는 경우를 막는다. 읽기 전용 atomic 블록도
+      쓰기 잠금을 잡게 되므로 기본값은 SQLite 기본(DEFERRED)이다.
+    """
+
+    transaction_modes = ('DEFERRED', 'IMMEDIATE', 'EXCLUSIVE')
+    transaction_mode = None
+
+    def get_connection_params(self):
+        conn_params = super().get_connection_params()
+        # sqlite3.connect()가 모르는 옵션이므로 연결 인자에서 제외
+        mode = conn_params.pop('transaction_mode', None)
+        if mode is not None and mode.upper() not in self.transaction_modes:
+            raise ValueError(f'지원하지 않는 SQLite transaction_mode입니다: {mode}')
+        self.transaction_mode = mode.upper() if mode else None
+        return conn_params
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        timeout_ms = int(conn_params.get('timeout', 5) * 1000)
+        conn.execute('PRAGMA journal_mode = WAL')
+        conn.execute('PRAGMA synchronous = NORMAL')
+        conn.execute(f'PRAGMA busy_timeout = {timeout_ms}')
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        if self.transaction_mode is None:
+            super()._start_transaction_under_autocommit()
+        else:
+            self.cursor().execute(f'BEGIN {self.transaction_mode}')
@@ -0,0 +1,144 @@
+# backend/backend/pagination.py
+import base64
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class StandardPageNumberPagination(PageNumberPagination):
+    """기본 페이지 번호 방식. page_size 파라미터는 MAX_PAGE_SIZE까지 허용"""
+    page_size_query_param = 'page_size'
+    max_page_size = settings.MAX_PAGE_SIZE
+
+
+class KeysetPagination(StandardPageNumberPagination):
+    """
+    키셋(커서) 페이지네이션
+
+    cursor 파라미터가 있거나 pagination=cursor인 요청은 ordering 필드들의
+    마지막 값 이후를 WHERE 조건으로 조회하므로, COUNT(*)와 OFFSET 없이
+    몇 번째 페이지든 같은 비용으로 가져온다. 그 외 요청은 기존 페이지 번호 방식.
+
+    ordering의 마지막 필드는 유일해야 한다 (예: ('-date', '-id')).
+    """
+    ordering = ('-id',)
+    cursor_query_param = 'cursor'
+    mode_query_param = 'pagination'
+    invalid_cursor_message = '유효하지 않은 커서입니다.'
+
+    def use_keyset(self, request):
+        return (
+            self.cursor_query_param in request.query_params or
+            request.query_params.get(self.mode_query_param) == 'cursor'
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.use_keyset(request)
+        if not self.keyset:
+            if not queryset.ordered:
+                queryset = queryset.order_by(*self.ordering)
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        values, reverse = self.decode_cursor(request)
+        ordering = self._invert(self.ordering) if reverse else self.ordering
+
+        queryset = queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(self._after(ordering, values))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        has_next = has_more if not reverse else values is not None
+        has_previous = values is not None if not reverse else has_more
+
+        self.next_values = self._values(results[-1]) if has_next and results else None
+        self.previous_values = self._values(results[0]) if has_previous and results else None
+        return results
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if self.next_values is None:
+            return None
+        return self._link(self.next_values, reverse=False)
+
+    def get_previous_link(self):
+        if not self.keyset:
+            return super().get_previous_link()
+        if self.previous_values is None:
+            return None
+        return self._link(self.previous_values, reverse=True)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            values = payload['v']
+            reverse = bool(payload.get('r', False))
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    def encode_cursor(self, values, reverse):
+        payload = {'v': values}
+        if reverse:
+            payload['r'] = True
+        data = json.dumps(payload, default=str, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii')
+
+    def _link(self, values, reverse):
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(values, reverse)
+        )
+
+    def _values(self, obj):
+        values = []
+        for field in self.ordering:
+            value = getattr(obj, field.lstrip('-'))
+            values.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        return values
+
+    @staticmethod
+    def _invert(ordering):
+        return tuple(field[1:] if field.startswith('-') else f'-{field}' for field in ordering)
+
+    @staticmethod
+    def _after(ordering, values):
+        """(f1, f2, ...) > (v1, v2, ...) 사전식 비교 조건"""
+        condition = Q()
+        equal = {}
+        for field, value in zip(ordering, values):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= Q(**equal, **{f'{name}__{lookup}': value})
+            equal[name] = value
+        return condition
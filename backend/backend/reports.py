@@ -0,0 +1,57 @@
+# backend/backend/reports.py
+import asyncio
+import logging
+import time
+from django.conf import settings
+from .async_db import query_deadline
+
+logger = logging.getLogger(__name__)
+
+
+async def compose_report(parts, defaults=None, timeout=None):
+    """
+    리포트를 구성하는 독립 항목들을 동시에 실행하고 결과를 하나의 dict로 병합
+
+    parts: {항목 이름: 코루틴}
+    defaults: 실패/시간 초과 시 항목에 채울 기본값 {항목 이름: 값}
+    timeout: 리포트 전체 제한 시간(초). 기본값은 settings.REPORT_TIMEOUT_SECONDS
+
+    응답 지연은 가장 느린 항목 하나로 결정되며, 제한 시간 안에 끝나지 않았거나
+    실패한 항목은 기본값으로 채우고 'partial_errors'에 사유를 담아 부분 결과를 반환한다.
+    항목의 쿼리(run_query)에는 같은 마감 시각의 statement timeout이 걸려, 버려진 쿼리도
+    DB에서 중단되고 워커 스레드를 반환한다.
+    """
+    defaults = defaults or {}
+    if timeout is None:
+        timeout = settings.REPORT_TIMEOUT_SECONDS
+
+    # 태스크는 생성 시점의 컨텍스트를 복사하므로 마감 시각이 각 항목의 쿼리로 전달된다
+    token = query_deadline.set(time.monotonic() + timeout)
+    try:
+        tasks = {name: asyncio.ensure_future(coroutine) for name, coroutine in parts.items()}
+    finally:
+        query_deadline.reset(token)
+    if not tasks:
+        return {}
+
+    _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+    for task in pending:
+        # 실행 중인 쿼리는 statement timeout으로 DB에서 중단되고 결과는 버린다
+        task.cancel()
+
+    report = {}
+    errors = {}
+    for name, task in tasks.items():
+        if task in pending:
+            errors[name] = '시간 초과'
+        elif task.exception() is not None:
+            logger.warning('리포트 항목 %s 실패: %s', name, task.exception())
+            errors[name] = str(task.exception())
+        else:
+            report[name] = task.result()
+            continue
+        report[name] = defaults.get(name)
+
+    if errors:
+        report['partial_errors'] = errors
+    return report
@@ -4,8 +4,11 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 from datetime import timedelta
+from celery.schedules import crontab
 from channels.routing import ProtocolTypeRouter
 
+from .db import SQLITE_ENGINE, database_from_url
+
 
 load_dotenv()
 
@@ -44,6 +47,7 @@ INSTALLED_APPS = [
     'subscriptions',
     'attendance',
     'notifications',
+    'search',
     'channels',
 ]
 
@@ -84,13 +88,34 @@ TEMPLATES = [
 WSGI_APPLICATION = 'backend.wsgi.application'
 
 # Database
+# DATABASE_URL 미지정 시 SQLite(WAL), postgres://... 이면 PostgreSQL 프로필
+# (DB_CONN_MAX_AGE, DB_CONN_HEALTH_CHECKS, DB_POOLER, DB_BUSY_TIMEOUT,
+#  DB_SQLITE_TRANSACTION_MODE 참고: backend/db)
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database_from_url(os.getenv('DATABASE_URL'), BASE_DIR)
 }
 
+# 캐시 설정 (CACHE_URL이 있으면 Redis, 없으면 로컬 메모리)
+# 로컬 메모리 캐시는 프로세스마다 따로 있으므로, 웹소켓 접속 현황처럼 프로세스 간에
+# 공유해야 하는 값은 CACHE_URL이 없으면 사용하지 않는다 (backend.cache.is_shared 참고)
+CACHE_URL = os.getenv('CACHE_URL')
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# 대시보드 응답 캐시 유지 시간(초). 변경 시에는 버전 키로 즉시 무효화됨 (공유 캐시에서만 사용)
+DASHBOARD_CACHE_TIMEOUT = int(os.getenv('DASHBOARD_CACHE_TIMEOUT', 300))
+
 # REST Framework 설정
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
@@ -99,10 +124,23 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'backend.pagination.StandardPageNumberPagination',
     'PAGE_SIZE': 10
 }
 
+# page_size 파라미터로 요청할 수 있는 최대 페이지 크기
+MAX_PAGE_SIZE = int(os.getenv('MAX_PAGE_SIZE', 100))
+
+# 비동기 리포트 뷰에서 독립 쿼리를 동시에 실행할 스레드 수 (0이면 순차 실행)
+# SQLite는 스레드별 연결이 같은 파일에 잠금을 걸어 서로 막으므로 기본값 0
+# (테스트에서는 backend.testing.TestRunner가 항상 0으로 맞춘다)
+ASYNC_DB_MAX_WORKERS = int(os.getenv(
+    'ASYNC_DB_MAX_WORKERS', 0 if DATABASES['default']['ENGINE'] == SQLITE_ENGINE else 4
+))
+
+# 리포트 하나를 구성하는 쿼리들을 기다리는 최대 시간(초). 초과한 항목은 빈 결과로 응답
+REPORT_TIMEOUT_SECONDS = float(os.getenv('REPORT_TIMEOUT_SECONDS', 10))
+
 # 시간대 설정
 TIME_ZONE = 'Asia/Seoul'
 USE_TZ = True
@@ -110,6 +148,8 @@ USE_TZ = True
 STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+TEST_RUNNER = 'backend.testing.TestRunner'
+
 
 
 AUTH_USER_MODEL = 'accounts.User'
@@ -125,6 +165,23 @@ CHANNEL_LAYERS = {
     },
 }
 
+# 웹소켓 알림을 모아서 보내는 시간(ms)과 연결당 최대 대기 알림 수
+NOTIFICATION_COALESCE_MS = int(os.getenv('NOTIFICATION_COALESCE_MS', 200))
+NOTIFICATION_MAX_PENDING = int(os.getenv('NOTIFICATION_MAX_PENDING', 100))
+# 웹소켓 접속 상태 유지 시간(초). 연결은 절반 주기로 갱신
+NOTIFICATION_PRESENCE_TTL = int(os.getenv('NOTIFICATION_PRESENCE_TTL', 60))
+# 안 읽은 알림 수 캐시 유지 시간(초). 변경 시 키를 지우며, 동시 요청으로 남은 오래된 값도
+# 이 시간이 지나면 다시 계산된다 (공유 캐시에서만 사용)
+NOTIFICATION_UNREAD_CACHE_TIMEOUT = int(os.getenv('NOTIFICATION_UNREAD_CACHE_TIMEOUT', 60))
+# 읽은 알림을 보관 테이블로 옮기는 기준(일)과 한 번에 옮기는 수
+NOTIFICATION_ARCHIVE_AFTER_DAYS = int(os.getenv('NOTIFICATION_ARCHIVE_AFTER_DAYS', 90))
+NOTIFICATION_ARCHIVE_BATCH_SIZE = int(os.getenv('NOTIFICATION_ARCHIVE_BATCH_SIZE', 1000))
+# 발송 기록(중복 발송 방지) 보관 기간(일)
+NOTIFICATION_DELIVERY_RETENTION_DAYS = int(os.getenv('NOTIFICATION_DELIVERY_RETENTION_DAYS', 30))
+# 자동완성 인덱스를 다시 만드는 주기(초). 공유 캐시가 없어 다른 프로세스의 변경을
+# 버전 키로 알 수 없을 때만 사용한다 (공유 캐시면 변경 즉시 반영)
+SEARCH_SUGGEST_LOCAL_TTL = int(os.getenv('SEARCH_SUGGEST_LOCAL_TTL', 60))
+
 
 # Celery 설정
 CELERY_BROKER_URL = 'redis://localhost:6379/0'
@@ -135,17 +192,27 @@ CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'Asia/Seoul'
 
 
-# celery beat 설정
+# celery beat 설정 (스케줄은 여기서만 등록)
 CELERY_BEAT_SCHEDULE = {
     'check-subscription-expiry': {
         'task': 'notifications.tasks.check_subscription_expiry',
-        'schedule': timedelta(days=1),  # 매일 실행
+        'schedule': crontab(hour=9, minute=0),  # 매일 오전 9시
+        'options': {'expires': 3600}
+    },
+    'plan-class-reminders': {
+        'task': 'notifications.tasks.plan_class_reminders',
+        'schedule': crontab(hour=0, minute=5),  # 매일 00:05
         'options': {'expires': 3600}
     },
     'send-class-reminders': {
         'task': 'notifications.tasks.send_class_reminders',
-        'schedule': timedelta(minutes=30),  # 30분마다 실행
-        'options': {'expires': 1800}
+        'schedule': crontab(minute='*/10'),  # 10분마다 (알림 시각과의 최대 지연)
+        'options': {'expires': 600}
+    },
+    'archive-notifications': {
+        'task': 'notifications.tasks.archive_notifications',
+        'schedule': crontab(hour=3, minute=30),  # 매일 03:30 (사용량이 적은 시간)
+        'options': {'expires': 3600}
     },
 }
 
@@ -158,6 +225,19 @@ EMAIL_USE_TLS = True
 EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD')
 DEFAULT_FROM_EMAIL = 'Dance Academy <noreply@danceacademy.com>'
+EMAIL_TIMEOUT = int(os.getenv('EMAIL_TIMEOUT', 10))
+
+# 이메일 일괄 발송 (notifications.services.email_dispatch_service)
+# SMTP 연결 하나로 보내는 최대 메시지 수
+EMAIL_BATCH_SIZE = int(os.getenv('EMAIL_BATCH_SIZE', 100))
+# 분당 최대 발송 수 (메일 서버 발송 한도, 0이면 제한 없음)
+EMAIL_RATE_LIMIT_PER_MINUTE = int(os.getenv('EMAIL_RATE_LIMIT_PER_MINUTE', 0))
+# 일시적 오류 재시도 횟수와 첫 재시도 대기(초, 이후 2배씩 증가)
+EMAIL_MAX_RETRIES = int(os.getenv('EMAIL_MAX_RETRIES', 3))
+EMAIL_RETRY_BACKOFF = float(os.getenv('EMAIL_RETRY_BACKOFF', 2))
+
+# 수업 시작 몇 분 전에 수업 알림을 보낼지
+CLASS_REMINDER_LEAD_MINUTES = int(os.getenv('CLASS_REMINDER_LEAD_MINUTES', 30))
 
 # 프론트엔드 URL (이메일 템플릿에서 사용)
 FRONTEND_URL = 'http://localhost:3000'
\ No newline at end of file
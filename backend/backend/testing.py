@@ -0,0 +1,39 @@
+# backend/backend/testing.py
+from django.conf import settings
+from django.db import connection, transaction
+from django.test.runner import DiscoverRunner
+
+
+class TestRunner(DiscoverRunner):
+    """
+    프로젝트 기본 테스트 러너
+
+    테스트 트랜잭션은 요청 스레드의 연결에만 보이므로, 비동기 쿼리 풀의
+    다른 연결을 쓰지 않도록 ASYNC_DB_MAX_WORKERS를 0으로 고정한다.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._async_db_max_workers = settings.ASYNC_DB_MAX_WORKERS
+        settings.ASYNC_DB_MAX_WORKERS = 0
+
+    def teardown_test_environment(self, **kwargs):
+        settings.ASYNC_DB_MAX_WORKERS = self._async_db_max_workers
+        super().teardown_test_environment(**kwargs)
+
+
+class QueryPlanAssertionsMixin:
+    """EXPLAIN 결과로 쿼리가 특정 인덱스를 타는지 확인하는 테스트 헬퍼"""
+
+    def get_query_plan(self, queryset):
+        if connection.vendor != 'postgresql':
+            return queryset.explain()
+        # 테스트 데이터가 적으면 PostgreSQL은 순차 스캔을 고르므로 비용 판단을 배제한다
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+            return queryset.explain()
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = self.get_query_plan(queryset)
+        self.assertIn(index_name, plan, f'{index_name} 인덱스를 사용하지 않음:\n{plan}')
@@ -9,12 +9,25 @@ from rest_framework.routers import DefaultRouter
 from accounts.views import StudentViewSet
 from attendance.views import AttendanceViewSet, MakeupClassViewSet
 from subscriptions.views import SubscriptionViewSet
+from notifications.views import NotificationViewSet
+from search.views import suggestions
 from accounts.views.analytics_views import (
     enrollment_trends,
     retention_analysis,
     class_preferences,
     student_behavior
 )
+from attendance.views.stats_views import (
+    student_attendance_stats,
+    class_attendance_stats,
+    instructor_attendance_stats
+)
+from subscriptions.views.stats_views import (
+    revenue_summary,
+    monthly_revenue,
+    class_revenue,
+    instructor_revenue
+)
 
 
 
@@ -25,6 +38,7 @@ router.register(r'classes', DanceClassViewSet, basename='class')
 router.register(r'attendance', AttendanceViewSet, basename='attendance')
 router.register(r'makeup', MakeupClassViewSet, basename='makeup')
 router.register(r'subscriptions', SubscriptionViewSet, basename='subscription')
+router.register(r'notifications', NotificationViewSet, basename='notification')
 
 
 urlpatterns = [
@@ -36,6 +50,14 @@ urlpatterns = [
     path('api/auth/me/', get_user_info, name='user_info'),
     path('api/dashboard/stats/', dashboard_stats, name='dashboard_stats'),
     path('api/dashboard/today-classes/', todays_classes, name='today_classes'),
+    path('api/search/suggest/', suggestions, name='search-suggest'),
+    path('api/attendance/stats/student/<int:student_id>/', student_attendance_stats, name='student-attendance-stats'),
+    path('api/attendance/stats/class/<int:class_id>/', class_attendance_stats, name='class-attendance-stats'),
+    path('api/attendance/stats/instructor/<int:instructor_id>/', instructor_attendance_stats, name='instructor-attendance-stats'),
+    path('api/revenue/stats/summary/', revenue_summary, name='revenue-summary'),
+    path('api/revenue/stats/monthly/', monthly_revenue, name='monthly-revenue'),
+    path('api/revenue/stats/class/<int:class_id>/', class_revenue, name='class-revenue'),
+    path('api/revenue/stats/instructor/<int:instructor_id>/', instructor_revenue, name='instructor-revenue'),
     path('api/', include(router.urls)),
     path('api/analytics/enrollment-trends/', enrollment_trends, name='enrollment-trends'),
     path('api/analytics/retention/', retention_analysis, name='retention-analysis'),
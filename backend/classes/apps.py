@@ -5,3 +5,6 @@ class ClassesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'classes'
     verbose_name = '수업 관리'
+
+    def ready(self):
+        import classes.signals
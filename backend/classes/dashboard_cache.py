@@ -0,0 +1,44 @@
+# backend/classes/dashboard_cache.py
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from backend.cache import is_shared
+
+# 대시보드 응답 캐시
+# 수강생/수업/일정/수강권이 변경되면 버전 키를 올려 이전 캐시를 모두 무효화한다.
+# 버전 키가 모든 프로세스에 보여야 하므로 공유 캐시(CACHE_URL)일 때만 캐시한다.
+VERSION_KEY = 'dashboard:version'
+
+
+def get_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, timeout=None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+
+def _bump_version():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, 1, timeout=None)
+
+
+def bump_version():
+    """커밋 이후 버전 증가 (커밋 전 데이터가 새 버전으로 캐시되는 것을 방지)"""
+    transaction.on_commit(_bump_version)
+
+
+def get_or_build(name, day, builder):
+    """버전/날짜가 포함된 키로 캐시 조회, 없으면 builder() 결과를 저장"""
+    if not is_shared():
+        # 로컬 메모리 캐시는 다른 프로세스의 버전 증가를 모르므로 매번 새로 만든다
+        return builder()
+    key = f'dashboard:{name}:{get_version()}:{day.isoformat()}'
+    data = cache.get(key)
+    if data is None:
+        data = builder()
+        cache.set(key, data, timeout=settings.DASHBOARD_CACHE_TIMEOUT)
+    return data
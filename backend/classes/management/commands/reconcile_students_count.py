@@ -0,0 +1,54 @@
+# backend/classes/management/commands/reconcile_students_count.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from classes.dashboard_cache import bump_version
+from classes.models import DanceClass
+from subscriptions.models import Subscription
+
+
+class Command(BaseCommand):
+    help = '수업별 현재 수강생 수 카운터를 실제 활성 수강권 수와 맞춘다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='변경하지 않고 불일치 수업만 출력'
+        )
+
+    def handle(self, *args, **options):
+        active_counts = Subscription.objects.filter(
+            dance_class=OuterRef('pk'),
+            status='active'
+        ).order_by().values('dance_class').annotate(
+            count=Count('id')
+        ).values('count')
+        actual_count = Coalesce(Subquery(active_counts), Value(0))
+
+        with transaction.atomic():
+            drifted = list(
+                DanceClass.objects.select_for_update().annotate(
+                    actual_count=actual_count
+                ).exclude(
+                    current_students_count=actual_count
+                ).values('id', 'name', 'current_students_count', 'actual_count')
+            )
+
+            for row in drifted:
+                self.stdout.write(
+                    f"{row['name']} (id={row['id']}): "
+                    f"{row['current_students_count']} -> {row['actual_count']}"
+                )
+
+            if drifted and not options['dry_run']:
+                DanceClass.objects.filter(
+                    id__in=[row['id'] for row in drifted]
+                ).update(current_students_count=actual_count)
+                bump_version()
+
+        if options['dry_run']:
+            self.stdout.write(f'불일치 수업 {len(drifted)}개 (변경 없음)')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'{len(drifted)}개 수업의 수강생 수를 보정했습니다.'))
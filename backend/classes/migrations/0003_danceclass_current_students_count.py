@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-18 20:09
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_current_students_count(apps, schema_editor):
+    DanceClass = apps.get_model('classes', 'DanceClass')
+    Subscription = apps.get_model('subscriptions', 'Subscription')
+
+    active_counts = Subscription.objects.filter(
+        dance_class=OuterRef('pk'),
+        status='active'
+    ).order_by().values('dance_class').annotate(
+        count=Count('id')
+    ).values('count')
+
+    DanceClass.objects.update(
+        current_students_count=Coalesce(Subquery(active_counts), Value(0))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classes', '0002_classschedule_room_danceclass_difficulty_and_more'),
+        ('subscriptions', '0002_alter_subscription_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='danceclass',
+            name='current_students_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='현재 수강생 수'),
+        ),
+        migrations.RunPython(populate_current_students_count, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,8 @@
 # backend/classes/models.py
 
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Greatest
 from django.conf import settings
 
 class DanceClass(models.Model):
@@ -48,6 +50,12 @@ class DanceClass(models.Model):
         default='pending',
         verbose_name='상태'
     )
+    # 활성 수강권 수 (Subscription 저장/삭제 시 함께 갱신)
+    current_students_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='현재 수강생 수'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -59,15 +67,12 @@ class DanceClass(models.Model):
     def __str__(self):
         return f"{self.name} ({self.get_difficulty_display()})"
 
-    @property
-    def current_students_count(self):
-        return self.subscription_set.filter(status='active').count()
-    
-    @current_students_count.setter
-    def current_students_count(self, value):
-        if value < 0:
-            raise ValueError("학생 수는 0 이상이어야 합니다.")
-        self._current_students_count = value
+    @classmethod
+    def adjust_students_count(cls, class_id, delta):
+        """활성 수강생 수 카운터를 delta만큼 조정"""
+        cls.objects.filter(pk=class_id).update(
+            current_students_count=Greatest(F('current_students_count') + delta, 0)
+        )
 
 
 class ClassSchedule(models.Model):
@@ -123,13 +128,16 @@ class ClassSchedule(models.Model):
         if self.start_time >= self.end_time:
             raise ValidationError('종료 시간은 시작 시간보다 늦어야 합니다.')
 
-        # 같은 요일에 시간이 겹치는 수업이 있는지 확인
-        overlapping = ClassSchedule.objects.filter(
-            weekday=self.weekday,
-            room=self.room
-        ).exclude(id=self.id)
-
-        for schedule in overlapping:
-            if (self.start_time <= schedule.end_time and 
-                self.end_time >= schedule.start_time):
-                raise ValidationError('해당 시간에 이미 다른 수업이 있습니다.')
\ No newline at end of file
+        # 같은 강의실/요일에 시간이 겹치는 수업이 있는지 확인 (끝나는 시각에 시작하는 것은 허용)
+        from .services.room_service import RoomAvailabilityService
+        conflicts = RoomAvailabilityService.find_conflicts(
+            [{
+                'weekday': self.weekday,
+                'start_time': self.start_time,
+                'end_time': self.end_time,
+                'room': self.room,
+            }],
+            exclude_ids=[self.id] if self.id else None
+        )
+        if conflicts:
+            raise ValidationError('해당 시간에 이미 다른 수업이 있습니다.')
\ No newline at end of file
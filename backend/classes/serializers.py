@@ -2,6 +2,7 @@
 
 from rest_framework import serializers
 from .models import DanceClass, ClassSchedule
+from .services.room_service import RoomAvailabilityService
 from accounts.serializers import UserSerializer
 
 class ClassScheduleSerializer(serializers.ModelSerializer):
@@ -19,7 +20,7 @@ class DanceClassListSerializer(serializers.ModelSerializer):
     difficulty_display = serializers.CharField(source='get_difficulty_display', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     current_students_count = serializers.IntegerField(read_only=True)
-    schedules_count = serializers.IntegerField(source='schedules.count', read_only=True)
+    schedules_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = DanceClass
@@ -84,20 +85,28 @@ class DanceClassCreateUpdateSerializer(serializers.ModelSerializer):
         if not schedules:
             raise serializers.ValidationError("최소 1개 이상의 수업 일정이 필요합니다.")
         
-        # 시간 중복 검사
-        schedule_times = {}
+        default_room = ClassSchedule._meta.get_field('room').default
         for schedule in schedules:
-            key = (schedule['weekday'], schedule['room'])
-            if key in schedule_times:
-                for existing in schedule_times[key]:
-                    if (schedule['start_time'] < existing['end_time'] and 
-                        schedule['end_time'] > existing['start_time']):
-                        raise serializers.ValidationError(
-                            f"{schedule['get_weekday_display']} {schedule['start_time']}~{schedule['end_time']} "
-                            "시간에 이미 다른 수업이 있습니다."
-                        )
-                schedule_times[key].append(schedule)
-            else:
-                schedule_times[key] = [schedule]
+            if schedule['start_time'] >= schedule['end_time']:
+                raise serializers.ValidationError('종료 시간은 시작 시간보다 늦어야 합니다.')
+            schedule.setdefault('room', default_room)
+
+        # 시간 중복 검사 (요청 안의 일정끼리 + 다른 수업의 기존 일정, 수정 시 이 수업의 기존 일정은 교체되므로 제외)
+        conflicts = RoomAvailabilityService.find_conflicts(
+            schedules,
+            exclude_class_id=self.instance.id if self.instance else None
+        )
+        if conflicts:
+            weekdays = dict(ClassSchedule.WEEKDAY_CHOICES)
+            raise serializers.ValidationError([
+                f"{weekdays[schedule['weekday']]} {schedule['start_time'].strftime('%H:%M')}~"
+                f"{schedule['end_time'].strftime('%H:%M')} {schedule['room']}: "
+                + (
+                    f"{existing.dance_class.name} 수업과 시간이 겹칩니다."
+                    if isinstance(existing, ClassSchedule)
+                    else "같은 요청의 다른 일정과 시간이 겹칩니다."
+                )
+                for schedule, existing in conflicts
+            ])
 
         return schedules
\ No newline at end of file
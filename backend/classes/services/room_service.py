@@ -0,0 +1,170 @@
+# backend/classes/services/room_service.py
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import time
+
+from ..models import ClassSchedule
+
+# 빈 시간 계산에 쓰는 기본 운영 시간
+DEFAULT_OPEN_TIME = time(9, 0)
+DEFAULT_CLOSE_TIME = time(23, 0)
+
+
+def overlaps(start, end, other_start, other_end):
+    """[start, end)와 [other_start, other_end)가 겹치는지 (끝과 시작이 맞닿는 것은 허용)"""
+    return start < other_end and other_start < end
+
+
+class RoomTimeline:
+    """
+    한 (강의실, 요일)의 예약 구간
+
+    시작 시각 순으로 정렬하고, 앞에서부터의 최대 종료 시각을 함께 저장한다.
+    [start, end)와 겹치는 예약이 있는지는 start_time < end인 구간들의 최대 종료 시각이
+    start보다 늦은지로 판단하므로 이진 탐색 한 번(O(log n))이면 된다.
+    """
+
+    def __init__(self, bookings):
+        # bookings: [(start_time, end_time, 예약 정보), ...]
+        self.bookings = sorted(bookings, key=lambda booking: (booking[0], booking[1]))
+        self.starts = [booking[0] for booking in self.bookings]
+        self.max_ends = []  # (지금까지의 최대 종료 시각, 해당 예약 위치)
+        for i, (_, end, _) in enumerate(self.bookings):
+            if not self.max_ends or end > self.max_ends[-1][0]:
+                self.max_ends.append((end, i))
+            else:
+                self.max_ends.append(self.max_ends[-1])
+
+    def conflict(self, start, end):
+        """겹치는 예약 정보 하나 (없으면 None)"""
+        i = bisect_left(self.starts, end)
+        if i == 0:
+            return None
+        max_end, position = self.max_ends[i - 1]
+        if max_end > start:
+            return self.bookings[position][2]
+        return None
+
+    def free_slots(self, open_time, close_time, min_minutes=0):
+        """운영 시간 중 예약이 없는 구간 [(시작, 종료), ...]"""
+        slots = []
+        cursor = open_time
+        for start, end, _ in self.bookings:
+            if start > cursor:
+                slots.append((cursor, min(start, close_time)))
+            cursor = max(cursor, end)
+            if cursor >= close_time:
+                break
+        if cursor < close_time:
+            slots.append((cursor, close_time))
+        return [
+            (start, end) for start, end in slots
+            if start < end and _minutes(end) - _minutes(start) >= min_minutes
+        ]
+
+
+def _minutes(value):
+    return value.hour * 60 + value.minute
+
+
+class RoomAvailability:
+    """(강의실, 요일)별 RoomTimeline 모음. 필요한 예약을 한 번의 조회로 읽어 만든다."""
+
+    def __init__(self, schedules):
+        grouped = defaultdict(list)
+        for schedule in schedules:
+            grouped[(schedule.room, schedule.weekday)].append(
+                (schedule.start_time, schedule.end_time, schedule)
+            )
+        self.timelines = {key: RoomTimeline(bookings) for key, bookings in grouped.items()}
+
+    @classmethod
+    def load(cls, rooms=None, weekdays=None, exclude_class_id=None, exclude_ids=None):
+        queryset = ClassSchedule.objects.select_related('dance_class')
+        if rooms is not None:
+            queryset = queryset.filter(room__in=rooms)
+        if weekdays is not None:
+            queryset = queryset.filter(weekday__in=weekdays)
+        if exclude_class_id is not None:
+            queryset = queryset.exclude(dance_class_id=exclude_class_id)
+        if exclude_ids:
+            queryset = queryset.exclude(id__in=exclude_ids)
+        return cls(queryset)
+
+    def timeline(self, room, weekday):
+        return self.timelines.get((room, weekday)) or RoomTimeline([])
+
+    def conflict(self, room, weekday, start, end):
+        return self.timeline(room, weekday).conflict(start, end)
+
+
+class RoomAvailabilityService:
+    @staticmethod
+    def find_conflicts(schedules, exclude_class_id=None, exclude_ids=None):
+        """
+        수업 일정 묶음의 강의실 충돌 확인
+
+        schedules: [{'weekday', 'start_time', 'end_time', 'room'}, ...]
+        기존 예약은 관련 (강의실, 요일)만 한 번에 조회하고, 묶음 안의 일정끼리도 확인한다.
+        충돌 목록 [(일정, 겹치는 일정 또는 ClassSchedule), ...] 반환.
+        """
+        if not schedules:
+            return []
+        availability = RoomAvailability.load(
+            rooms={schedule['room'] for schedule in schedules},
+            weekdays={schedule['weekday'] for schedule in schedules},
+            exclude_class_id=exclude_class_id,
+            exclude_ids=exclude_ids
+        )
+
+        conflicts = []
+        for schedule in schedules:
+            existing = availability.conflict(
+                schedule['room'], schedule['weekday'],
+                schedule['start_time'], schedule['end_time']
+            )
+            if existing is not None:
+                conflicts.append((schedule, existing))
+
+        # 같은 묶음 안의 일정끼리: 시작 순으로 보면서 앞선 일정의 최대 종료 시각과 비교
+        ordered = sorted(
+            schedules,
+            key=lambda schedule: (schedule['room'], schedule['weekday'], schedule['start_time'])
+        )
+        latest = None
+        for schedule in ordered:
+            if (latest is not None
+                    and (latest['room'], latest['weekday']) == (schedule['room'], schedule['weekday'])
+                    and schedule['start_time'] < latest['end_time']):
+                conflicts.append((schedule, latest))
+            if (latest is None
+                    or (latest['room'], latest['weekday']) != (schedule['room'], schedule['weekday'])
+                    or schedule['end_time'] > latest['end_time']):
+                latest = schedule
+        return conflicts
+
+    @staticmethod
+    def free_slots(weekdays, rooms=None, open_time=DEFAULT_OPEN_TIME,
+                   close_time=DEFAULT_CLOSE_TIME, min_minutes=0):
+        """
+        강의실/요일별 빈 시간
+
+        rooms를 주지 않으면 일정이 등록된 모든 강의실. (조회 1회)
+        [{'room', 'weekday', 'slots': [(시작, 종료), ...]}, ...]
+        """
+        availability = RoomAvailability.load(rooms=rooms, weekdays=weekdays)
+        if rooms is None:
+            rooms = {room for room, _ in availability.timelines} or {
+                ClassSchedule._meta.get_field('room').default
+            }
+        return [
+            {
+                'room': room,
+                'weekday': weekday,
+                'slots': availability.timeline(room, weekday).free_slots(
+                    open_time, close_time, min_minutes
+                ),
+            }
+            for room in sorted(rooms)
+            for weekday in sorted(weekdays)
+        ]
@@ -0,0 +1,29 @@
+# backend/classes/signals.py
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from subscriptions.models import Subscription
+from .models import DanceClass, ClassSchedule
+from .dashboard_cache import bump_version
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_dashboard_on_user_change(sender, instance, update_fields=None, **kwargs):
+    # 로그인 시각 갱신이나 관리자 계정 변경은 대시보드에 영향이 없음
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    if instance.user_type in ('student', 'instructor'):
+        bump_version()
+
+
+@receiver(post_save, sender=DanceClass)
+@receiver(post_delete, sender=DanceClass)
+@receiver(post_save, sender=ClassSchedule)
+@receiver(post_delete, sender=ClassSchedule)
+@receiver(post_save, sender=Subscription)
+@receiver(post_delete, sender=Subscription)
+def invalidate_dashboard(sender, **kwargs):
+    bump_version()
@@ -1,3 +1,274 @@
+from datetime import date, time
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from subscriptions.models import Subscription
+from .models import DanceClass, ClassSchedule
+from .services.room_service import RoomAvailabilityService, RoomTimeline
+
+User = get_user_model()
+
+
+class TodaysClassesQueryTest(TestCase):
+    def setUp(self):
+        self.instructor = User.objects.create(username='instructor', user_type='instructor')
+        self.students = [
+            User.objects.create(username=f'student{i}', user_type='student')
+            for i in range(3)
+        ]
+        self.weekday = timezone.now().date().weekday()
+        self.client = APIClient()
+        self.client.force_authenticate(self.instructor)
+        cache.clear()
+
+    def _create_class(self, index, active_students):
+        dance_class = DanceClass.objects.create(
+            name=f'class{index}',
+            instructor=self.instructor,
+            capacity=20,
+        )
+        ClassSchedule.objects.create(
+            dance_class=dance_class,
+            weekday=self.weekday,
+            start_time=time(index % 24, 0),
+            end_time=time(index % 24, 50),
+            room=f'room{index}',
+        )
+        for i, student in enumerate(self.students):
+            Subscription.objects.create(
+                student=student,
+                dance_class=dance_class,
+                subscription_type='days',
+                start_date=date(2024, 1, 1),
+                end_date=date(2099, 1, 1),
+                status='active' if i < active_students else 'expired',
+            )
+        return dance_class
+
+    def test_attendees_count_active_subscriptions(self):
+        self._create_class(10, active_students=2)
+
+        response = self.client.get('/api/dashboard/today-classes/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]['attendees'], '2/20')
+
+    def test_query_count_does_not_grow_with_schedules(self):
+        for index in range(10):
+            self._create_class(index, active_students=index % 4)
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/dashboard/today-classes/')
+
+        self.assertEqual(len(response.data), 10)
+        self.assertEqual(
+            [row['attendees'] for row in response.data],
+            [f'{min(i % 4, 3)}/20' for i in range(10)]
+        )
+
+    @mock.patch('classes.dashboard_cache.is_shared', return_value=True)
+    def test_cached_until_subscription_changes(self, _):
+        dance_class = self._create_class(10, active_students=1)
+        self.client.get('/api/dashboard/today-classes/')
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/dashboard/today-classes/')
+        self.assertEqual(response.data[0]['attendees'], '1/20')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Subscription.objects.filter(dance_class=dance_class, status='expired').first().delete()
+            subscription = Subscription.objects.get(dance_class=dance_class, status='active')
+            subscription.status = 'cancelled'
+            subscription.save()
+
+        response = self.client.get('/api/dashboard/today-classes/')
+        self.assertEqual(response.data[0]['attendees'], '0/20')
+
+    def test_not_cached_without_shared_cache(self):
+        self._create_class(10, active_students=1)
+        self.client.get('/api/dashboard/today-classes/')
+
+        # 로컬 메모리 캐시면 다른 프로세스의 변경을 알 수 없으므로 매번 DB에서 읽는다
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/dashboard/today-classes/')
+        self.assertEqual(response.data[0]['attendees'], '1/20')
+
+
+class CurrentStudentsCountTest(TestCase):
+    def setUp(self):
+        instructor = User.objects.create(username='instructor', user_type='instructor')
+        self.student = User.objects.create(username='student', user_type='student')
+        self.dance_class = DanceClass.objects.create(name='class', instructor=instructor, capacity=10)
+        self.other_class = DanceClass.objects.create(name='other', instructor=instructor, capacity=10)
+
+    def _count(self, dance_class):
+        dance_class.refresh_from_db(fields=['current_students_count'])
+        return dance_class.current_students_count
+
+    def _subscribe(self, status='active'):
+        return Subscription.objects.create(
+            student=self.student,
+            dance_class=self.dance_class,
+            subscription_type='days',
+            start_date=date(2024, 1, 1),
+            end_date=date(2099, 1, 1),
+            status=status,
+        )
+
+    def test_counter_follows_subscription_lifecycle(self):
+        subscription = self._subscribe()
+        self._subscribe(status='expired')
+        self.assertEqual(self._count(self.dance_class), 1)
+
+        subscription.status = 'paused'
+        subscription.save()
+        self.assertEqual(self._count(self.dance_class), 0)
+
+        subscription.status = 'active'
+        subscription.save()
+        self.assertEqual(self._count(self.dance_class), 1)
+
+        subscription.dance_class = self.other_class
+        subscription.save()
+        self.assertEqual(self._count(self.dance_class), 0)
+        self.assertEqual(self._count(self.other_class), 1)
+
+        subscription.delete()
+        self.assertEqual(self._count(self.other_class), 0)
+
+    def test_reconcile_command_fixes_drift(self):
+        self._subscribe()
+        DanceClass.objects.filter(pk=self.dance_class.pk).update(current_students_count=5)
+
+        call_command('reconcile_students_count', stdout=StringIO())
+
+        self.assertEqual(self._count(self.dance_class), 1)
+
+
+class DanceClassListQueryTest(TestCase):
+    def setUp(self):
+        self.instructor = User.objects.create(username='instructor', user_type='instructor')
+        self.client = APIClient()
+        self.client.force_authenticate(self.instructor)
+
+    def _create_classes(self, count):
+        for index in range(count):
+            dance_class = DanceClass.objects.create(
+                name=f'class{index}',
+                instructor=self.instructor,
+                capacity=10,
+            )
+            for weekday in range(index % 3 + 1):
+                ClassSchedule.objects.create(
+                    dance_class=dance_class,
+                    weekday=weekday,
+                    start_time=time(10, 0),
+                    end_time=time(11, 0),
+                    room=f'room{index}',
+                )
+
+    def test_list_uses_constant_queries(self):
+        self._create_classes(10)
+
+        # 페이지네이션 COUNT + 목록 조회
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/classes/')
+
+        self.assertEqual(response.status_code, 200)
+        counts = {row['name']: row['schedules_count'] for row in response.data['results']}
+        self.assertEqual(counts['class0'], 1)
+        self.assertEqual(counts['class4'], 2)
+        self.assertEqual(counts['class8'], 3)
+
+
+class RoomAvailabilityTest(TestCase):
+    def setUp(self):
+        self.instructor = User.objects.create(username='instructor', user_type='instructor')
+        self.ballet = DanceClass.objects.create(name='발레', instructor=self.instructor, capacity=10)
+        for start, end in ((time(10), time(11)), (time(18), time(20))):
+            ClassSchedule.objects.create(
+                dance_class=self.ballet, weekday=0, start_time=start, end_time=end, room='A'
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(self.instructor)
+
+    def _payload(self, schedules):
+        return {
+            'name': '재즈', 'instructor': self.instructor.id, 'difficulty': 'beginner',
+            'capacity': 10, 'price_per_month': 100000, 'status': 'active',
+            'schedules': schedules,
+        }
+
+    def test_timeline_handles_nested_intervals(self):
+        timeline = RoomTimeline([
+            (time(9), time(15), 'long'),
+            (time(10), time(11), 'short'),
+            (time(16), time(17), 'late'),
+        ])
+        self.assertEqual(timeline.conflict(time(13), time(14)), 'long')
+        self.assertEqual(timeline.conflict(time(16, 30), time(18)), 'late')
+        self.assertIsNone(timeline.conflict(time(15), time(16)))
+        self.assertIsNone(timeline.conflict(time(7), time(9)))
+
+    def test_clean_allows_back_to_back(self):
+        jazz = DanceClass.objects.create(name='재즈', instructor=self.instructor, capacity=10)
+        ClassSchedule(
+            dance_class=jazz, weekday=0, start_time=time(11), end_time=time(12), room='A'
+        ).clean()
+        with self.assertRaises(ValidationError):
+            ClassSchedule(
+                dance_class=jazz, weekday=0, start_time=time(19), end_time=time(21), room='A'
+            ).clean()
+
+    def test_schedule_set_checked_in_one_query(self):
+        schedules = [
+            {'weekday': 0, 'start_time': time(10, 30), 'end_time': time(11, 30), 'room': 'A'},
+            {'weekday': 0, 'start_time': time(12), 'end_time': time(13), 'room': 'A'},
+            {'weekday': 0, 'start_time': time(12, 30), 'end_time': time(14), 'room': 'A'},
+            {'weekday': 0, 'start_time': time(10), 'end_time': time(11), 'room': 'B'},
+        ]
+        with self.assertNumQueries(1):
+            conflicts = RoomAvailabilityService.find_conflicts(schedules)
+        self.assertEqual(
+            [(schedule['start_time'], getattr(existing, 'id', None)) for schedule, existing in conflicts],
+            [(time(10, 30), ClassSchedule.objects.get(start_time=time(10)).id), (time(12, 30), None)]
+        )
+
+    def test_serializer_rejects_conflicts_with_other_classes(self):
+        response = self.client.post('/api/classes/', self._payload([
+            {'weekday': 0, 'start_time': '19:00', 'end_time': '21:00', 'room': 'A'},
+        ]), format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('발레', response.data['schedules'][0])
+
+        # 자기 수업의 기존 일정은 교체되므로 충돌로 보지 않는다
+        response = self.client.put(f'/api/classes/{self.ballet.id}/', {
+            **self._payload([
+                {'weekday': 0, 'start_time': '10:30', 'end_time': '11:30', 'room': 'A'},
+            ]),
+            'name': '발레',
+        }, format='json')
+        self.assertEqual(response.status_code, 200)
 
-# Create your tests here.
+    def test_free_slots(self):
+        response = self.client.get('/api/classes/free-slots/', {
+            'weekday': 0, 'room': ['A', 'B'], 'open': '09:00', 'close': '22:00', 'min_minutes': 90,
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [
+            {'room': 'A', 'weekday': 0, 'slots': [
+                {'start_time': '11:00', 'end_time': '18:00'},
+                {'start_time': '20:00', 'end_time': '22:00'},
+            ]},
+            {'room': 'B', 'weekday': 0, 'slots': [
+                {'start_time': '09:00', 'end_time': '22:00'},
+            ]},
+        ])
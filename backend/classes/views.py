@@ -4,11 +4,14 @@ from rest_framework.decorators import action
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Count, Q
+from django.db.models import Count
 from django.utils import timezone
 from datetime import datetime, timedelta
 from django.contrib.auth import get_user_model
 from .models import DanceClass, ClassSchedule
+from . import dashboard_cache
+from .services.room_service import RoomAvailabilityService
+from search.filters import IndexedSearchFilter
 from subscriptions.models import Subscription
 from .serializers import (
     DanceClassListSerializer,
@@ -21,26 +24,19 @@ User = get_user_model()
 
 class DanceClassViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
+    # 검색: 수업명, 강사 아이디, 설명
+    filter_backends = [IndexedSearchFilter]
+    search_index_fields = {'id': 'class'}
 
     def get_queryset(self):
-        queryset = DanceClass.objects.select_related('instructor').prefetch_related('schedules')
-        
-        # 현재 수강생 수 계산
-        # queryset = queryset.annotate(
-        #     current_students_count=Count(
-        #         'subscription',
-        #         filter=Q(subscription__status='active')
-        #     )
-        # )
-
-        # 검색 기능
-        search = self.request.query_params.get('search', None)
-        if search:
-            queryset = queryset.filter(
-                Q(name__icontains=search) |
-                Q(instructor__username__icontains=search) |
-                Q(description__icontains=search)
-            )
+        queryset = DanceClass.objects.select_related('instructor')
+
+        # 목록은 일정 개수만 필요하므로 prefetch 대신 같은 쿼리에서 집계
+        # (현재 수강생 수는 DanceClass.current_students_count 컬럼에 저장됨)
+        if self.action == 'list':
+            queryset = queryset.annotate(schedules_count=Count('schedules'))
+        else:
+            queryset = queryset.prefetch_related('schedules')
 
         # 필터링
         difficulty = self.request.query_params.get('difficulty', None)
@@ -66,6 +62,49 @@ class DanceClassViewSet(viewsets.ModelViewSet):
         serializer = ClassScheduleSerializer(dance_class.schedules.all(), many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['get'], url_path='free-slots')
+    def free_slots(self, request):
+        """
+        강의실별 빈 시간 (시간표 작성용)
+
+        weekday: 요일(0~6, 여러 개 가능, 없으면 전체), room: 강의실(여러 개 가능, 없으면 전체)
+        open/close: 운영 시간(HH:MM), min_minutes: 이보다 짧은 빈 시간은 제외
+        """
+        try:
+            weekdays = [int(weekday) for weekday in request.query_params.getlist('weekday')] or list(range(7))
+            open_time = datetime.strptime(request.query_params.get('open', '09:00'), '%H:%M').time()
+            close_time = datetime.strptime(request.query_params.get('close', '23:00'), '%H:%M').time()
+            min_minutes = int(request.query_params.get('min_minutes', 0))
+        except ValueError:
+            return Response(
+                {'error': '요일, 운영 시간(HH:MM), 최소 시간 형식이 올바르지 않습니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if any(weekday not in range(7) for weekday in weekdays) or open_time >= close_time:
+            return Response(
+                {'error': '요일은 0~6, 종료 시간은 시작 시간보다 늦어야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        results = RoomAvailabilityService.free_slots(
+            weekdays,
+            rooms=request.query_params.getlist('room') or None,
+            open_time=open_time,
+            close_time=close_time,
+            min_minutes=min_minutes
+        )
+        return Response([
+            {
+                'room': result['room'],
+                'weekday': result['weekday'],
+                'slots': [
+                    {'start_time': start.strftime('%H:%M'), 'end_time': end.strftime('%H:%M')}
+                    for start, end in result['slots']
+                ],
+            }
+            for result in results
+        ])
+
     @action(detail=True, methods=['get'])
     def students(self, request, pk=None):
         dance_class = self.get_object()
@@ -86,10 +125,7 @@ class DanceClassViewSet(viewsets.ModelViewSet):
 
 
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def dashboard_stats(request):
-    today = timezone.now().date()
+def _build_dashboard_stats(today):
     first_day_of_month = today.replace(day=1)
     
     # 전체 수강생 수
@@ -109,36 +145,43 @@ def dashboard_stats(request):
     # 이번 달 매출 (임시 더미 데이터)
     monthly_revenue = 2450000  # 실제 결제 모듈 연동 전 임시 데이터
     
-    return Response({
+    return {
         'total_students': total_students,
         'todays_classes': todays_classes,
         'new_students': new_students,
         'monthly_revenue': monthly_revenue
-    })
+    }
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def todays_classes(request):
-    today = timezone.now().date()
-    weekday = today.weekday()
-    
+def _build_todays_classes(today):
+    # 수강생 수는 DanceClass에 저장된 카운터를 사용하므로 한 번의 쿼리로 조회
     classes = ClassSchedule.objects.filter(
-        weekday=weekday
+        weekday=today.weekday()
     ).select_related('dance_class', 'dance_class__instructor')
     
     class_data = []
     for schedule in classes:
-        total_students = Subscription.objects.filter(
-            dance_class=schedule.dance_class,
-            status='active'
-        ).count()
-        
         class_data.append({
             'id': schedule.id,
             'name': schedule.dance_class.name,
             'time': f"{schedule.start_time.strftime('%H:%M')} - {schedule.end_time.strftime('%H:%M')}",
             'instructor': schedule.dance_class.instructor.get_full_name() or schedule.dance_class.instructor.username,
-            'attendees': f"{total_students}/{schedule.dance_class.capacity}"
+            'attendees': f"{schedule.dance_class.current_students_count}/{schedule.dance_class.capacity}"
         })
     
-    return Response(class_data)
\ No newline at end of file
+    return class_data
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def dashboard_stats(request):
+    today = timezone.now().date()
+    return Response(dashboard_cache.get_or_build(
+        'stats', today, lambda: _build_dashboard_stats(today)
+    ))
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def todays_classes(request):
+    today = timezone.now().date()
+    return Response(dashboard_cache.get_or_build(
+        'todays_classes', today, lambda: _build_todays_classes(today)
+    ))
@@ -1,7 +1,9 @@
 # backend/notifications/admin.py
 
 from django.contrib import admin
-from .models import Notification, NotificationPreference
+from .models import (
+    ArchivedNotification, ClassReminder, Notification, NotificationDelivery, NotificationPreference
+)
 
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
@@ -38,4 +40,24 @@ class NotificationPreferenceAdmin(admin.ModelAdmin):
         ('알림 방법 설정', {
             'fields': ('email_notifications', 'push_notifications')
         })
-    )
\ No newline at end of file
+    )
+
+@admin.register(ClassReminder)
+class ClassReminderAdmin(admin.ModelAdmin):
+    list_display = ('student', 'schedule', 'starts_at', 'remind_at', 'sent_at')
+    list_filter = ('sent_at',)
+    search_fields = ('student__username', 'schedule__dance_class__name')
+    date_hierarchy = 'starts_at'
+
+@admin.register(NotificationDelivery)
+class NotificationDeliveryAdmin(admin.ModelAdmin):
+    list_display = ('user', 'notification_type', 'object_id', 'occurrence_date', 'channel', 'created_at')
+    list_filter = ('notification_type', 'channel', 'occurrence_date')
+    search_fields = ('user__username',)
+
+@admin.register(ArchivedNotification)
+class ArchivedNotificationAdmin(admin.ModelAdmin):
+    list_display = ('user', 'notification_type', 'title', 'created_at', 'archived_at')
+    list_filter = ('notification_type',)
+    search_fields = ('user__username', 'title')
+    date_hierarchy = 'created_at'
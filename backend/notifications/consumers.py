@@ -1,29 +1,75 @@
 # backend/notifications/consumers.py
+import asyncio
+from collections import deque
+
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from channels.db import database_sync_to_async
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from . import presence
 
 User = get_user_model()
 
 class NotificationConsumer(AsyncJsonWebsocketConsumer):
+    """
+    사용자별 실시간 알림
+
+    알림은 NOTIFICATION_COALESCE_MS 동안 모았다가 JSON 배열 하나로 보낸다.
+    연결마다 최대 NOTIFICATION_MAX_PENDING개까지만 쌓고, 넘치면 오래된 것부터 버린 뒤
+    배열 끝에 {"type": "notifications_dropped", "count": n}을 붙여 목록을 다시 불러오게 한다.
+    접속 중에는 presence에 연결을 등록해, 접속하지 않은 사용자에게는 전송을 생략하게 한다.
+    """
+
     async def connect(self):
         if self.scope["user"].is_anonymous:
             await self.close()
         else:
+            self.pending = deque(maxlen=settings.NOTIFICATION_MAX_PENDING)
+            self.dropped = 0
+            self.flush_task = None
             await self.channel_layer.group_add(
                 f"user_{self.scope['user'].id}",
                 self.channel_name
             )
             await self.accept()
-    
+            await presence.mark_online(self.scope["user"].id)
+            self.heartbeat_task = asyncio.ensure_future(self.heartbeat())
+
     async def disconnect(self, close_code):
         if not self.scope["user"].is_anonymous:
+            if self.flush_task is not None:
+                self.flush_task.cancel()
+            self.heartbeat_task.cancel()
+            await presence.mark_offline(self.scope["user"].id)
             await self.channel_layer.group_discard(
                 f"user_{self.scope['user'].id}",
                 self.channel_name
             )
-    
+
+    async def heartbeat(self):
+        """접속 중인 동안 presence 만료 시간을 연장"""
+        while True:
+            await asyncio.sleep(settings.NOTIFICATION_PRESENCE_TTL / 2)
+            await presence.refresh(self.scope["user"].id)
+
     async def notification_message(self, event):
-        """알림 메시지 전송"""
-        await self.send_json(event["message"])
+        """알림 메시지를 모아 두고, 대기 중인 전송이 없으면 예약"""
+        if len(self.pending) == self.pending.maxlen:
+            self.dropped += 1
+        self.pending.append(event["message"])
+        if self.flush_task is None:
+            self.flush_task = asyncio.ensure_future(self.flush_later())
 
+    async def flush_later(self):
+        try:
+            await asyncio.sleep(settings.NOTIFICATION_COALESCE_MS / 1000)
+            # 전송을 기다리는 동안 들어온 알림도 이어서 보낸다
+            while self.pending:
+                messages = list(self.pending)
+                self.pending.clear()
+                if self.dropped:
+                    messages.append({"type": "notifications_dropped", "count": self.dropped})
+                    self.dropped = 0
+                await self.send_json(messages)
+        finally:
+            self.flush_task = None
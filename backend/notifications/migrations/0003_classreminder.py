@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-18 20:23
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('classes', '0003_danceclass_current_students_count'),
+        ('notifications', '0002_notification_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClassReminder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('starts_at', models.DateTimeField(verbose_name='수업 시작 시각')),
+                ('remind_at', models.DateTimeField(verbose_name='알림 시각')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='발송 시각')),
+                ('schedule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminders', to='classes.classschedule', verbose_name='수업 일정')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='class_reminders', to=settings.AUTH_USER_MODEL, verbose_name='수강생')),
+            ],
+            options={
+                'verbose_name': '수업 알림 예약',
+                'verbose_name_plural': '수업 알림 예약 목록',
+                'db_table': 'class_reminder',
+                'indexes': [models.Index(condition=models.Q(('sent_at__isnull', True)), fields=['remind_at'], name='class_reminder_pending_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='classreminder',
+            constraint=models.UniqueConstraint(fields=('student', 'schedule', 'starts_at'), name='unique_class_reminder'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-18 20:25
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('notifications', '0003_classreminder'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationDelivery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notification_type', models.CharField(choices=[('subscription_expiry', '수강권 만료 예정'), ('class_reminder', '수업 알림'), ('makeup_status', '보강 신청 상태 변경'), ('pause_status', '일시정지 신청 상태 변경'), ('announcement', '공지사항'), ('attendance', '출결 알림')], max_length=20, verbose_name='알림 종류')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='대상 id')),
+                ('occurrence_date', models.DateField(verbose_name='발생일')),
+                ('channel', models.CharField(choices=[('in_app', '앱 알림'), ('email', '이메일')], max_length=10, verbose_name='채널')),
+                ('claim', models.CharField(db_index=True, editable=False, max_length=32)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_deliveries', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '알림 발송 기록',
+                'verbose_name_plural': '알림 발송 기록 목록',
+                'db_table': 'notification_delivery',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='notificationdelivery',
+            constraint=models.UniqueConstraint(fields=('user', 'notification_type', 'object_id', 'occurrence_date', 'channel'), name='unique_notification_delivery'),
+        ),
+    ]
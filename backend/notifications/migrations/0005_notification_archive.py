@@ -0,0 +1,47 @@
+# Generated by Django 4.2.7 on 2026-10-18 20:30
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('notifications', '0004_notificationdelivery'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedNotification',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('notification_type', models.CharField(choices=[('subscription_expiry', '수강권 만료 예정'), ('class_reminder', '수업 알림'), ('makeup_status', '보강 신청 상태 변경'), ('pause_status', '일시정지 신청 상태 변경'), ('announcement', '공지사항'), ('attendance', '출결 알림')], max_length=20, verbose_name='알림 종류')),
+                ('title', models.CharField(max_length=200, verbose_name='제목')),
+                ('message', models.TextField(verbose_name='내용')),
+                ('link', models.CharField(blank=True, max_length=200, verbose_name='관련 링크')),
+                ('created_at', models.DateTimeField(verbose_name='생성 시각')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='보관 시각')),
+            ],
+            options={
+                'verbose_name': '보관된 알림',
+                'verbose_name_plural': '보관된 알림 목록',
+                'db_table': 'notification_archive',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('read', True)), fields=['created_at'], name='notification_read_created_idx'),
+        ),
+        migrations.AddField(
+            model_name='archivednotification',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_notifications', to=settings.AUTH_USER_MODEL, verbose_name='사용자'),
+        ),
+        migrations.AddIndex(
+            model_name='archivednotification',
+            index=models.Index(fields=['user', '-created_at'], name='notif_archive_user_idx'),
+        ),
+    ]
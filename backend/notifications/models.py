@@ -46,6 +46,22 @@ class Notification(models.Model):
         verbose_name = '알림'
         verbose_name_plural = '알림 목록'
         ordering = ['-created_at']
+        indexes = [
+            # 사용자 알림 목록 (최신순)
+            models.Index(fields=['user', '-created_at'], name='notification_user_created_idx'),
+            # 안 읽은 알림만 (배지 카운트, 안 읽은 목록)
+            models.Index(
+                fields=['user', '-created_at'],
+                condition=models.Q(read=False),
+                name='notification_unread_idx'
+            ),
+            # 보관 작업: 오래된 읽은 알림만 created_at 순으로
+            models.Index(
+                fields=['created_at'],
+                condition=models.Q(read=True),
+                name='notification_read_created_idx'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username}의 알림: {self.title}"
@@ -96,4 +112,139 @@ class NotificationPreference(models.Model):
         verbose_name_plural = '알림 설정 목록'
 
     def __str__(self):
-        return f"{self.user.username}의 알림 설정"
\ No newline at end of file
+        return f"{self.user.username}의 알림 설정"
+
+class ClassReminder(models.Model):
+    """
+    수업 시작 전 알림 예약 (하루 한 번 수업 일정 × 이용중 수강권으로 미리 생성)
+
+    알림 작업은 remind_at이 지난 미발송 행만 꺼내 보내므로 테이블 크기와 무관하다.
+    """
+    student = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='class_reminders',
+        verbose_name='수강생'
+    )
+    schedule = models.ForeignKey(
+        'classes.ClassSchedule',
+        on_delete=models.CASCADE,
+        related_name='reminders',
+        verbose_name='수업 일정'
+    )
+    starts_at = models.DateTimeField(verbose_name='수업 시작 시각')
+    remind_at = models.DateTimeField(verbose_name='알림 시각')
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name='발송 시각')
+
+    class Meta:
+        db_table = 'class_reminder'
+        verbose_name = '수업 알림 예약'
+        verbose_name_plural = '수업 알림 예약 목록'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['student', 'schedule', 'starts_at'],
+                name='unique_class_reminder'
+            )
+        ]
+        indexes = [
+            # 미발송 알림 중 시각이 된 것만 조회
+            models.Index(
+                fields=['remind_at'],
+                condition=models.Q(sent_at__isnull=True),
+                name='class_reminder_pending_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.student.username} - {self.schedule} ({self.starts_at})"
+
+    @property
+    def dance_class(self):
+        return self.schedule.dance_class
+
+class NotificationDelivery(models.Model):
+    """
+    알림 발송 기록 (중복 발송 방지용)
+
+    (사용자, 알림 종류, 대상 객체, 발생일, 채널)당 한 행만 존재할 수 있어서,
+    같은 작업이 재시도되거나 겹쳐 실행돼도 먼저 기록한 쪽만 발송한다.
+    """
+    CHANNEL_CHOICES = (
+        ('in_app', '앱 알림'),
+        ('email', '이메일'),
+    )
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='notification_deliveries',
+        verbose_name='사용자'
+    )
+    notification_type = models.CharField(
+        max_length=20,
+        choices=Notification.TYPE_CHOICES,
+        verbose_name='알림 종류'
+    )
+    # 알림 종류별 대상 객체 id (만료 알림: 수강권, 수업 알림: 수업 일정)
+    object_id = models.PositiveBigIntegerField(verbose_name='대상 id')
+    occurrence_date = models.DateField(verbose_name='발생일')
+    channel = models.CharField(
+        max_length=10,
+        choices=CHANNEL_CHOICES,
+        verbose_name='채널'
+    )
+    # 같은 실행에서 기록한 행을 구분하는 값
+    claim = models.CharField(max_length=32, db_index=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'notification_delivery'
+        verbose_name = '알림 발송 기록'
+        verbose_name_plural = '알림 발송 기록 목록'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'notification_type', 'object_id', 'occurrence_date', 'channel'],
+                name='unique_notification_delivery'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.notification_type}:{self.object_id} ({self.occurrence_date}, {self.channel})"
+
+
+class ArchivedNotification(models.Model):
+    """
+    보관된 알림 (읽은 지 오래된 알림을 notification 테이블에서 옮겨 둔 것)
+
+    읽은 알림만 옮기므로 읽음 여부는 저장하지 않고, 원래 알림 id를 그대로 써서
+    보관 작업이 중간에 끊겨 다시 실행돼도 같은 알림이 두 번 들어가지 않는다.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_notifications',
+        verbose_name='사용자'
+    )
+    notification_type = models.CharField(
+        max_length=20,
+        choices=Notification.TYPE_CHOICES,
+        verbose_name='알림 종류'
+    )
+    title = models.CharField(max_length=200, verbose_name='제목')
+    message = models.TextField(verbose_name='내용')
+    link = models.CharField(max_length=200, blank=True, verbose_name='관련 링크')
+    created_at = models.DateTimeField(verbose_name='생성 시각')
+    archived_at = models.DateTimeField(auto_now_add=True, verbose_name='보관 시각')
+
+    class Meta:
+        db_table = 'notification_archive'
+        verbose_name = '보관된 알림'
+        verbose_name_plural = '보관된 알림 목록'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at'], name='notif_archive_user_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}의 보관된 알림: {self.title}"
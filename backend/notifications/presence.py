@@ -0,0 +1,64 @@
+# backend/notifications/presence.py
+from django.conf import settings
+from django.core.cache import cache
+from backend.cache import is_shared
+
+# 웹소켓 접속 현황
+# 사용자별 키에 열린 연결 수를 원자적 incr/decr로 세고, 각 연결이
+# NOTIFICATION_PRESENCE_TTL의 절반마다 만료 시간을 연장한다. 비정상 종료로 줄지 않은 수는
+# 마지막 연결의 갱신이 멈춘 뒤 TTL이 지나면 키와 함께 사라진다.
+#
+# 접속 현황은 웹소켓 프로세스와 알림을 만드는 프로세스(웹 요청, Celery 워커)가 함께 봐야 하므로
+# 공유 캐시(CACHE_URL)가 필요하다. 프로세스별 로컬 메모리 캐시에서는 접속 여부를 알 수 없으므로
+# 모든 사용자를 접속 중으로 보고 전송한다.
+
+
+def presence_key(user_id):
+    return f'presence:user:{user_id}'
+
+
+async def mark_online(user_id):
+    """연결 등록"""
+    key = presence_key(user_id)
+    timeout = settings.NOTIFICATION_PRESENCE_TTL
+    if await cache.aadd(key, 1, timeout=timeout):
+        return
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        # 조회와 증가 사이에 만료된 경우
+        await cache.aadd(key, 1, timeout=timeout)
+        return
+    await cache.atouch(key, timeout=timeout)
+
+
+async def refresh(user_id):
+    """heartbeat: 만료 시간 연장. 이미 만료됐으면 이 연결 하나로 다시 등록"""
+    timeout = settings.NOTIFICATION_PRESENCE_TTL
+    if not await cache.atouch(presence_key(user_id), timeout=timeout):
+        await cache.aadd(presence_key(user_id), 1, timeout=timeout)
+
+
+async def mark_offline(user_id):
+    """
+    연결 해제
+
+    0이 되어도 키를 지우지 않는다. 지우는 사이에 다른 연결이 등록하면 그 연결까지 사라지므로,
+    0인 키는 접속하지 않은 것으로 보고 TTL에 맡긴다.
+    """
+    try:
+        await cache.adecr(presence_key(user_id))
+    except ValueError:
+        pass
+
+
+def online_user_ids(user_ids):
+    """user_ids 중 웹소켓이 열려 있는 사용자 (캐시 조회 1회)"""
+    user_ids = set(user_ids)
+    if not is_shared():
+        # 다른 프로세스의 접속은 보이지 않으므로 알 수 없음 → 모두 전송
+        return user_ids
+    keys = {presence_key(user_id): user_id for user_id in user_ids}
+    if not keys:
+        return set()
+    return {keys[key] for key, count in cache.get_many(list(keys)).items() if count > 0}
@@ -1,10 +1,11 @@
 # backend/notifications/serializers.py
 
 from rest_framework import serializers
-from .models import Notification, NotificationSetting
+from .models import Notification, NotificationPreference
 
 class NotificationSerializer(serializers.ModelSerializer):
-    type_display = serializers.CharField(source='get_type_display', read_only=True)
+    type = serializers.CharField(source='notification_type', read_only=True)
+    type_display = serializers.CharField(source='get_notification_type_display', read_only=True)
     created_at_display = serializers.SerializerMethodField()
 
     class Meta:
@@ -33,9 +34,16 @@ class NotificationSerializer(serializers.ModelSerializer):
         else:
             return obj.created_at.strftime('%Y-%m-%d')
 
+class NotificationBulkReadSerializer(serializers.Serializer):
+    """일괄 읽음 처리 조건 (없으면 전체)"""
+    type = serializers.ChoiceField(choices=Notification.TYPE_CHOICES, required=False)
+    before = serializers.DateTimeField(required=False)
+
 class NotificationSettingSerializer(serializers.ModelSerializer):
+    email_notification = serializers.BooleanField(source='email_notifications', required=False)
+
     class Meta:
-        model = NotificationSetting
+        model = NotificationPreference
         fields = (
             'email_notification', 'subscription_expiry', 'class_reminder',
             'pause_status', 'makeup_status', 'announcement'
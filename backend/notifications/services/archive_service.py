@@ -0,0 +1,43 @@
+# backend/notifications/services/archive_service.py
+from django.conf import settings
+from django.db import transaction
+from ..models import ArchivedNotification, Notification, NotificationDelivery
+
+
+class NotificationArchiveService:
+    @staticmethod
+    def archive(before, batch_size=None):
+        """
+        before 이전에 생성된 읽은 알림을 보관 테이블로 옮기고, 옮긴 수 반환
+
+        batch_size개씩 (조회 → 보관 INSERT → 원본 DELETE)를 한 트랜잭션으로 처리해
+        테이블을 오래 잠그지 않는다. 이미 보관된 id는 건너뛰므로 중간에 끊겨도 다시 실행하면 된다.
+        """
+        batch_size = batch_size or settings.NOTIFICATION_ARCHIVE_BATCH_SIZE
+        total = 0
+        while True:
+            with transaction.atomic():
+                batch = list(
+                    Notification.objects.filter(
+                        read=True,
+                        created_at__lt=before
+                    ).order_by('created_at').values(
+                        'id', 'user_id', 'notification_type', 'title',
+                        'message', 'link', 'created_at'
+                    )[:batch_size]
+                )
+                if not batch:
+                    return total
+
+                ArchivedNotification.objects.bulk_create(
+                    [ArchivedNotification(**row) for row in batch],
+                    ignore_conflicts=True
+                )
+                Notification.objects.filter(id__in=[row['id'] for row in batch]).delete()
+            total += len(batch)
+
+    @staticmethod
+    def prune_deliveries(before):
+        """발생일이 before 이전인 발송 기록 삭제 (재시도될 일이 없는 기록)"""
+        deleted, _ = NotificationDelivery.objects.filter(occurrence_date__lt=before).delete()
+        return deleted
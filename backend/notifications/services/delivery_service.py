@@ -0,0 +1,70 @@
+# backend/notifications/services/delivery_service.py
+from uuid import uuid4
+
+from django.db.models import Q
+from ..models import NotificationDelivery
+
+
+class DeliveryLedgerService:
+    @staticmethod
+    def claim(channel, notification_type, keys):
+        """
+        발송 기록을 선점하고, 이번 호출이 선점한 키만 반환
+
+        keys: {(user_id, object_id, occurrence_date), ...}
+
+        한 번의 INSERT(충돌 무시)로 기록하고 이번 호출의 claim 값으로 다시 조회하므로,
+        이미 보낸 키나 동시에 실행 중인 다른 작업이 먼저 기록한 키는 제외된다.
+        """
+        keys = set(keys)
+        if not keys:
+            return set()
+
+        claim = uuid4().hex
+        NotificationDelivery.objects.bulk_create([
+            NotificationDelivery(
+                user_id=user_id,
+                notification_type=notification_type,
+                object_id=object_id,
+                occurrence_date=occurrence_date,
+                channel=channel,
+                claim=claim
+            )
+            for user_id, object_id, occurrence_date in keys
+        ], ignore_conflicts=True)
+
+        return set(
+            NotificationDelivery.objects.filter(claim=claim).values_list(
+                'user_id', 'object_id', 'occurrence_date'
+            )
+        )
+
+    @staticmethod
+    def claim_items(channel, notification_type, items, key):
+        """
+        items 중 이번 호출이 선점한 것만 순서대로 반환
+
+        key(item) -> (user_id, object_id, occurrence_date). 같은 키가 여러 번 있으면 첫 항목만 남긴다.
+        """
+        unique = {}
+        for item in items:
+            unique.setdefault(key(item), item)
+        claimed = DeliveryLedgerService.claim(channel, notification_type, unique.keys())
+        return [item for item_key, item in unique.items() if item_key in claimed]
+
+    @staticmethod
+    def release(channel, notification_type, keys):
+        """
+        발송하지 못한 키의 기록을 지워 다음 실행에서 다시 선점할 수 있게 한다
+
+        keys: {(user_id, object_id, occurrence_date), ...}. 지운 기록 수 반환
+        """
+        query = Q()
+        for user_id, object_id, occurrence_date in set(keys):
+            query |= Q(user_id=user_id, object_id=object_id, occurrence_date=occurrence_date)
+        if not query:
+            return 0
+        deleted, _ = NotificationDelivery.objects.filter(
+            query, channel=channel, notification_type=notification_type
+        ).delete()
+        return deleted
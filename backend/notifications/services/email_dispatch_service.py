@@ -0,0 +1,158 @@
+# backend/notifications/services/email_dispatch_service.py
+import logging
+import smtplib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import EmailMultiAlternatives, get_connection
+from backend.cache import is_shared
+
+logger = logging.getLogger(__name__)
+
+
+def is_transient(error):
+    """재시도하면 성공할 수 있는 오류인지 (연결 끊김, 4xx 응답, 네트워크 오류)"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return False
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, smtplib.SMTPException):
+        return False
+    return isinstance(error, OSError)
+
+
+class RateLimiter:
+    """
+    분당 발송 수 제한 (0이면 제한 없음)
+
+    공유 캐시(CACHE_URL)가 있으면 모든 워커의 발송을 1분 단위 카운터로 함께 센다.
+    로컬 메모리 캐시에서는 프로세스마다 따로 제한하므로, 워커가 여러 개면
+    EMAIL_RATE_LIMIT_PER_MINUTE를 워커 수로 나눈 값으로 설정해야 한다.
+    """
+    key_prefix = 'email-rate'
+
+    def __init__(self, per_minute):
+        self.per_minute = per_minute
+        self.interval = 60 / per_minute if per_minute else 0
+        self.next_at = 0
+        self.shared = bool(per_minute) and is_shared()
+
+    def wait(self):
+        if not self.interval:
+            return
+        if self.shared:
+            self._wait_shared()
+            return
+        now = time.monotonic()
+        if self.next_at > now:
+            time.sleep(self.next_at - now)
+        self.next_at = max(now, self.next_at) + self.interval
+
+    def _wait_shared(self):
+        while True:
+            now = time.time()
+            window = int(now // 60)
+            key = f'{self.key_prefix}:{window}'
+            cache.add(key, 0, 120)
+            try:
+                if cache.incr(key) <= self.per_minute:
+                    return
+            except ValueError:
+                # add와 incr 사이에 키가 만료된 경우 다시 시도
+                continue
+            time.sleep((window + 1) * 60 - now)
+
+
+class EmailDispatchService:
+    """
+    이메일 일괄 발송
+
+    - EMAIL_BATCH_SIZE개씩 SMTP 연결 하나를 열어 재사용 (메시지마다 TLS 핸드셰이크 X)
+    - EMAIL_RATE_LIMIT_PER_MINUTE로 메일 서버 발송 한도에 맞춰 속도 조절 (RateLimiter 참고)
+    - 일시적 오류는 EMAIL_RETRY_BACKOFF * 2^n 초 뒤 최대 EMAIL_MAX_RETRIES번 재시도
+    요청 처리 중에는 호출하지 않고 Celery 작업(send_emails 등)에서만 사용한다.
+    """
+
+    @staticmethod
+    def build_message(payload):
+        """작업 큐로 넘긴 dict(subject, body, to, html)로 메시지 생성"""
+        message = EmailMultiAlternatives(
+            subject=payload['subject'],
+            body=payload['body'],
+            from_email=payload.get('from_email') or settings.DEFAULT_FROM_EMAIL,
+            to=payload['to']
+        )
+        if payload.get('html'):
+            message.attach_alternative(payload['html'], 'text/html')
+        return message
+
+    @staticmethod
+    def send(messages):
+        """
+        메시지 목록 발송. (발송 수, 최종 실패 메시지 목록) 반환
+
+        실패 목록은 입력으로 받은 메시지 객체 그대로이므로 호출한 쪽에서 원본 항목을 찾을 수 있다.
+        """
+        limiter = RateLimiter(settings.EMAIL_RATE_LIMIT_PER_MINUTE)
+        batch_size = settings.EMAIL_BATCH_SIZE
+        pending = list(messages)
+        sent_count = 0
+        failed = []
+
+        for attempt in range(settings.EMAIL_MAX_RETRIES + 1):
+            if attempt:
+                time.sleep(settings.EMAIL_RETRY_BACKOFF * 2 ** (attempt - 1))
+
+            retry = []
+            for i in range(0, len(pending), batch_size):
+                sent, batch_retry, batch_failed = EmailDispatchService._send_batch(
+                    pending[i:i + batch_size], limiter
+                )
+                sent_count += sent
+                retry += batch_retry
+                failed += batch_failed
+
+            pending = retry
+            if not pending:
+                break
+            if attempt < settings.EMAIL_MAX_RETRIES:
+                logger.warning('이메일 %d건 일시적 오류, 재시도 %d회차', len(pending), attempt + 1)
+
+        if pending:
+            logger.error('이메일 %d건 재시도 횟수 초과', len(pending))
+        return sent_count, failed + pending
+
+    @staticmethod
+    def _send_batch(messages, limiter):
+        """연결 하나로 배치 발송. (발송 수, 재시도할 메시지, 실패 메시지) 반환"""
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception as error:
+            if is_transient(error):
+                return 0, list(messages), []
+            logger.error('메일 서버 연결 실패: %s', error)
+            return 0, [], list(messages)
+
+        sent = 0
+        failed = []
+        try:
+            for index, message in enumerate(messages):
+                limiter.wait()
+                try:
+                    sent += connection.send_messages([message])
+                except Exception as error:
+                    if is_transient(error):
+                        # 연결이 끊겼을 수 있으므로 남은 메시지는 새 연결로 재시도
+                        return sent, list(messages[index:]), failed
+                    logger.warning('이메일 발송 실패 (%s): %s', message.to, error)
+                    failed.append(message)
+        finally:
+            try:
+                connection.close()
+            except Exception:
+                pass
+        return sent, [], failed
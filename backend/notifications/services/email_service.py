@@ -1,62 +1,67 @@
 # backend/notifications/services/email_service.py
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
+import logging
+
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from .email_template_service import EmailTemplateService
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIPTION_EXPIRY_SUBJECT = '[Dance Academy] 수강권 만료 예정 알림'
+CLASS_REMINDER_SUBJECT = '[Dance Academy] 오늘의 수업 알림'
+
 
 class EmailService:
+    @staticmethod
+    def build_payloads(template_name, subject, recipients, shared_context=None):
+        """
+        템플릿 이메일 발송 작업용 payload 목록
+
+        recipients: [(to_email, context), ...] — 배치 전체를 한 번에 렌더링한다.
+        """
+        shared_context = {'subject': subject, **(shared_context or {})}
+        rendered = EmailTemplateService.render_batch(
+            template_name, [context for _, context in recipients], shared_context
+        )
+        return [
+            {
+                'subject': subject,
+                'body': text_content,
+                'html': html_content,
+                'to': [to_email],
+            }
+            for (to_email, _), (html_content, text_content) in zip(recipients, rendered)
+        ]
+
     @staticmethod
     async def send_template_email(to_email, template_name, context, subject):
-        """HTML 템플릿 기반 이메일 발송"""
+        """HTML 템플릿 기반 이메일 발송 (렌더링 후 발송 작업 큐에 등록)"""
+        from ..tasks import send_emails
+
         try:
-            # HTML 이메일 렌더링
-            html_content = render_to_string(
-                f'notifications/email/{template_name}.html',
-                context
-            )
-            # 플레인 텍스트 버전 생성
-            text_content = strip_tags(html_content)
-            
-            # 이메일 메시지 생성
-            msg = EmailMultiAlternatives(
-                subject=subject,
-                body=text_content,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[to_email]
+            payloads = EmailService.build_payloads(
+                template_name, subject, [(to_email, context)]
             )
-            
-            # HTML 버전 추가
-            msg.attach_alternative(html_content, "text/html")
-            
-            # 이메일 발송
-            await msg.send()
+            # 발송은 워커에서 SMTP 연결을 재사용해 처리
+            await sync_to_async(send_emails.delay)(payloads)
             return True
-            
-        except Exception as e:
-            print(f"Failed to send email: {str(e)}")
+
+        except Exception:
+            logger.exception('이메일 발송 작업 등록 실패 (%s, %s)', to_email, template_name)
             return False
 
     @staticmethod
-    async def send_subscription_expiry_email(subscription):
-        """수강권 만료 알림 이메일"""
-        context = {
+    def subscription_expiry_context(subscription):
+        return {
             'student_name': subscription.student.get_full_name() or subscription.student.username,
             'class_name': subscription.dance_class.name,
             'expiry_date': subscription.end_date.strftime('%Y-%m-%d'),
             'renewal_url': f"{settings.FRONTEND_URL}/subscriptions/{subscription.id}/renew",
         }
-        
-        await EmailService.send_template_email(
-            to_email=subscription.student.email,
-            template_name='subscription_expiry',
-            context=context,
-            subject='[Dance Academy] 수강권 만료 예정 알림'
-        )
 
     @staticmethod
-    async def send_class_reminder_email(attendance):
-        """수업 알림 이메일"""
-        context = {
+    def class_reminder_context(attendance):
+        return {
             'student_name': attendance.student.get_full_name() or attendance.student.username,
             'class_name': attendance.dance_class.name,
             'class_time': attendance.schedule.start_time.strftime('%H:%M'),
@@ -64,10 +69,47 @@ class EmailService:
             'instructor_name': attendance.dance_class.instructor.get_full_name(),
             'class_url': f"{settings.FRONTEND_URL}/classes/{attendance.dance_class.id}",
         }
-        
+
+    @staticmethod
+    def subscription_expiry_payloads(subscriptions):
+        """수강권 만료 알림 이메일 일괄 렌더링"""
+        return EmailService.build_payloads(
+            'subscription_expiry',
+            SUBSCRIPTION_EXPIRY_SUBJECT,
+            [
+                (subscription.student.email, EmailService.subscription_expiry_context(subscription))
+                for subscription in subscriptions
+            ]
+        )
+
+    @staticmethod
+    def class_reminder_payloads(reminders):
+        """수업 알림 이메일 일괄 렌더링 (출석 기록/알림 예약 모두 사용 가능)"""
+        return EmailService.build_payloads(
+            'class_reminder',
+            CLASS_REMINDER_SUBJECT,
+            [
+                (reminder.student.email, EmailService.class_reminder_context(reminder))
+                for reminder in reminders
+            ]
+        )
+
+    @staticmethod
+    async def send_subscription_expiry_email(subscription):
+        """수강권 만료 알림 이메일"""
+        await EmailService.send_template_email(
+            to_email=subscription.student.email,
+            template_name='subscription_expiry',
+            context=EmailService.subscription_expiry_context(subscription),
+            subject=SUBSCRIPTION_EXPIRY_SUBJECT
+        )
+
+    @staticmethod
+    async def send_class_reminder_email(attendance):
+        """수업 알림 이메일"""
         await EmailService.send_template_email(
             to_email=attendance.student.email,
             template_name='class_reminder',
-            context=context,
-            subject='[Dance Academy] 오늘의 수업 알림'
-        )
\ No newline at end of file
+            context=EmailService.class_reminder_context(attendance),
+            subject=CLASS_REMINDER_SUBJECT
+        )
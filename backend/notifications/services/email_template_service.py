@@ -0,0 +1,49 @@
+# backend/notifications/services/email_template_service.py
+from functools import lru_cache
+
+from django.template import Context
+from django.template.loader import get_template
+
+TEMPLATE_DIR = 'notifications/email'
+
+
+@lru_cache(maxsize=None)
+def compiled_templates(name):
+    """
+    알림 종류별 (HTML, 텍스트) 템플릿을 한 번만 찾아 컴파일해 둔다
+
+    텍스트 본문은 HTML에서 태그를 벗기지 않고 별도 .txt 템플릿으로 렌더링한다.
+    템플릿 파일을 수정하면 워커를 재시작해야 반영된다.
+    """
+    return (
+        get_template(f'{TEMPLATE_DIR}/{name}.html').template,
+        get_template(f'{TEMPLATE_DIR}/{name}.txt').template,
+    )
+
+
+class EmailTemplateService:
+    @staticmethod
+    def render(name, context, shared_context=None):
+        """수신자 한 명의 (HTML, 텍스트) 본문"""
+        return EmailTemplateService.render_batch(name, [context], shared_context)[0]
+
+    @staticmethod
+    def render_batch(name, contexts, shared_context=None):
+        """
+        여러 수신자의 (HTML, 텍스트) 본문을 한 번에 렌더링
+
+        컴파일된 템플릿과 공통 컨텍스트(shared_context)는 배치 전체에서 재사용하고,
+        수신자별 값만 컨텍스트에 push/pop 한다.
+        """
+        html_template, text_template = compiled_templates(name)
+        html_context = Context(shared_context or {})
+        text_context = Context(shared_context or {}, autoescape=False)
+
+        rendered = []
+        for context in contexts:
+            with html_context.push(context):
+                html = html_template.render(html_context)
+            with text_context.push(context):
+                text = text_template.render(text_context)
+            rendered.append((html, text))
+        return rendered
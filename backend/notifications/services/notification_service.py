@@ -0,0 +1,300 @@
+# backend/notifications/services/notification_service.py
+import asyncio
+
+from channels.layers import get_channel_layer
+from asgiref.sync import async_to_sync, sync_to_async
+from django.db import transaction
+from django.utils import timezone
+from .. import presence, unread
+from ..models import Notification, NotificationPreference
+from .delivery_service import DeliveryLedgerService
+
+# 한 번에 동시에 보내는 channel layer 메시지 수
+PUSH_CONCURRENCY = 100
+
+
+def notification_group(user_id):
+    return f"user_{user_id}"
+
+
+def notification_event(notification):
+    """웹소켓으로 보내는 알림 메시지"""
+    return {
+        "type": "notification_message",
+        "message": {
+            "id": notification.id,
+            "type": notification.notification_type,
+            "title": notification.title,
+            "message": notification.message,
+            "link": notification.link,
+            "created_at": notification.created_at.isoformat()
+        }
+    }
+
+
+def unread_delta_event(delta):
+    """안 읽은 알림 수 변경 메시지 (새 알림 메시지는 +1로 취급하므로 읽음 처리 등에만 사용)"""
+    return {
+        "type": "notification_message",
+        "message": {
+            "type": "unread_delta",
+            "delta": delta
+        }
+    }
+
+
+async def push_notifications(notifications):
+    """알림들을 PUSH_CONCURRENCY개씩 묶어 동시에 group_send"""
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+    for i in range(0, len(notifications), PUSH_CONCURRENCY):
+        await asyncio.gather(*(
+            channel_layer.group_send(
+                notification_group(notification.user_id),
+                notification_event(notification)
+            )
+            for notification in notifications[i:i + PUSH_CONCURRENCY]
+        ))
+
+
+def delivery_key(entry):
+    return (entry['user'].id, entry['object_id'], entry['occurrence_date'])
+
+
+def wants_email(preference, notification_type, user):
+    """
+    이메일 발송 여부 (앱 알림 생성과 웹소켓 전송은 설정과 관계없이 항상 한다)
+
+    이메일 알림과 해당 종류의 알림이 모두 켜져 있고 이메일 주소가 있어야 보낸다.
+    """
+    return bool(
+        preference.email_notifications
+        and getattr(preference, notification_type, True)
+        and user.email
+    )
+
+
+class NotificationService:
+    @staticmethod
+    def get_preferences(user_ids):
+        """
+        사용자별 알림 설정을 한 번에 조회
+
+        설정 행이 없는 사용자는 모델 기본값(모두 허용)을 따른다.
+        """
+        preferences = {
+            preference.user_id: preference
+            for preference in NotificationPreference.objects.filter(user_id__in=user_ids)
+        }
+        return {
+            user_id: preferences.get(user_id) or NotificationPreference(user_id=user_id)
+            for user_id in user_ids
+        }
+
+    @staticmethod
+    def bulk_notify(notification_type, entries):
+        """
+        여러 사용자에게 같은 종류의 알림을 일괄 생성
+
+        entries: [{'user': User, 'object_id': 대상 id, 'occurrence_date': 발생일,
+                   'title': ..., 'message': ..., 'link': ...}, ...]
+
+        발송 기록(NotificationDelivery)에 이미 있는 (사용자, 대상, 발생일)은 건너뛰어
+        재시도/중복 실행돼도 알림이 두 번 생기지 않는다.
+        설정 조회 1회 + 발송 기록 2회 + bulk_create 1회로 저장하고, 웹소켓 전송은 한 이벤트 루프에서
+        묶어서 보낸다. 설정은 create_notification과 같이 이메일에만 적용한다(wants_email).
+        이메일은 여기서 보내지 않고, 이메일 수신을 허용한 entry 목록
+        (entry['notification']에 생성된 알림)을 돌려주어 별도 발송 작업에 넘긴다.
+        """
+        preferences = NotificationService.get_preferences(
+            {entry['user'].id for entry in entries}
+        )
+
+        with transaction.atomic():
+            entries = DeliveryLedgerService.claim_items(
+                'in_app', notification_type, entries, delivery_key
+            )
+            if not entries:
+                return []
+
+            notifications = Notification.objects.bulk_create([
+                Notification(
+                    user=entry['user'],
+                    notification_type=notification_type,
+                    title=entry['title'],
+                    message=entry['message'],
+                    link=entry.get('link', '')
+                )
+                for entry in entries
+            ])
+            unread.invalidate_unread_counts_on_commit(
+                {notification.user_id for notification in notifications}
+            )
+        for entry, notification in zip(entries, notifications):
+            entry['notification'] = notification
+
+        # 웹소켓이 열려 있지 않은 사용자는 전송 생략 (다음 목록 조회 때 확인)
+        online = presence.online_user_ids({notification.user_id for notification in notifications})
+        online_targets = [
+            notification for notification in notifications
+            if notification.user_id in online
+        ]
+        # 호출한 쪽 트랜잭션이 롤백되면 없는 알림을 보내지 않도록 커밋 후 전송
+        transaction.on_commit(lambda: async_to_sync(push_notifications)(online_targets))
+
+        return [
+            entry for entry in entries
+            if wants_email(preferences[entry['user'].id], notification_type, entry['user'])
+        ]
+
+    @staticmethod
+    def mark_read(user_id, **filters):
+        """
+        사용자의 안 읽은 알림을 UPDATE 한 번으로 읽음 처리. 처리한 수 반환
+
+        커밋 후 안 읽은 알림 수 캐시를 지우고, 접속 중이면 변경분을 웹소켓으로 보낸다.
+        """
+        updated = Notification.objects.filter(
+            user_id=user_id, read=False, **filters
+        ).update(read=True)
+        if updated:
+            unread.invalidate_unread_counts_on_commit({user_id})
+            transaction.on_commit(
+                lambda: NotificationService.push_unread_delta(user_id, -updated)
+            )
+        return updated
+
+    @staticmethod
+    def push_unread_delta(user_id, delta):
+        """안 읽은 알림 수 변경분 전송 (웹소켓이 열려 있는 경우만)"""
+        if not presence.online_user_ids({user_id}):
+            return
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+        async_to_sync(channel_layer.group_send)(
+            notification_group(user_id),
+            unread_delta_event(delta)
+        )
+
+    @staticmethod
+    def create_subscription_expiry_notifications(subscriptions):
+        """수강권 만료 알림 일괄 생성. 이메일 발송 대상 수강권 목록 반환"""
+        email_entries = NotificationService.bulk_notify('subscription_expiry', [
+            {
+                'subscription': subscription,
+                'user': subscription.student,
+                'object_id': subscription.id,
+                'occurrence_date': subscription.end_date,
+                'title': '수강권 만료 예정',
+                'message': f'{subscription.dance_class.name} 수업의 수강권이 7일 후 만료됩니다.',
+                'link': f'/subscriptions/{subscription.id}'
+            }
+            for subscription in subscriptions
+        ])
+        return [entry['subscription'] for entry in email_entries]
+
+    @staticmethod
+    def create_class_reminder_notifications(reminders):
+        """수업 알림 일괄 생성. 이메일 발송 대상 알림 예약 목록 반환"""
+        email_entries = NotificationService.bulk_notify('class_reminder', [
+            {
+                'reminder': reminder,
+                'user': reminder.student,
+                'object_id': reminder.schedule_id,
+                'occurrence_date': timezone.localtime(reminder.starts_at).date(),
+                'title': '수업 알림',
+                'message': f'오늘 {timezone.localtime(reminder.starts_at).strftime("%H:%M")}에 {reminder.dance_class.name} 수업이 있습니다.',
+                'link': f'/classes/{reminder.dance_class.id}'
+            }
+            for reminder in reminders
+        ])
+        return [entry['reminder'] for entry in email_entries]
+
+    @staticmethod
+    async def create_notification(user, type, title, message, link=''):
+        """알림 생성 및 실시간 전송"""
+        notification = await Notification.objects.acreate(
+            user=user,
+            notification_type=type,
+            title=title,
+            message=message,
+            link=link
+        )
+        await sync_to_async(unread.invalidate_unread_counts_on_commit)({user.id})
+
+        # 웹소켓으로 실시간 알림 전송 (접속 중인 경우만)
+        if await sync_to_async(presence.online_user_ids)({user.id}):
+            channel_layer = get_channel_layer()
+            await channel_layer.group_send(
+                notification_group(user.id),
+                notification_event(notification)
+            )
+        
+        # 사용자의 알림 설정 확인
+        user_settings = (
+            await sync_to_async(NotificationService.get_preferences)({user.id})
+        )[user.id]
+        
+        # 이메일 알림이 활성화되어 있고, 해당 타입의 알림이 활성화된 경우
+        # 발송은 워커에서 (요청 처리가 SMTP를 기다리지 않도록)
+        if wants_email(user_settings, type, user):
+            from ..tasks import send_notification_emails
+            await sync_to_async(send_notification_emails.delay)([notification.id])
+
+        return notification
+
+    @staticmethod
+    async def create_class_reminder_notification(attendance):
+        """수업 알림 생성"""
+        await NotificationService.create_notification(
+            user=attendance.student,
+            type='class_reminder',
+            title='수업 알림',
+            message=f'오늘 {attendance.schedule.start_time.strftime("%H:%M")}에 {attendance.dance_class.name} 수업이 있습니다.',
+            link=f'/classes/{attendance.dance_class.id}'
+        )
+
+    @staticmethod
+    async def create_subscription_expiry_notification(subscription):
+        """수강권 만료 알림 생성"""
+        await NotificationService.create_notification(
+            user=subscription.student,
+            type='subscription_expiry',
+            title='수강권 만료 예정',
+            message=f'{subscription.dance_class.name} 수업의 수강권이 7일 후 만료됩니다.',
+            link=f'/subscriptions/{subscription.id}'
+        )
+
+    @staticmethod
+    async def create_pause_status_notification(subscription, status):
+        """일시정지 상태 변경 알림 생성"""
+        message = (
+            '일시정지가 승인되었습니다.' if status == 'paused'
+            else '수강이 재개되었습니다.'
+        )
+        await NotificationService.create_notification(
+            user=subscription.student,
+            type='pause_status',
+            title='일시정지 상태 변경',
+            message=f'{subscription.dance_class.name} 수업의 {message}',
+            link=f'/subscriptions/{subscription.id}'
+        )
+
+    @staticmethod
+    async def create_makeup_status_notification(makeup_class, status):
+        """보강 상태 변경 알림 생성"""
+        message = {
+            'approved': '보강 신청이 승인되었습니다.',
+            'rejected': '보강 신청이 거절되었습니다.',
+            'completed': '보강이 완료되었습니다.'
+        }.get(status, '')
+
+        await NotificationService.create_notification(
+            user=makeup_class.student,
+            type='makeup_status',
+            title='보강 상태 변경',
+            message=message,
+            link=f'/makeup/{makeup_class.id}'
+        )
\ No newline at end of file
@@ -0,0 +1,77 @@
+# backend/notifications/services/reminder_service.py
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from subscriptions.models import Subscription
+from ..models import ClassReminder
+
+
+class ClassReminderService:
+    @staticmethod
+    def plan(day):
+        """
+        day 하루의 수업 알림 예약 생성
+
+        해당 요일 수업 일정 × 그날 유효한 이용중 수강권을 한 번의 조회로 펼쳐
+        (수강생, 일정, 시작 시각) 단위로 저장한다. 이미 있는 예약은 건너뛰므로
+        같은 날을 여러 번 계획해도 안전하다. 생성 시도한 예약 수 반환.
+        """
+        lead = timedelta(minutes=settings.CLASS_REMINDER_LEAD_MINUTES)
+        rows = Subscription.objects.filter(
+            status='active',
+            start_date__lte=day,
+            end_date__gte=day,
+            dance_class__schedules__weekday=day.weekday()
+        ).order_by().values_list(
+            'student_id',
+            'dance_class__schedules__id',
+            'dance_class__schedules__start_time'
+        ).distinct()
+
+        reminders = []
+        for student_id, schedule_id, start_time in rows:
+            starts_at = timezone.make_aware(datetime.combine(day, start_time))
+            reminders.append(ClassReminder(
+                student_id=student_id,
+                schedule_id=schedule_id,
+                starts_at=starts_at,
+                remind_at=starts_at - lead
+            ))
+        ClassReminder.objects.bulk_create(reminders, ignore_conflicts=True)
+        return len(reminders)
+
+    @staticmethod
+    def prune(before):
+        """before 이전에 시작한 수업의 예약 삭제"""
+        deleted, _ = ClassReminder.objects.filter(starts_at__lt=before).delete()
+        return deleted
+
+    @staticmethod
+    def pop_due(now=None):
+        """
+        알림 시각이 된 미발송 예약을 발송 처리하고 반환
+
+        이미 시작한 수업의 예약(워커 중단 등으로 밀린 것)은 보내지 않고 발송 처리만 한다.
+        겹쳐 실행된 작업끼리는 잠긴 행을 건너뛰므로 같은 예약을 두 번 꺼내지 않는다.
+        알림 생성과 같은 트랜잭션 안에서 호출해야 한다. 알림을 만들기 전에 실패하면
+        발송 처리도 함께 롤백되어 다음 실행에서 다시 꺼낸다. (send_class_reminders 참고)
+        """
+        now = now or timezone.now()
+        with transaction.atomic():
+            due = list(
+                ClassReminder.objects.select_for_update(
+                    skip_locked=True, of=('self',)
+                ).filter(
+                    sent_at__isnull=True,
+                    remind_at__lte=now
+                ).select_related(
+                    'student', 'schedule__dance_class__instructor'
+                ).order_by('remind_at')
+            )
+            ClassReminder.objects.filter(
+                id__in=[reminder.id for reminder in due]
+            ).update(sent_at=now)
+
+        return [reminder for reminder in due if reminder.starts_at > now]
@@ -1,57 +1,203 @@
 # backend/notifications/tasks.py
+import logging
+
 from celery import shared_task
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
-from datetime import timedelta
+from datetime import datetime, time, timedelta
 from django.db.models import Q
 from subscriptions.models import Subscription
 from classes.models import ClassSchedule
-from attendance.models import Attendance
-from .services import NotificationService
-from celery.schedules import crontab
-from backend.celery import app
+from .models import ClassReminder, Notification
+from .services.archive_service import NotificationArchiveService
+from .services.delivery_service import DeliveryLedgerService
+from .services.email_dispatch_service import EmailDispatchService
+from .services.email_service import EmailService
+from .services.notification_service import NotificationService
+from .services.reminder_service import ClassReminderService
+
+logger = logging.getLogger(__name__)
+
+# 만료 알림을 한 번에 처리하는 수강권 수
+EXPIRY_BATCH_SIZE = 500
+
+
+def _send_messages(task_name, messages):
+    """일괄 발송 후 최종 실패한 메시지를 기록. (발송 수, 실패 메시지 목록) 반환"""
+    sent, failed = EmailDispatchService.send(messages)
+    if failed:
+        logger.error(
+            '%s: 이메일 %d건 발송 실패 (%s)', task_name, len(failed),
+            ', '.join(address for message in failed for address in message.to)
+        )
+    return sent, failed
+
+
+def _send_claimed(task_name, notification_type, items, messages, key):
+    """
+    발송 기록을 선점한 항목(items)과 그 메시지(messages, 같은 순서)를 발송
+
+    최종 실패한 항목은 발송 기록을 풀어, 같은 작업을 다시 실행하면 그 항목만 다시 보낸다.
+    """
+    sent, failed = _send_messages(task_name, messages)
+    failed_messages = {id(message) for message in failed}
+    DeliveryLedgerService.release('email', notification_type, [
+        key(item) for item, message in zip(items, messages)
+        if id(message) in failed_messages
+    ])
+    return sent
+
+
+def _notification_email_key(notification):
+    return (notification.user_id, notification.id, timezone.localtime(notification.created_at).date())
+
+
+def _expiry_email_key(subscription):
+    return (subscription.student_id, subscription.id, subscription.end_date)
+
+
+def _reminder_email_key(reminder):
+    return (reminder.student_id, reminder.schedule_id, timezone.localtime(reminder.starts_at).date())
 
 @shared_task
-async def check_subscription_expiry():
-    """수강권 만료 예정 알림"""
-    expiry_date = timezone.now().date() + timedelta(days=7)
-    subscriptions = await Subscription.objects.filter(
+def check_subscription_expiry():
+    """수강권 만료 예정 알림 (배치 단위로 일괄 생성 후 이메일은 별도 작업으로 발송)"""
+    expiry_date = timezone.localdate() + timedelta(days=7)
+    subscriptions = Subscription.objects.filter(
         status='active',
         end_date=expiry_date
-    ).select_related('student', 'dance_class').all()
-    
-    for subscription in subscriptions:
-        await NotificationService.create_subscription_expiry_notification(subscription)
-
-@shared_task
-async def send_class_reminders():
-    """수업 시작 알림"""
-    now = timezone.now()
-    today = now.date()
-    
-    # 오늘의 출석 기록 조회
-    attendances = await Attendance.objects.filter(
-        date=today,
-        schedule__start_time__gte=now.time(),
-        schedule__start_time__lte=(now + timedelta(minutes=30)).time(),
-        status='pending'  # 아직 출석 체크가 안된 기록
-    ).select_related(
-        'student',
-        'dance_class',
-        'schedule'
-    ).all()
-    
-    # 각 출석 기록에 대해 알림 전송
-    for attendance in attendances:
-        await NotificationService.create_class_reminder_notification(attendance)
-
-# Celery Beat 스케줄 설정을 위한 업데이트
-app.conf.beat_schedule = {
-    'check-subscription-expiry': {
-        'task': 'notifications.tasks.check_subscription_expiry',
-        'schedule': crontab(hour=9, minute=0)  # 매일 오전 9시
-    },
-    'send-class-reminders': {
-        'task': 'notifications.tasks.send_class_reminders',
-        'schedule': crontab(minute='*/30')  # 30분마다
-    },
-}
\ No newline at end of file
+    ).select_related('student', 'dance_class').order_by('id')
+
+    batch = []
+    total = 0
+    for subscription in subscriptions.iterator(chunk_size=EXPIRY_BATCH_SIZE):
+        batch.append(subscription)
+        if len(batch) == EXPIRY_BATCH_SIZE:
+            total += _notify_expiry_batch(batch)
+            batch = []
+    if batch:
+        total += _notify_expiry_batch(batch)
+    return total
+
+def _notify_expiry_batch(subscriptions):
+    email_subscriptions = NotificationService.create_subscription_expiry_notifications(subscriptions)
+    if email_subscriptions:
+        send_subscription_expiry_emails.delay(
+            [subscription.id for subscription in email_subscriptions]
+        )
+    return len(subscriptions)
+
+@shared_task
+def send_notification_emails(notification_ids):
+    """알림 이메일 일괄 발송"""
+    notifications = Notification.objects.filter(
+        id__in=notification_ids
+    ).select_related('user')
+
+    sent = 0
+    for notification_type in {notification.notification_type for notification in notifications}:
+        claimed = DeliveryLedgerService.claim_items(
+            'email',
+            notification_type,
+            [n for n in notifications if n.notification_type == notification_type],
+            _notification_email_key
+        )
+        messages = [
+            EmailDispatchService.build_message({
+                'subject': notification.title,
+                'body': notification.message,
+                'to': [notification.user.email],
+            })
+            for notification in claimed
+        ]
+        sent += _send_claimed(
+            'send_notification_emails', notification_type, claimed, messages,
+            _notification_email_key
+        )
+    return sent
+
+@shared_task
+def send_subscription_expiry_emails(subscription_ids):
+    """수강권 만료 알림 이메일 일괄 발송 (배치 전체를 한 번에 렌더링)"""
+    subscriptions = DeliveryLedgerService.claim_items(
+        'email',
+        'subscription_expiry',
+        Subscription.objects.filter(
+            id__in=subscription_ids
+        ).select_related('student', 'dance_class'),
+        _expiry_email_key
+    )
+
+    messages = [
+        EmailDispatchService.build_message(payload)
+        for payload in EmailService.subscription_expiry_payloads(subscriptions)
+    ]
+    return _send_claimed(
+        'send_subscription_expiry_emails', 'subscription_expiry', subscriptions, messages,
+        _expiry_email_key
+    )
+
+@shared_task
+def send_emails(payloads):
+    """이메일 일괄 발송 (payload: subject, body, to, html)"""
+    messages = [EmailDispatchService.build_message(payload) for payload in payloads]
+    sent, failed = _send_messages('send_emails', messages)
+    return sent
+
+@shared_task
+def plan_class_reminders():
+    """오늘/내일 수업 알림 예약 생성 (자정 직후 수업도 놓치지 않도록 내일까지)"""
+    today = timezone.localdate()
+    ClassReminderService.prune(
+        timezone.make_aware(datetime.combine(today, time.min))
+    )
+    return sum(
+        ClassReminderService.plan(day)
+        for day in (today, today + timedelta(days=1))
+    )
+
+@shared_task
+def send_class_reminders():
+    """수업 시작 알림 (알림 시각이 된 예약만 꺼내 발송)"""
+    # 발송 처리(sent_at)와 알림 생성을 한 트랜잭션으로 묶어, 중간에 실패하면 예약이 남도록
+    with transaction.atomic():
+        reminders = ClassReminderService.pop_due()
+        if not reminders:
+            return 0
+        email_reminders = NotificationService.create_class_reminder_notifications(reminders)
+
+    if email_reminders:
+        send_class_reminder_emails.delay([reminder.id for reminder in email_reminders])
+    return len(reminders)
+
+@shared_task
+def send_class_reminder_emails(reminder_ids):
+    """수업 알림 이메일 일괄 발송"""
+    reminders = DeliveryLedgerService.claim_items(
+        'email',
+        'class_reminder',
+        ClassReminder.objects.filter(
+            id__in=reminder_ids
+        ).select_related('student', 'schedule__dance_class__instructor'),
+        _reminder_email_key
+    )
+
+    messages = [
+        EmailDispatchService.build_message(payload)
+        for payload in EmailService.class_reminder_payloads(reminders)
+    ]
+    return _send_claimed(
+        'send_class_reminder_emails', 'class_reminder', reminders, messages, _reminder_email_key
+    )
+
+@shared_task
+def archive_notifications():
+    """오래된 읽은 알림 보관 + 지난 발송 기록 정리"""
+    archived = NotificationArchiveService.archive(
+        timezone.now() - timedelta(days=settings.NOTIFICATION_ARCHIVE_AFTER_DAYS)
+    )
+    NotificationArchiveService.prune_deliveries(
+        timezone.localdate() - timedelta(days=settings.NOTIFICATION_DELIVERY_RETENTION_DAYS)
+    )
+    return archived
@@ -1,3 +1,737 @@
-from django.test import TestCase
+import asyncio
+import smtplib
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from channels.testing import WebsocketCommunicator
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.core.mail.backends import locmem
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from backend.testing import QueryPlanAssertionsMixin
+from classes.models import ClassSchedule, DanceClass
+from subscriptions.models import Subscription
+from . import presence, unread
+from .consumers import NotificationConsumer
+from .models import (
+    ArchivedNotification, ClassReminder, Notification, NotificationDelivery, NotificationPreference
+)
+from .services.archive_service import NotificationArchiveService
+from .services.email_dispatch_service import EmailDispatchService, RateLimiter
+from .services.email_service import EmailService
+from .services.email_template_service import EmailTemplateService, compiled_templates
+from .services.notification_service import NotificationService, push_notifications
+from .services.reminder_service import ClassReminderService
+from .tasks import (
+    check_subscription_expiry, send_class_reminder_emails, send_class_reminders, send_emails,
+    send_notification_emails, send_subscription_expiry_emails
+)
+
+User = get_user_model()
+
+
+class NotificationIndexUsageTest(QueryPlanAssertionsMixin, TestCase):
+    def test_user_list_uses_user_created_index(self):
+        queryset = Notification.objects.filter(user_id=1)[:20]
+        self.assertUsesIndex(queryset, 'notification_user_created_idx')
+
+    def test_unread_uses_partial_index(self):
+        queryset = Notification.objects.filter(user_id=1, read=False)
+        self.assertUsesIndex(queryset, 'notification_unread_idx')
+
+
+@override_settings(CHANNEL_LAYERS={
+    'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}
+})
+class SubscriptionExpiryFanOutTest(TestCase):
+    def setUp(self):
+        instructor = User.objects.create(username='instructor', user_type='instructor')
+        dance_class = DanceClass.objects.create(name='class', instructor=instructor, capacity=50)
+        self.students = [
+            User.objects.create(
+                username=f'student{i}', email=f'student{i}@example.com', user_type='student'
+            )
+            for i in range(6)
+        ]
+        expiry_date = timezone.localdate() + timedelta(days=7)
+        for student in self.students:
+            Subscription.objects.create(
+                student=student,
+                dance_class=dance_class,
+                subscription_type='days',
+                start_date=expiry_date - timedelta(days=30),
+                end_date=expiry_date,
+            )
+        # 만료 알림 끔 / 이메일만 끔 / 푸시만 끔, 나머지는 설정 행 없음(기본값)
+        # 설정은 이메일에만 적용되고 앱 알림과 웹소켓 전송은 모두에게 간다 (create_notification과 동일)
+        NotificationPreference.objects.create(user=self.students[0], subscription_expiry=False)
+        NotificationPreference.objects.create(user=self.students[1], email_notifications=False)
+        NotificationPreference.objects.create(user=self.students[2], push_notifications=False)
+
+    def test_batch_respects_preferences_and_hands_off_emails(self):
+        with patch.object(send_subscription_expiry_emails, 'delay') as delay:
+            self.assertEqual(check_subscription_expiry(), 6)
+
+        notified = set(Notification.objects.values_list('user_id', flat=True))
+        self.assertEqual(notified, {student.id for student in self.students})
+
+        subscription_ids = delay.call_args.args[0]
+        self.assertEqual(
+            set(Subscription.objects.filter(id__in=subscription_ids).values_list('student_id', flat=True)),
+            {student.id for student in self.students[2:]}
+        )
+
+        send_subscription_expiry_emails(subscription_ids)
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            sorted(student.email for student in self.students[2:])
+        )
+
+    def test_single_notification_applies_same_preferences(self):
+        subscriptions = list(Subscription.objects.select_related('student', 'dance_class'))
+        with patch.object(send_notification_emails, 'delay') as delay:
+            for subscription in subscriptions:
+                async_to_sync(NotificationService.create_subscription_expiry_notification)(subscription)
+
+        notified = set(Notification.objects.values_list('user_id', flat=True))
+        self.assertEqual(notified, {student.id for student in self.students})
+        emailed = Notification.objects.filter(
+            id__in=[call.args[0][0] for call in delay.call_args_list]
+        ).values_list('user_id', flat=True)
+        self.assertEqual(set(emailed), {student.id for student in self.students[2:]})
+
+    def test_batch_query_count_does_not_grow_with_recipients(self):
+        subscriptions = list(Subscription.objects.select_related('student', 'dance_class'))
+        # 설정 조회 + 발송 기록 INSERT/조회 + bulk_create (+ SAVEPOINT/RELEASE)
+        with self.assertNumQueries(6):
+            NotificationService.create_subscription_expiry_notifications(subscriptions)
+
+    def test_replayed_runs_do_not_duplicate_notifications_or_emails(self):
+        with patch.object(send_subscription_expiry_emails, 'delay') as delay:
+            check_subscription_expiry()
+            check_subscription_expiry()
+        self.assertEqual(Notification.objects.count(), 6)
+        self.assertEqual(delay.call_count, 1)
+
+        subscription_ids = delay.call_args.args[0]
+        send_subscription_expiry_emails(subscription_ids)
+        send_subscription_expiry_emails(subscription_ids)
+        self.assertEqual(len(mail.outbox), 4)
+        self.assertEqual(
+            NotificationDelivery.objects.filter(channel='email').count(), 4
+        )
+
+    @override_settings(
+        EMAIL_BACKEND='notifications.tests.FlakyEmailBackend',
+        EMAIL_BATCH_SIZE=1,
+        EMAIL_MAX_RETRIES=0,
+    )
+    def test_failed_emails_are_released_and_sent_on_replay(self):
+        FlakyEmailBackend.errors = {
+            self.students[3].email: [smtplib.SMTPRecipientsRefused({})],
+            self.students[4].email: [smtplib.SMTPServerDisconnected('끊김')],
+        }
+        subscription_ids = list(
+            Subscription.objects.filter(student__in=self.students[2:]).values_list('id', flat=True)
+        )
+        with self.assertLogs('notifications', 'WARNING'):
+            sent = send_subscription_expiry_emails(subscription_ids)
+        # 메시지마다 연결을 따로 열므로 실패한 두 수신자를 뺀 나머지 둘만 발송된다
+        # 발송 기록은 실제로 보낸 수신자만 남는다
+        self.assertEqual(sent, 2)
+        self.assertEqual(
+            set(NotificationDelivery.objects.filter(channel='email').values_list('user__email', flat=True)),
+            {message.to[0] for message in mail.outbox}
+        )
+
+        # 메일 서버가 복구된 뒤 다시 실행하면 실패한 수신자에게만 보낸다
+        FlakyEmailBackend.errors = {}
+        self.assertEqual(send_subscription_expiry_emails(subscription_ids), 2)
+        self.assertEqual(send_subscription_expiry_emails(subscription_ids), 0)
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            sorted(student.email for student in self.students[2:])
+        )
+
+    def test_push_skips_offline_users(self):
+        cache.clear()
+        channel_layer = get_channel_layer()
+        subscriptions = list(Subscription.objects.select_related('student', 'dance_class'))
+        channels = {}
+        for student in self.students:
+            channels[student.id] = async_to_sync(channel_layer.new_channel)()
+            async_to_sync(channel_layer.group_add)(f'user_{student.id}', channels[student.id])
+            # students[4]는 웹소켓 미접속
+            if student != self.students[4]:
+                async_to_sync(presence.mark_online)(student.id)
+
+        # 테스트의 로컬 메모리 캐시를 공유 캐시로 취급해 접속 현황을 사용
+        with patch('notifications.presence.is_shared', return_value=True):
+            with self.captureOnCommitCallbacks(execute=True):
+                NotificationService.create_subscription_expiry_notifications(subscriptions)
+
+        received = set()
+        for student_id, channel in channels.items():
+            try:
+                async_to_sync(asyncio.wait_for)(channel_layer.receive(channel), 0.01)
+            except asyncio.TimeoutError:
+                continue
+            received.add(student_id)
+        self.assertEqual(
+            received,
+            {student.id for student in self.students if student != self.students[4]}
+        )
+
+
+class FlakyEmailBackend(locmem.EmailBackend):
+    """연결 수를 세고, 지정한 수신자에게 지정한 오류를 내는 테스트용 백엔드"""
+    opened = 0
+    errors = {}
+
+    def open(self):
+        FlakyEmailBackend.opened += 1
+        return super().open()
+
+    def send_messages(self, messages):
+        for message in messages:
+            errors = FlakyEmailBackend.errors.get(message.to[0])
+            if errors:
+                raise errors.pop(0)
+        return super().send_messages(messages)
+
+
+@override_settings(
+    EMAIL_BACKEND='notifications.tests.FlakyEmailBackend',
+    EMAIL_BATCH_SIZE=2,
+    EMAIL_RATE_LIMIT_PER_MINUTE=0,
+    EMAIL_MAX_RETRIES=2,
+    EMAIL_RETRY_BACKOFF=0,
+)
+class EmailDispatchServiceTest(TestCase):
+    def setUp(self):
+        FlakyEmailBackend.opened = 0
+        FlakyEmailBackend.errors = {}
+
+    def _messages(self, count):
+        return [
+            EmailDispatchService.build_message({
+                'subject': f'제목 {i}', 'body': '내용', 'html': '<p>내용</p>',
+                'to': [f'user{i}@example.com'],
+            })
+            for i in range(count)
+        ]
+
+    def test_reuses_one_connection_per_batch(self):
+        sent, failed = EmailDispatchService.send(self._messages(5))
+        self.assertEqual((sent, failed), (5, []))
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(FlakyEmailBackend.opened, 3)
+        self.assertEqual(mail.outbox[0].alternatives, [('<p>내용</p>', 'text/html')])
+
+    def test_retries_transient_failures(self):
+        FlakyEmailBackend.errors = {
+            'user1@example.com': [smtplib.SMTPServerDisconnected('끊김')],
+            'user2@example.com': [smtplib.SMTPResponseException(451, '잠시 후 재시도')],
+        }
+        with self.assertLogs('notifications.services.email_dispatch_service', 'WARNING'):
+            sent, failed = EmailDispatchService.send(self._messages(3))
+        self.assertEqual((sent, failed), (3, []))
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            ['user0@example.com', 'user1@example.com', 'user2@example.com']
+        )
+
+    def test_drops_permanent_failures_and_gives_up_after_max_retries(self):
+        FlakyEmailBackend.errors = {
+            'user0@example.com': [smtplib.SMTPRecipientsRefused({})],
+            'user1@example.com': [smtplib.SMTPServerDisconnected('끊김')] * 3,
+        }
+        with self.assertLogs('notifications.services.email_dispatch_service', 'WARNING') as logs:
+            sent, failed = EmailDispatchService.send(self._messages(3))
+        self.assertIn('재시도 횟수 초과', logs.output[-1])
+        self.assertEqual(sent, 1)
+        self.assertEqual(
+            sorted(message.to[0] for message in failed),
+            ['user0@example.com', 'user1@example.com']
+        )
+
+
+    def test_send_emails_task_logs_failed_recipients(self):
+        FlakyEmailBackend.errors = {'user1@example.com': [smtplib.SMTPRecipientsRefused({})]}
+        payloads = [
+            {'subject': '제목', 'body': '내용', 'to': [f'user{i}@example.com']} for i in range(2)
+        ]
+        with self.assertLogs('notifications', 'WARNING') as logs:
+            self.assertEqual(send_emails(payloads), 1)
+        self.assertIn(
+            'ERROR:notifications.tasks:send_emails: 이메일 1건 발송 실패 (user1@example.com)',
+            logs.output
+        )
+
+
+class RateLimiterTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_shared_limit_counts_all_limiters(self):
+        """공유 캐시에서는 워커(리미터)가 여러 개여도 분당 한도를 함께 센다"""
+        sleeps = []
+        now = 60 * 1000 + 10
+        with patch('notifications.services.email_dispatch_service.is_shared', return_value=True):
+            limiters = [RateLimiter(3), RateLimiter(3)]
+        with patch('notifications.services.email_dispatch_service.time') as clock:
+            clock.time.side_effect = lambda: now + sum(sleeps)
+            clock.sleep.side_effect = sleeps.append
+            for limiter in (limiters[0], limiters[1], limiters[0]):
+                limiter.wait()
+            self.assertEqual(sleeps, [])
+            limiters[1].wait()
+        self.assertEqual(sleeps, [50])
+
+    def test_local_limit_without_shared_cache(self):
+        limiter = RateLimiter(60)
+        self.assertFalse(limiter.shared)
+        with patch('notifications.services.email_dispatch_service.time') as clock:
+            clock.monotonic.return_value = 100
+            limiter.wait()
+            limiter.wait()
+        clock.sleep.assert_called_once_with(1)
+
+
+class EmailTemplateServiceTest(TestCase):
+    def test_batch_renders_html_and_text_per_recipient(self):
+        contexts = [
+            {
+                'student_name': name,
+                'class_name': '힙합 <초급>',
+                'expiry_date': '2024-01-08',
+                'renewal_url': f'http://localhost:3000/subscriptions/{i}/renew',
+            }
+            for i, name in enumerate(['민지', '서연'])
+        ]
+        compiled_templates.cache_clear()
+        rendered = EmailTemplateService.render_batch(
+            'subscription_expiry', contexts, {'subject': '만료 예정'}
+        )
+        EmailTemplateService.render('subscription_expiry', contexts[0])
+
+        self.assertEqual(compiled_templates.cache_info().misses, 1)
+        (html, text), (other_html, other_text) = rendered
+        self.assertIn('민지님', html)
+        self.assertIn('서연님', other_text)
+        self.assertIn('힙합 &lt;초급&gt;', html)
+        self.assertIn('힙합 <초급> 수업의 수강권', text)
+        self.assertNotIn('<p>', text)
+        self.assertIn('수강권 갱신하기: http://localhost:3000/subscriptions/0/renew', text)
+
+    def test_template_email_failure_is_logged(self):
+        with patch.object(send_emails, 'delay', side_effect=ConnectionError('broker down')):
+            with self.assertLogs('notifications.services.email_service', 'ERROR') as logs:
+                sent = async_to_sync(EmailService.send_template_email)(
+                    'student@example.com', 'subscription_expiry', {}, '만료 예정'
+                )
+        self.assertFalse(sent)
+        self.assertIn('broker down', logs.output[0])
+
+
+@override_settings(
+    CLASS_REMINDER_LEAD_MINUTES=30,
+    CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}},
+)
+class ClassReminderTest(TestCase):
+    def setUp(self):
+        # 2024-01-01은 월요일
+        self.day = date(2024, 1, 1)
+        instructor = User.objects.create(username='instructor', user_type='instructor')
+        dance_class = DanceClass.objects.create(name='class', instructor=instructor, capacity=10)
+        self.morning = ClassSchedule.objects.create(
+            dance_class=dance_class, weekday=0, start_time=time(10), end_time=time(11)
+        )
+        self.evening = ClassSchedule.objects.create(
+            dance_class=dance_class, weekday=0, start_time=time(19), end_time=time(20), room='B'
+        )
+        ClassSchedule.objects.create(
+            dance_class=dance_class, weekday=1, start_time=time(10), end_time=time(11)
+        )
+        self.students = [
+            User.objects.create(username=f'student{i}', email=f's{i}@example.com', user_type='student')
+            for i in range(3)
+        ]
+        for i, student in enumerate(self.students):
+            Subscription.objects.create(
+                student=student,
+                dance_class=dance_class,
+                subscription_type='days',
+                start_date=date(2023, 12, 1),
+                end_date=date(2024, 2, 1),
+                status='expired' if i == 2 else 'active',
+            )
+
+    def _at(self, hour, minute=0):
+        return timezone.make_aware(datetime.combine(self.day, time(hour, minute)))
+
+    def test_plan_expands_weekday_schedules_for_active_subscriptions(self):
+        with self.assertNumQueries(2):
+            ClassReminderService.plan(self.day)
+        # 재계획해도 중복 생성되지 않음
+        ClassReminderService.plan(self.day)
+
+        reminders = ClassReminder.objects.order_by('remind_at', 'student_id')
+        self.assertEqual(
+            [(reminder.student_id, reminder.schedule_id, reminder.remind_at) for reminder in reminders],
+            [
+                (self.students[0].id, self.morning.id, self._at(9, 30)),
+                (self.students[1].id, self.morning.id, self._at(9, 30)),
+                (self.students[0].id, self.evening.id, self._at(18, 30)),
+                (self.students[1].id, self.evening.id, self._at(18, 30)),
+            ]
+        )
+
+    def test_pop_due_returns_only_due_reminders_once(self):
+        ClassReminderService.plan(self.day)
+
+        self.assertEqual(ClassReminderService.pop_due(self._at(9)), [])
+        due = ClassReminderService.pop_due(self._at(9, 40))
+        self.assertEqual({reminder.schedule_id for reminder in due}, {self.morning.id})
+        self.assertEqual(len(due), 2)
+        self.assertEqual(ClassReminderService.pop_due(self._at(9, 50)), [])
+
+        # 수업이 이미 시작한 예약은 발송하지 않고 처리만 함
+        self.assertEqual(ClassReminderService.pop_due(self._at(19, 10)), [])
+        self.assertFalse(ClassReminder.objects.filter(sent_at__isnull=True).exists())
+
+    def test_send_class_reminders_notifies_and_emails(self):
+        ClassReminderService.plan(self.day)
+        due = ClassReminderService.pop_due(self._at(9, 40))
+
+        email_reminders = NotificationService.create_class_reminder_notifications(due)
+        self.assertEqual(Notification.objects.filter(notification_type='class_reminder').count(), 2)
+        self.assertEqual(
+            Notification.objects.first().message, '오늘 10:00에 class 수업이 있습니다.'
+        )
+
+        send_class_reminder_emails([reminder.id for reminder in email_reminders])
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertIn('오늘 10:00에 class 수업이 있습니다.', mail.outbox[0].body)
+
+    def test_failed_notification_creation_keeps_reminders_due(self):
+        ClassReminderService.plan(self.day)
+
+        with patch('django.utils.timezone.now', return_value=self._at(9, 40)):
+            with patch.object(
+                NotificationService, 'create_class_reminder_notifications',
+                side_effect=RuntimeError('중단')
+            ):
+                with self.assertRaises(RuntimeError):
+                    send_class_reminders()
+            # 발송 처리도 롤백되어 다음 실행에서 다시 꺼낸다
+            self.assertEqual(ClassReminder.objects.filter(sent_at__isnull=False).count(), 0)
+
+            with patch.object(send_class_reminder_emails, 'delay') as delay:
+                self.assertEqual(send_class_reminders(), 2)
+        self.assertEqual(Notification.objects.filter(notification_type='class_reminder').count(), 2)
+        self.assertEqual(len(delay.call_args.args[0]), 2)
+
+
+@override_settings(
+    CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}},
+    NOTIFICATION_COALESCE_MS=50,
+    NOTIFICATION_MAX_PENDING=3,
+)
+class NotificationConsumerTest(TestCase):
+    async def _connect(self):
+        communicator = WebsocketCommunicator(
+            NotificationConsumer.as_asgi(), '/ws/notifications/'
+        )
+        communicator.scope['user'] = SimpleNamespace(id=1, is_anonymous=False)
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        return communicator
+
+    async def _send(self, count):
+        channel_layer = get_channel_layer()
+        for i in range(count):
+            await channel_layer.group_send('user_1', {
+                'type': 'notification_message',
+                'message': {'id': i, 'title': f'알림 {i}'},
+            })
+
+    def setUp(self):
+        cache.clear()
+
+    @patch('notifications.presence.is_shared', return_value=True)
+    async def test_connection_registers_presence_until_disconnect(self, is_shared):
+        communicator = await self._connect()
+        other = await self._connect()
+        self.assertEqual(presence.online_user_ids({1, 2}), {1})
+
+        await communicator.disconnect()
+        self.assertEqual(presence.online_user_ids({1}), {1})
+        await other.disconnect()
+        self.assertEqual(presence.online_user_ids({1}), set())
+
+        # 키가 만료된 뒤 heartbeat가 오면 그 연결 하나로 다시 등록
+        await cache.adelete(presence.presence_key(1))
+        await presence.refresh(1)
+        self.assertEqual(presence.online_user_ids({1}), {1})
+        await presence.mark_offline(1)
+        self.assertEqual(presence.online_user_ids({1}), set())
+
+    async def test_push_from_another_process_is_not_dropped(self):
+        """공유 캐시가 없으면 다른 프로세스(Celery 워커)는 접속 현황을 볼 수 없으므로 전송한다"""
+        communicator = await self._connect()
+        # 소비자 프로세스의 접속 기록이 보이지 않는 프로세스를 흉내냄
+        await cache.aclear()
+        self.assertEqual(presence.online_user_ids({1}), {1})
+
+        notification = SimpleNamespace(
+            id=7, user_id=1, notification_type='announcement', title='공지', message='내용',
+            link='', created_at=timezone.now()
+        )
+        await push_notifications([notification])
+        messages = await communicator.receive_json_from(timeout=1)
+        self.assertEqual([message['id'] for message in messages], [7])
+        await communicator.disconnect()
+
+    async def test_burst_is_sent_as_one_array(self):
+        communicator = await self._connect()
+        await self._send(3)
+
+        messages = await communicator.receive_json_from(timeout=1)
+        self.assertEqual([message['id'] for message in messages], [0, 1, 2])
+        self.assertTrue(await communicator.receive_nothing(timeout=0.1))
+        await communicator.disconnect()
+
+    async def test_queue_depth_is_capped(self):
+        communicator = await self._connect()
+        await self._send(5)
+
+        messages = await communicator.receive_json_from(timeout=1)
+        self.assertEqual([message.get('id') for message in messages[:-1]], [2, 3, 4])
+        self.assertEqual(messages[-1], {'type': 'notifications_dropped', 'count': 2})
+        await communicator.disconnect()
+
+
+@override_settings(CHANNEL_LAYERS={
+    'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}
+})
+class UnreadCountTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(username='student', user_type='student')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _notify(self, count, start=0):
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationService.bulk_notify('announcement', [
+                {
+                    'user': self.user,
+                    'object_id': i,
+                    'occurrence_date': timezone.localdate(),
+                    'title': f'공지 {i}',
+                    'message': '내용',
+                }
+                for i in range(start, start + count)
+            ])
+
+    def _unread_count(self):
+        response = self.client.get('/api/notifications/unread-count/')
+        self.assertEqual(response.status_code, 200)
+        return response.data['unread_count']
+
+    @patch('notifications.unread.is_shared', return_value=True)
+    def test_count_is_cached_and_follows_create_and_read(self, is_shared):
+        self._notify(3)
+        self.assertEqual(self._unread_count(), 3)
+
+        # 캐시된 뒤에는 DB를 조회하지 않는다
+        with self.assertNumQueries(0):
+            self.assertEqual(self._unread_count(), 3)
+
+        # 생성/읽음 처리가 커밋되면 키를 지워 다시 센다
+        self._notify(2, start=3)
+        self.assertIsNone(cache.get(unread.unread_key(self.user.id)))
+        self.assertEqual(self._unread_count(), 5)
+
+        notification = Notification.objects.filter(user=self.user).first()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f'/api/notifications/{notification.id}/read/')
+        self.assertTrue(response.data['read'])
+        # 이미 읽은 알림을 다시 읽어도 줄지 않는다
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/api/notifications/{notification.id}/read/')
+
+        self.assertEqual(self._unread_count(), 4)
+        with self.assertNumQueries(0):
+            self.assertEqual(self._unread_count(), 4)
+
+    def test_count_is_not_cached_without_shared_cache(self):
+        """프로세스별 캐시에서는 다른 프로세스의 변경을 알 수 없으므로 매번 센다"""
+        self._notify(2)
+        self.assertEqual(self._unread_count(), 2)
+        self.assertIsNone(cache.get(unread.unread_key(self.user.id)))
+        Notification.objects.create(
+            user=self.user, notification_type='announcement', title='공지', message='내용'
+        )
+        self.assertEqual(self._unread_count(), 3)
+
+    def test_read_pushes_delta_to_online_user(self):
+        self._notify(2)
+        channel_layer = get_channel_layer()
+        channel = async_to_sync(channel_layer.new_channel)()
+        async_to_sync(channel_layer.group_add)(f'user_{self.user.id}', channel)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(NotificationService.mark_read(self.user.id), 2)
+
+        event = async_to_sync(asyncio.wait_for)(channel_layer.receive(channel), 1)
+        self.assertEqual(event['message'], {'type': 'unread_delta', 'delta': -2})
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class NotificationBulkReadTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(username='student', user_type='student')
+        other = User.objects.create(username='other', user_type='student')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        for user in (self.user, other):
+            for notification_type in ('announcement', 'class_reminder'):
+                Notification.objects.create(
+                    user=user, notification_type=notification_type, title='알림', message='내용'
+                )
+        self.old = Notification.objects.filter(user=self.user).order_by('id').first()
+        Notification.objects.filter(id=self.old.id).update(
+            created_at=timezone.now() - timedelta(days=10)
+        )
+
+    def _read(self, data):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/notifications/read/', data, format='json')
+        self.assertEqual(response.status_code, 200)
+        return response.data['updated']
+
+    def test_filters_by_type_and_timestamp(self):
+        self.assertEqual(self._read({'before': timezone.now() - timedelta(days=1)}), 1)
+        self.assertTrue(Notification.objects.get(id=self.old.id).read)
+        self.assertEqual(self._read({'type': 'class_reminder'}), 1)
+        self.assertEqual(self._read({}), 0)
+        self.assertFalse(Notification.objects.filter(read=True).exclude(user=self.user).exists())
+        self.assertEqual(unread.get_unread_count(self.user.id), 0)
+
+    def test_single_update_and_invalid_type(self):
+        with self.assertNumQueries(1):
+            NotificationService.mark_read(self.user.id)
+        response = self.client.post('/api/notifications/read/', {'type': 'nope'}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+
+class NotificationArchiveTest(TestCase):
+    def setUp(self):
+        user = User.objects.create(username='student', user_type='student')
+        old = timezone.now() - timedelta(days=100)
+        for read in (True, True, True, False):
+            notification = Notification.objects.create(
+                user=user, notification_type='announcement', title='알림', message='내용', read=read
+            )
+            Notification.objects.filter(id=notification.id).update(created_at=old)
+        self.recent = Notification.objects.create(
+            user=user, notification_type='announcement', title='알림', message='내용', read=True
+        )
+
+    def test_moves_old_read_notifications_in_batches(self):
+        before = timezone.now() - timedelta(days=90)
+        self.assertEqual(NotificationArchiveService.archive(before, batch_size=2), 3)
+        self.assertEqual(ArchivedNotification.objects.count(), 3)
+        # 안 읽은 알림과 최근 알림은 남긴다
+        self.assertEqual(
+            set(Notification.objects.values_list('read', flat=True)), {True, False}
+        )
+        self.assertTrue(Notification.objects.filter(id=self.recent.id).exists())
+        self.assertEqual(NotificationArchiveService.archive(before), 0)
+
+    def test_prunes_old_delivery_records(self):
+        user = self.recent.user
+        today = timezone.localdate()
+        for days in (0, 40):
+            NotificationDelivery.objects.create(
+                user=user, notification_type='announcement', object_id=1,
+                occurrence_date=today - timedelta(days=days), channel='in_app'
+            )
+        self.assertEqual(NotificationArchiveService.prune_deliveries(today - timedelta(days=30)), 1)
+        self.assertEqual(NotificationDelivery.objects.count(), 1)
+
+
+class NotificationKeysetPaginationTest(TestCase):
+    """created_at이 같은 행들도 -id 보조 정렬로 빠짐없이 한 번씩 조회"""
+
+    def setUp(self):
+        self.user = User.objects.create(username='user', user_type='student')
+        Notification.objects.bulk_create([
+            Notification(
+                user=self.user, notification_type='announcement',
+                title=f'공지 {i}', message='내용'
+            )
+            for i in range(5)
+        ])
+        Notification.objects.update(created_at=timezone.make_aware(datetime(2024, 1, 1, 9)))
+        self.ids = list(Notification.objects.order_by('-id').values_list('id', flat=True))
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _ids(self, response):
+        return [row['id'] for row in response.json()['results']]
+
+    def test_cursor_round_trip_over_equal_created_at(self):
+        response = self.client.get('/api/notifications/', {'pagination': 'cursor', 'page_size': 2})
+        pages = [self._ids(response)]
+        while response.json()['next']:
+            response = self.client.get(response.json()['next'])
+            pages.append(self._ids(response))
+        self.assertEqual(pages, [self.ids[0:2], self.ids[2:4], self.ids[4:]])
+
+        # 마지막 페이지에서 previous 링크로 되돌아가기
+        backward = []
+        while response.json()['previous']:
+            response = self.client.get(response.json()['previous'])
+            backward.append(self._ids(response))
+        self.assertEqual(backward, [self.ids[2:4], self.ids[0:2]])
+
+    def test_invalid_cursor(self):
+        for cursor in ['not-a-cursor', 'eyJ2IjpbMV19']:  # 'eyJ2IjpbMV19' = {"v":[1]} (필드 수 불일치)
+            with self.subTest(cursor=cursor):
+                response = self.client.get('/api/notifications/', {'cursor': cursor})
+                self.assertEqual(response.status_code, 404)
+                self.assertEqual(response.json(), {'detail': '유효하지 않은 커서입니다.'})
+
+    def test_page_size_is_capped(self):
+        Notification.objects.bulk_create([
+            Notification(user=self.user, notification_type='announcement', title='공지', message='')
+            for _ in range(settings.MAX_PAGE_SIZE)
+        ])
+        response = self.client.get('/api/notifications/', {'pagination': 'cursor', 'page_size': 1000})
+        self.assertEqual(len(response.json()['results']), settings.MAX_PAGE_SIZE)
+        self.assertIsNotNone(response.json()['next'])
+
+
+class BeatScheduleTest(SimpleTestCase):
+    def test_schedule_is_registered_only_in_settings(self):
+        from backend.celery import app
+        from . import tasks  # noqa: F401 작업 모듈을 불러와도 스케줄을 덮어쓰지 않는다
+
+        self.assertEqual(app.conf.beat_schedule, settings.CELERY_BEAT_SCHEDULE)
+        self.assertEqual(
+            [name for name, entry in app.conf.beat_schedule.items()
+             if entry['task'] == 'notifications.tasks.archive_notifications'],
+            ['archive-notifications']
+        )
@@ -0,0 +1,49 @@
+# backend/notifications/unread.py
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from backend.cache import is_shared
+from .models import Notification
+
+# 사용자별 안 읽은 알림 수
+# 안 읽은 알림 부분 인덱스로 센 값을 짧게(NOTIFICATION_UNREAD_CACHE_TIMEOUT) 캐시하고,
+# 알림 생성/읽음 처리가 커밋되면 증감하지 않고 키를 지운다. 지운 직후 다른 요청이
+# 커밋 전에 센 값을 저장하더라도 오래된 값은 캐시 유지 시간 안에 사라진다.
+#
+# 알림은 Celery 워커와 웹 요청 양쪽에서 생기므로 공유 캐시(CACHE_URL)일 때만 캐시하고,
+# 프로세스별 로컬 메모리 캐시에서는 매번 DB에서 센다.
+
+
+def unread_key(user_id):
+    return f'notifications:unread:{user_id}'
+
+
+def count_unread(user_id):
+    return Notification.objects.filter(user_id=user_id, read=False).count()
+
+
+def get_unread_count(user_id):
+    """안 읽은 알림 수 (캐시에 없으면 계산해서 저장)"""
+    if not is_shared():
+        return count_unread(user_id)
+
+    key = unread_key(user_id)
+    count = cache.get(key)
+    if count is None:
+        count = count_unread(user_id)
+        # 그 사이 다른 요청이 먼저 저장했으면 그 값을 유지
+        cache.add(key, count, timeout=settings.NOTIFICATION_UNREAD_CACHE_TIMEOUT)
+    return count
+
+
+def invalidate_unread_counts(user_ids):
+    """user_ids의 캐시된 수를 지워 다음 조회 때 DB에서 다시 세게 한다"""
+    if is_shared():
+        cache.delete_many([unread_key(user_id) for user_id in user_ids])
+
+
+def invalidate_unread_counts_on_commit(user_ids):
+    """트랜잭션이 커밋된 뒤에 무효화 (커밋 전에 지우면 그 사이 조회가 이전 값을 다시 저장함)"""
+    user_ids = set(user_ids)
+    if user_ids:
+        transaction.on_commit(lambda: invalidate_unread_counts(user_ids))
@@ -1,3 +1,61 @@
-from django.shortcuts import render
+# backend/notifications/views.py
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
 
-# Create your views here.
+from .models import Notification
+from .serializers import NotificationBulkReadSerializer, NotificationSerializer
+from .services.notification_service import NotificationService
+from . import unread
+from backend.pagination import KeysetPagination
+
+
+class NotificationPagination(KeysetPagination):
+    ordering = ('-created_at', '-id')
+
+
+class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
+    permission_classes = [IsAuthenticated]
+    serializer_class = NotificationSerializer
+    pagination_class = NotificationPagination
+
+    def get_queryset(self):
+        return Notification.objects.filter(user=self.request.user)
+
+    @action(detail=True, methods=['post'])
+    def read(self, request, pk=None):
+        """알림 읽음 처리 (이미 읽은 알림이면 변경 없음)"""
+        notification = self.get_object()
+        NotificationService.mark_read(request.user.id, id=notification.id)
+        notification.read = True
+        return Response(self.get_serializer(notification).data)
+
+    @action(detail=False, methods=['post'], url_path='read')
+    def read_all(self, request):
+        """
+        안 읽은 알림 일괄 읽음 처리 (UPDATE 1회)
+
+        type: 해당 종류만, before: 이 시각까지 생성된 알림만 (둘 다 선택)
+        """
+        serializer = NotificationBulkReadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        filters = {}
+        if 'type' in serializer.validated_data:
+            filters['notification_type'] = serializer.validated_data['type']
+        if 'before' in serializer.validated_data:
+            filters['created_at__lte'] = serializer.validated_data['before']
+        updated = NotificationService.mark_read(request.user.id, **filters)
+        return Response({'updated': updated})
+
+    @action(detail=False, methods=['get'], url_path='unread-count')
+    def unread_count(self, request):
+        """
+        안 읽은 알림 수 (알림 배지용)
+
+        캐시된 값을 돌려주므로 알림 목록을 조회하지 않는다.
+        이후 변경은 웹소켓으로 전달된다: 새 알림 메시지는 +1, {"type": "unread_delta", "delta": n}은 n.
+        """
+        return Response({'unread_count': unread.get_unread_count(request.user.id)})
@@ -0,0 +1,25 @@
+# backend/search/filters.py
+from django.db.models import Q
+from rest_framework.filters import BaseFilterBackend
+from . import index
+
+
+class IndexedSearchFilter(BaseFilterBackend):
+    """
+    search 파라미터를 검색 인덱스로 처리하는 공용 필터
+
+    뷰에 search_index_fields = {필드: 문서 종류}를 지정하면
+    어느 한 필드라도 검색어와 일치하는 행을 남긴다.
+    예) {'student_id': 'username', 'dance_class_id': 'class_name'}
+    """
+    search_param = 'search'
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '')
+        condition = Q()
+        for field, kind in view.search_index_fields.items():
+            ids = index.search_ids(kind, query)
+            if ids is None:
+                return queryset
+            condition |= Q(**{f'{field}__in': ids})
+        return queryset.filter(condition)
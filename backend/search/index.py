@@ -0,0 +1,123 @@
+# backend/search/index.py
+import unicodedata
+
+from django.db import transaction
+from django.db.models import Count
+from accounts.models import StudentProfile
+from .models import SearchDocument, SearchGram
+
+# 검색 인덱스
+# 사용자/수업마다 정규화한 검색 문자열(SearchDocument)과 그 2글자 조각(SearchGram)을 저장한다.
+# 검색어의 조각을 모두 가진 문서만 후보로 고른 뒤 문자열 포함 여부를 확인하므로,
+# 한 글자 검색어가 아니면 원본 테이블이나 전체 문서를 훑지 않는다.
+# 목록마다 검색하던 필드가 달라서 종류를 나눈다.
+#   user: 수강생 목록 (아이디, 이메일, 전화번호, 비상연락처)
+#   username: 출석/수강권 목록의 수강생 (아이디)
+#   class: 수업 목록 (수업명, 강사 아이디, 설명)
+#   class_name: 출석/수강권 목록의 수업 (수업명)
+
+USER = 'user'
+USERNAME = 'username'
+CLASS = 'class'
+CLASS_NAME = 'class_name'
+
+
+def normalize(text):
+    """전각/반각, 대소문자, 연속 공백 차이를 없앤 검색 문자열"""
+    return ' '.join(unicodedata.normalize('NFKC', text or '').casefold().split())
+
+
+def term_grams(term):
+    return {term[i:i + 2] for i in range(len(term) - 1)}
+
+
+def document_grams(text):
+    """단어별 2글자 조각 (단어 경계를 넘는 조각은 만들지 않는다)"""
+    grams = set()
+    for word in text.split():
+        grams |= term_grams(word)
+    return grams
+
+
+def user_text(user, emergency_contact=''):
+    return ' '.join(filter(None, [
+        user.username, user.email, user.phone_number, emergency_contact
+    ]))
+
+
+def user_texts(users):
+    """{user_id: user 문서 문자열} (비상연락처는 한 번에 조회)"""
+    users = list(users)
+    contacts = dict(
+        StudentProfile.objects.filter(user__in=users).values_list('user_id', 'emergency_contact')
+    )
+    return {user.id: user_text(user, contacts.get(user.id)) for user in users}
+
+
+def class_text(dance_class, instructor_username):
+    return ' '.join(filter(None, [
+        dance_class.name, instructor_username, dance_class.description
+    ]))
+
+
+def index_documents(kind, texts):
+    """
+    texts: {object_id: 원본 문자열}
+
+    검색 문자열이 바뀐 객체만 문서와 조각을 다시 쓴다. (로그인 등으로 저장만 된 경우는 쿼리 1회)
+    """
+    texts = {object_id: normalize(text) for object_id, text in texts.items()}
+    existing = dict(
+        SearchDocument.objects.filter(
+            kind=kind, object_id__in=list(texts)
+        ).values_list('object_id', 'text')
+    )
+    changed = {
+        object_id: text for object_id, text in texts.items()
+        if existing.get(object_id) != text
+    }
+    if not changed:
+        return 0
+
+    with transaction.atomic():
+        remove_documents(kind, list(changed))
+        SearchDocument.objects.bulk_create([
+            SearchDocument(kind=kind, object_id=object_id, text=text)
+            for object_id, text in changed.items()
+        ])
+        SearchGram.objects.bulk_create([
+            SearchGram(kind=kind, gram=gram, object_id=object_id)
+            for object_id, text in changed.items()
+            for gram in document_grams(text)
+        ])
+    return len(changed)
+
+
+def remove_documents(kind, object_ids):
+    SearchGram.objects.filter(kind=kind, object_id__in=object_ids).delete()
+    SearchDocument.objects.filter(kind=kind, object_id__in=object_ids).delete()
+
+
+def search_ids(kind, query):
+    """
+    검색어의 모든 단어를 포함하는 객체 id (서브쿼리로 쓸 수 있는 queryset)
+
+    검색어가 비어 있으면 None.
+    """
+    terms = normalize(query).split()
+    if not terms:
+        return None
+
+    documents = SearchDocument.objects.filter(kind=kind)
+    for term in terms:
+        grams = term_grams(term)
+        if grams:
+            candidates = SearchGram.objects.filter(
+                kind=kind, gram__in=grams
+            ).values('object_id').annotate(
+                matched=Count('gram', distinct=True)
+            ).filter(matched=len(grams)).values('object_id')
+            documents = documents.filter(object_id__in=candidates)
+        # 조각이 모두 있어도 순서가 다를 수 있으므로 포함 여부를 확인
+        documents = documents.filter(text__contains=term)
+    return documents.values('object_id')
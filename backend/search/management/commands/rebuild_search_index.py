@@ -0,0 +1,63 @@
+# backend/search/management/commands/rebuild_search_index.py
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from classes.models import DanceClass
+from search import index
+from search.models import SearchDocument
+
+User = get_user_model()
+
+# 한 번에 색인하는 객체 수
+BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = '사용자/수업 검색 인덱스를 원본 데이터와 맞춘다 (signal을 거치지 않은 일괄 변경 후 실행)'
+
+    def handle(self, *args, **options):
+        users = User.objects.order_by('id')
+        classes = DanceClass.objects.select_related('instructor').order_by('id')
+
+        updated = self._index(index.USER, users, index.user_texts)
+        updated += self._index(
+            index.USERNAME, users, lambda batch: {user.id: user.username for user in batch}
+        )
+        updated += self._index(index.CLASS, classes, lambda batch: {
+            dance_class.id: index.class_text(dance_class, dance_class.instructor.username)
+            for dance_class in batch
+        })
+        updated += self._index(
+            index.CLASS_NAME, classes,
+            lambda batch: {dance_class.id: dance_class.name for dance_class in batch}
+        )
+
+        # 원본이 삭제된 문서 정리
+        removed = 0
+        for kind, model in (
+            (index.USER, User), (index.USERNAME, User),
+            (index.CLASS, DanceClass), (index.CLASS_NAME, DanceClass),
+        ):
+            stale = list(
+                SearchDocument.objects.filter(kind=kind).exclude(
+                    object_id__in=model.objects.values('id')
+                ).values_list('object_id', flat=True)
+            )
+            index.remove_documents(kind, stale)
+            removed += len(stale)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'검색 문서 {updated}개를 갱신하고 {removed}개를 삭제했습니다.'
+        ))
+
+    def _index(self, kind, queryset, texts):
+        """texts(객체 목록) → {id: 원본 문자열}을 BATCH_SIZE개씩 색인"""
+        updated = 0
+        batch = []
+        for obj in queryset.iterator(chunk_size=BATCH_SIZE):
+            batch.append(obj)
+            if len(batch) == BATCH_SIZE:
+                updated += index.index_documents(kind, texts(batch))
+                batch = []
+        if batch:
+            updated += index.index_documents(kind, texts(batch))
+        return updated
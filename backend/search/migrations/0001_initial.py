@@ -0,0 +1,47 @@
+# Generated by Django 4.2.7 on 2026-10-18 20:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('user', '사용자'), ('class', '수업')], max_length=10, verbose_name='종류')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='대상 id')),
+                ('text', models.TextField(verbose_name='검색 문자열')),
+            ],
+            options={
+                'verbose_name': '검색 문서',
+                'verbose_name_plural': '검색 문서 목록',
+                'db_table': 'search_document',
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchGram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('user', '사용자'), ('class', '수업')], max_length=10, verbose_name='종류')),
+                ('gram', models.CharField(max_length=2, verbose_name='조각')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='대상 id')),
+            ],
+            options={
+                'verbose_name': '검색 조각',
+                'verbose_name_plural': '검색 조각 목록',
+                'db_table': 'search_gram',
+                'indexes': [models.Index(fields=['kind', 'gram', 'object_id'], name='search_gram_lookup_idx'), models.Index(fields=['kind', 'object_id'], name='search_gram_object_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='searchdocument',
+            constraint=models.UniqueConstraint(fields=('kind', 'object_id'), name='unique_search_document'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 4.2.7 on 2026-10-18 20:40
+
+import unicodedata
+
+from django.db import migrations
+
+
+# 마이그레이션은 작성 시점의 규칙으로 실행되어야 하므로 search.index의 문자열 생성 로직을 복사해 둔다
+
+def normalize(text):
+    return ' '.join(unicodedata.normalize('NFKC', text or '').casefold().split())
+
+
+def document_grams(text):
+    grams = set()
+    for word in text.split():
+        grams |= {word[i:i + 2] for i in range(len(word) - 1)}
+    return grams
+
+
+def user_text(user):
+    return ' '.join(filter(None, [
+        user.username, user.first_name, user.last_name, user.email, user.phone_number
+    ]))
+
+
+def class_text(dance_class, instructor_username):
+    return ' '.join(filter(None, [
+        dance_class.name, instructor_username, dance_class.description
+    ]))
+
+
+def build_search_index(apps, schema_editor):
+    User = apps.get_model('accounts', 'User')
+    DanceClass = apps.get_model('classes', 'DanceClass')
+    SearchDocument = apps.get_model('search', 'SearchDocument')
+    SearchGram = apps.get_model('search', 'SearchGram')
+
+    texts = [('user', user.id, user_text(user)) for user in User.objects.all()]
+    texts += [
+        ('class', dance_class.id, class_text(dance_class, dance_class.instructor.username))
+        for dance_class in DanceClass.objects.select_related('instructor')
+    ]
+    texts = [(kind, object_id, normalize(text)) for kind, object_id, text in texts]
+
+    SearchDocument.objects.bulk_create([
+        SearchDocument(kind=kind, object_id=object_id, text=text)
+        for kind, object_id, text in texts
+    ], batch_size=500)
+    SearchGram.objects.bulk_create([
+        SearchGram(kind=kind, gram=gram, object_id=object_id)
+        for kind, object_id, text in texts
+        for gram in document_grams(text)
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+        ('accounts', '0001_initial'),
+        ('classes', '0003_danceclass_current_students_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 4.2.7 on 2026-10-18 21:07
+
+import unicodedata
+
+from django.db import migrations, models
+
+
+# 마이그레이션은 작성 시점의 규칙으로 실행되어야 하므로 search.index의 문자열 생성 로직을 복사해 둔다
+
+def normalize(text):
+    return ' '.join(unicodedata.normalize('NFKC', text or '').casefold().split())
+
+
+def document_grams(text):
+    grams = set()
+    for word in text.split():
+        grams |= {word[i:i + 2] for i in range(len(word) - 1)}
+    return grams
+
+
+def user_text(user, emergency_contact=''):
+    return ' '.join(filter(None, [
+        user.username, user.email, user.phone_number, emergency_contact
+    ]))
+
+
+def class_text(dance_class, instructor_username):
+    return ' '.join(filter(None, [
+        dance_class.name, instructor_username, dance_class.description
+    ]))
+
+
+def rebuild_search_index(apps, schema_editor):
+    """사용자 문서를 비상연락처 포함으로 다시 만들고, 출석/수강권 목록용 문서를 추가"""
+    User = apps.get_model('accounts', 'User')
+    StudentProfile = apps.get_model('accounts', 'StudentProfile')
+    DanceClass = apps.get_model('classes', 'DanceClass')
+    SearchDocument = apps.get_model('search', 'SearchDocument')
+    SearchGram = apps.get_model('search', 'SearchGram')
+
+    contacts = dict(StudentProfile.objects.values_list('user_id', 'emergency_contact'))
+    users = list(User.objects.all())
+    classes = list(DanceClass.objects.select_related('instructor'))
+
+    texts = [('user', user.id, user_text(user, contacts.get(user.id))) for user in users]
+    texts += [('username', user.id, user.username) for user in users]
+    texts += [
+        ('class', dance_class.id, class_text(dance_class, dance_class.instructor.username))
+        for dance_class in classes
+    ]
+    texts += [('class_name', dance_class.id, dance_class.name) for dance_class in classes]
+    texts = [(kind, object_id, normalize(text)) for kind, object_id, text in texts]
+
+    SearchGram.objects.all().delete()
+    SearchDocument.objects.all().delete()
+    SearchDocument.objects.bulk_create([
+        SearchDocument(kind=kind, object_id=object_id, text=text)
+        for kind, object_id, text in texts
+    ], batch_size=500)
+    SearchGram.objects.bulk_create([
+        SearchGram(kind=kind, gram=gram, object_id=object_id)
+        for kind, object_id, text in texts
+        for gram in document_grams(text)
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0002_backfill_search_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='searchdocument',
+            name='kind',
+            field=models.CharField(choices=[('user', '사용자'), ('username', '사용자 아이디'), ('class', '수업'), ('class_name', '수업명')], max_length=10, verbose_name='종류'),
+        ),
+        migrations.AlterField(
+            model_name='searchgram',
+            name='kind',
+            field=models.CharField(choices=[('user', '사용자'), ('username', '사용자 아이디'), ('class', '수업'), ('class_name', '수업명')], max_length=10, verbose_name='종류'),
+        ),
+        migrations.RunPython(rebuild_search_index, migrations.RunPython.noop),
+    ]
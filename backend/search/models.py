@@ -0,0 +1,54 @@
+# backend/search/models.py
+
+from django.db import models
+
+
+class SearchDocument(models.Model):
+    """
+    검색 대상 객체별 정규화된 검색 문자열
+
+    목록 화면의 검색은 원본 테이블을 JOIN해 icontains로 훑지 않고,
+    SearchGram으로 후보를 좁힌 뒤 이 테이블의 text만 확인한다.
+    """
+    KIND_CHOICES = (
+        ('user', '사용자'),
+        ('username', '사용자 아이디'),
+        ('class', '수업'),
+        ('class_name', '수업명'),
+    )
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, verbose_name='종류')
+    object_id = models.PositiveBigIntegerField(verbose_name='대상 id')
+    text = models.TextField(verbose_name='검색 문자열')
+
+    class Meta:
+        db_table = 'search_document'
+        verbose_name = '검색 문서'
+        verbose_name_plural = '검색 문서 목록'
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='unique_search_document')
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id}"
+
+
+class SearchGram(models.Model):
+    """
+    검색 문자열의 2글자 조각 (한글 두 글자 검색어도 인덱스로 찾을 수 있도록 bigram 사용)
+    """
+    kind = models.CharField(max_length=10, choices=SearchDocument.KIND_CHOICES, verbose_name='종류')
+    gram = models.CharField(max_length=2, verbose_name='조각')
+    object_id = models.PositiveBigIntegerField(verbose_name='대상 id')
+
+    class Meta:
+        db_table = 'search_gram'
+        verbose_name = '검색 조각'
+        verbose_name_plural = '검색 조각 목록'
+        indexes = [
+            models.Index(fields=['kind', 'gram', 'object_id'], name='search_gram_lookup_idx'),
+            models.Index(fields=['kind', 'object_id'], name='search_gram_object_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id} {self.gram}"
@@ -0,0 +1,73 @@
+# backend/search/signals.py
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from accounts.models import StudentProfile
+from classes.models import DanceClass
+from . import index, suggest
+
+User = get_user_model()
+
+
+@receiver(pre_save, sender=User)
+def remember_previous_username(sender, instance, update_fields=None, **kwargs):
+    """강사 아이디가 바뀌었을 때만 담당 수업 문서를 갱신하도록 이전 값을 기록"""
+    instance._previous_username = None
+    if instance.pk and instance.user_type == 'instructor' and (
+        update_fields is None or 'username' in update_fields
+    ):
+        instance._previous_username = User.objects.filter(
+            pk=instance.pk
+        ).values_list('username', flat=True).first()
+
+
+@receiver(post_save, sender=User)
+def index_user(sender, instance, update_fields=None, **kwargs):
+    # 로그인 시각 갱신은 검색 문자열과 무관
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    index.index_documents(index.USER, index.user_texts([instance]))
+    index.index_documents(index.USERNAME, {instance.id: instance.username})
+    # 수업 문서에 강사 아이디가 들어가므로 아이디가 바뀐 경우에만 담당 수업도 갱신
+    previous = getattr(instance, '_previous_username', None)
+    if previous is not None and previous != instance.username:
+        index.index_documents(index.CLASS, {
+            dance_class.id: index.class_text(dance_class, instance.username)
+            for dance_class in DanceClass.objects.filter(instructor=instance)
+        })
+    transaction.on_commit(lambda: suggest.update_student(instance))
+
+
+@receiver(post_delete, sender=User)
+def remove_user(sender, instance, **kwargs):
+    user_id = instance.id
+    index.remove_documents(index.USER, [user_id])
+    index.remove_documents(index.USERNAME, [user_id])
+    transaction.on_commit(lambda: suggest.remove(suggest.STUDENT, user_id))
+
+
+@receiver(post_save, sender=StudentProfile)
+@receiver(post_delete, sender=StudentProfile)
+def index_profile(sender, instance, **kwargs):
+    """비상연락처가 사용자 문서에 들어가므로 프로필이 바뀌면 사용자 문서도 갱신"""
+    user = User.objects.filter(pk=instance.user_id).first()
+    if user is not None:
+        index.index_documents(index.USER, index.user_texts([user]))
+
+
+@receiver(post_save, sender=DanceClass)
+def index_class(sender, instance, **kwargs):
+    index.index_documents(index.CLASS, {
+        instance.id: index.class_text(instance, instance.instructor.username)
+    })
+    index.index_documents(index.CLASS_NAME, {instance.id: instance.name})
+    transaction.on_commit(lambda: suggest.update_class(instance))
+
+
+@receiver(post_delete, sender=DanceClass)
+def remove_class(sender, instance, **kwargs):
+    class_id = instance.id
+    index.remove_documents(index.CLASS, [class_id])
+    index.remove_documents(index.CLASS_NAME, [class_id])
+    transaction.on_commit(lambda: suggest.remove(suggest.CLASS, class_id))
@@ -0,0 +1,211 @@
+# backend/search/suggest.py
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from backend.cache import is_shared
+from classes.models import DanceClass
+from .index import normalize
+
+# 자동완성용 프로세스 내 접두사 인덱스
+# (키, 종류, id)를 정렬된 배열로 들고 있다가 bisect로 접두사 범위만 읽는다.
+# 변경은 signal에서 현재 프로세스 인덱스에 바로 반영하고 공용 버전 키를 올린다.
+# 다른 프로세스는 조회 때 버전(캐시 조회 1회)이 어긋난 것을 보고 DB에서 한 번 다시 만든다.
+# 버전 키는 공유 캐시(CACHE_URL)에서만 의미가 있으므로, 로컬 메모리 캐시일 때는
+# SEARCH_SUGGEST_LOCAL_TTL초마다 다시 만들어 다른 프로세스의 변경을 늦게라도 반영한다.
+
+VERSION_KEY = 'search:suggest:version'
+
+STUDENT = 'student'
+CLASS = 'class'
+
+User = get_user_model()
+
+
+def digits(text):
+    return re.sub(r'\D', '', text or '')
+
+
+def student_keys(username, phone_number):
+    keys = {normalize(username)}
+    if digits(phone_number):
+        keys.add(digits(phone_number))
+    return keys
+
+
+def class_keys(name):
+    """수업명 전체와 각 단어 (예: '발레 기초반' → '기초'로도 찾을 수 있게)"""
+    name = normalize(name)
+    return {name, *name.split()}
+
+
+class PrefixIndex:
+    def __init__(self):
+        self.entries = []   # 정렬된 (키, 종류, id)
+        self.items = {}     # (종류, id) -> (표시 이름, 키 목록)
+
+    @classmethod
+    def from_items(cls, items):
+        """(종류, id, 표시 이름, 키 목록)들로 만든다 (하나씩 insort하지 않고 마지막에 한 번 정렬)"""
+        index = cls()
+        for kind, object_id, label, keys in items:
+            keys = [key for key in keys if key]
+            index.items[(kind, object_id)] = (label, keys)
+            index.entries.extend((key, kind, object_id) for key in keys)
+        index.entries.sort()
+        return index
+
+    def replace(self, kind, object_id, label, keys):
+        self.remove(kind, object_id)
+        keys = [key for key in keys if key]
+        self.items[(kind, object_id)] = (label, keys)
+        for key in keys:
+            insort(self.entries, (key, kind, object_id))
+
+    def remove(self, kind, object_id):
+        item = self.items.pop((kind, object_id), None)
+        if item is None:
+            return
+        for key in item[1]:
+            i = bisect_left(self.entries, (key, kind, object_id))
+            if i < len(self.entries) and self.entries[i] == (key, kind, object_id):
+                del self.entries[i]
+
+    def lookup(self, prefixes, kinds, limit):
+        """prefixes 중 하나로 시작하는 항목을 일치한 키 순으로 최대 limit개"""
+        found = {}
+        for prefix in prefixes:
+            matched = 0
+            i = bisect_left(self.entries, (prefix,))
+            while i < len(self.entries) and matched < limit:
+                key, kind, object_id = self.entries[i]
+                if not key.startswith(prefix):
+                    break
+                if kind in kinds and (kind, object_id) not in found:
+                    found[(kind, object_id)] = key
+                    matched += 1
+                i += 1
+        best = sorted(found.items(), key=lambda item: (item[1], item[0]))[:limit]
+        return [
+            {'type': kind, 'id': object_id, 'label': self.items[(kind, object_id)][0]}
+            for (kind, object_id), _ in best
+        ]
+
+
+_lock = threading.Lock()        # _index 교체와 증분 반영
+_build_lock = threading.Lock()  # 재생성은 한 번에 하나만 (그동안 _lock은 잡지 않는다)
+_index = None
+_version = None
+_built_at = 0.0
+_changes = 0                    # 이 프로세스에서 반영한 변경 수 (재생성 중 변경 감지용)
+
+
+def _get_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, timeout=None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+
+def _bump_version():
+    try:
+        return cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, 1, timeout=None)
+        return None
+
+
+def _items():
+    students = User.objects.filter(user_type='student').values_list('id', 'username', 'phone_number')
+    for object_id, username, phone_number in students.iterator():
+        yield STUDENT, object_id, username, student_keys(username, phone_number)
+    for object_id, name in DanceClass.objects.values_list('id', 'name').iterator():
+        yield CLASS, object_id, name, class_keys(name)
+
+
+def _build():
+    return PrefixIndex.from_items(_items())
+
+
+def _is_stale(version):
+    if _index is None:
+        return True
+    if version is None:
+        # 공유 캐시가 아니면 다른 프로세스의 변경을 알 수 없으므로 일정 시간마다 다시 만든다
+        return time.monotonic() - _built_at > settings.SEARCH_SUGGEST_LOCAL_TTL
+    return _version != version
+
+
+def get_index():
+    """현재 버전의 인덱스 (다른 프로세스에서 변경이 있었으면 다시 만든다)"""
+    global _index, _version, _built_at
+    # 버전은 DB를 읽기 전에 확인해야 그 뒤의 변경을 놓치지 않는다
+    version = _get_version() if is_shared() else None
+    with _lock:
+        if not _is_stale(version):
+            return _index
+
+    with _build_lock:
+        with _lock:
+            # 기다리는 동안 다른 스레드가 이미 만들었을 수 있다
+            if not _is_stale(version):
+                return _index
+            changes = _changes
+        # DB 조회와 정렬은 락 밖에서 (그동안 조회와 증분 반영은 이전 인덱스로 계속된다)
+        index = _build()
+        with _lock:
+            _index, _version, _built_at = index, version, time.monotonic()
+            if _changes != changes:
+                # 만드는 사이 이전 인덱스에만 반영된 변경이 있으면 다음 조회 때 다시 만든다
+                _version, _built_at = None, float('-inf')
+            return index
+
+
+def _apply(change):
+    """현재 프로세스 인덱스에 변경 반영 후 버전 증가 (커밋 후 호출)"""
+    global _version, _changes
+    version = _bump_version() if is_shared() else None
+    with _lock:
+        _changes += 1
+        if _index is None:
+            return
+        change(_index)
+        # 그 사이 다른 프로세스의 변경이 없었을 때만 최신으로 간주 (아니면 다음 조회 때 재생성)
+        if version is not None and _version == version - 1:
+            _version = version
+        else:
+            _version = None
+
+
+def update_student(user):
+    if user.user_type != 'student':
+        return remove(STUDENT, user.id)
+    keys = student_keys(user.username, user.phone_number)
+    return _apply(lambda index: index.replace(STUDENT, user.id, user.username, keys))
+
+
+def update_class(dance_class):
+    keys = class_keys(dance_class.name)
+    return _apply(lambda index: index.replace(CLASS, dance_class.id, dance_class.name, keys))
+
+
+def remove(kind, object_id):
+    return _apply(lambda index: index.remove(kind, object_id))
+
+
+def suggest(query, kinds=(STUDENT, CLASS), limit=10):
+    """검색어로 시작하는 수강생(아이디/전화번호)과 수업명 (DB 조회 없음)"""
+    prefixes = {normalize(query)}
+    # 010-1234 처럼 입력한 전화번호는 숫자만으로도 찾는다
+    if re.fullmatch(r'[\d\s-]+', query or '') and digits(query):
+        prefixes.add(digits(query))
+    prefixes.discard('')
+    if not prefixes:
+        return []
+    return get_index().lookup(sorted(prefixes), set(kinds), limit)
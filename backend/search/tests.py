@@ -0,0 +1,258 @@
+from datetime import time, timedelta
+from importlib import import_module
+from io import StringIO
+from unittest import mock
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import StudentProfile
+from attendance.models import Attendance
+from backend.testing import QueryPlanAssertionsMixin
+from classes.models import ClassSchedule, DanceClass
+from subscriptions.models import Subscription
+from . import index, suggest
+from .models import SearchDocument, SearchGram
+
+User = get_user_model()
+
+
+class SearchIndexTest(QueryPlanAssertionsMixin, TestCase):
+    def setUp(self):
+        self.instructor = User.objects.create(username='Kim', user_type='instructor')
+        self.ballet = DanceClass.objects.create(
+            name='발레 기초반', instructor=self.instructor, capacity=10,
+            description='처음 시작하는 분들을 위한 수업'
+        )
+        self.jazz = DanceClass.objects.create(
+            name='재즈 중급', instructor=User.objects.create(username='lee', user_type='instructor'),
+            capacity=10
+        )
+
+    def _search(self, kind, query):
+        return set(index.search_ids(kind, query).values_list('object_id', flat=True))
+
+    def test_matches_korean_substrings_and_all_terms(self):
+        self.assertEqual(self._search(index.CLASS, '기초'), {self.ballet.id})
+        self.assertEqual(self._search(index.CLASS, '발'), {self.ballet.id})
+        self.assertEqual(self._search(index.CLASS, '초기'), set())
+        self.assertEqual(self._search(index.CLASS, 'ＫＩＭ 수업'), {self.ballet.id})
+        self.assertEqual(self._search(index.CLASS, '재즈 기초'), set())
+        self.assertIsNone(index.search_ids(index.CLASS, '   '))
+
+    def test_signals_keep_documents_current(self):
+        self.instructor.username = 'park'
+        self.instructor.save()
+        self.assertEqual(self._search(index.CLASS, 'kim'), set())
+        self.assertEqual(self._search(index.CLASS, 'park'), {self.ballet.id})
+
+        self.ballet.delete()
+        self.assertFalse(
+            SearchGram.objects.filter(kind=index.CLASS, object_id=self.ballet.id).exists()
+        )
+
+    def test_instructor_save_without_username_change_skips_classes(self):
+        with mock.patch.object(index, 'index_documents', wraps=index.index_documents) as indexed:
+            self.instructor.first_name = '민수'
+            self.instructor.save()
+            self.instructor.username = 'choi'
+            self.instructor.save(update_fields=['first_name'])
+        self.assertEqual(
+            [call.args[0] for call in indexed.call_args_list],
+            [index.USER, index.USERNAME] * 2
+        )
+        self.assertEqual(self._search(index.CLASS, 'kim'), {self.ballet.id})
+
+    def test_backfill_migrations_match_current_index(self):
+        StudentProfile.objects.create(user=self.instructor, emergency_contact='010-5555-0000')
+        expected = set(SearchDocument.objects.values_list('kind', 'object_id', 'text'))
+        SearchGram.objects.all().delete()
+        SearchDocument.objects.all().delete()
+
+        import_module('search.migrations.0002_backfill_search_index').build_search_index(apps, None)
+        import_module('search.migrations.0003_search_kinds_by_list').rebuild_search_index(apps, None)
+        self.assertEqual(set(SearchDocument.objects.values_list('kind', 'object_id', 'text')), expected)
+        self.assertEqual(self._search(index.CLASS, '기초'), {self.ballet.id})
+        self.assertEqual(self._search(index.USER, '5555'), {self.instructor.id})
+
+    def test_rebuild_command_catches_bulk_updates(self):
+        DanceClass.objects.filter(id=self.jazz.id).update(name='힙합 입문')
+        self.assertEqual(self._search(index.CLASS, '힙합'), set())
+
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(self._search(index.CLASS, '힙합'), {self.jazz.id})
+        self.assertEqual(self._search(index.CLASS_NAME, '힙합'), {self.jazz.id})
+        self.assertEqual(
+            SearchDocument.objects.filter(kind=index.CLASS).count(), 2
+        )
+
+    def test_candidates_use_gram_index(self):
+        queryset = SearchGram.objects.filter(kind=index.CLASS, gram__in=['발레'])
+        self.assertUsesIndex(queryset, 'search_gram_lookup_idx')
+
+
+class IndexedSearchFilterTest(TestCase):
+    def setUp(self):
+        instructor = User.objects.create(username='instructor', user_type='instructor')
+        ballet = DanceClass.objects.create(name='발레 기초반', instructor=instructor, capacity=10)
+        jazz = DanceClass.objects.create(
+            name='재즈', instructor=instructor, capacity=10, description='입문자 환영'
+        )
+        self.hong = User.objects.create(username='hong', first_name='길동', user_type='student')
+        self.choi = User.objects.create(username='choi', user_type='student')
+
+        today = timezone.localdate()
+        self.subscriptions = {}
+        for student, dance_class in ((self.hong, jazz), (self.choi, ballet)):
+            self.subscriptions[student.username] = Subscription.objects.create(
+                student=student,
+                dance_class=dance_class,
+                subscription_type='days',
+                start_date=today,
+                end_date=today + timedelta(days=30),
+            )
+            schedule = ClassSchedule.objects.create(
+                dance_class=dance_class, weekday=0,
+                start_time=time(18), end_time=time(19), room=dance_class.name
+            )
+            Attendance.objects.create(
+                student=student, dance_class=dance_class, schedule=schedule, date=today
+            )
+
+        self.client = APIClient()
+        self.client.force_authenticate(instructor)
+
+    def _ids(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return {row['id'] for row in response.data['results']}
+
+    def test_subscription_search_matches_student_or_class(self):
+        self.assertEqual(
+            self._ids('/api/subscriptions/?search=hon'),
+            {self.subscriptions['hong'].id}
+        )
+        self.assertEqual(
+            self._ids('/api/subscriptions/?search=발레'),
+            {self.subscriptions['choi'].id}
+        )
+
+    def test_subscription_search_keeps_previous_fields(self):
+        # 수강생 아이디와 수업명만 검색 (이름, 강사, 수업 설명은 제외)
+        for url in ('/api/subscriptions/', '/api/attendance/'):
+            with self.subTest(url=url):
+                self.assertEqual(len(self._ids(f'{url}?search=hon')), 1)
+                self.assertEqual(self._ids(f'{url}?search=길동'), set())
+                self.assertEqual(self._ids(f'{url}?search=instructor'), set())
+                self.assertEqual(self._ids(f'{url}?search=입문'), set())
+
+    def test_student_search(self):
+        self.assertEqual(self._ids('/api/students/?search=cho'), {self.choi.id})
+        self.assertEqual(self._ids('/api/students/'), {self.hong.id, self.choi.id})
+
+    def test_student_search_matches_emergency_contact(self):
+        profile = StudentProfile.objects.get(user=self.choi)
+        profile.emergency_contact = '010-7777-1234'
+        profile.save()
+        self.assertEqual(self._ids('/api/students/?search=7777'), {self.choi.id})
+
+        profile.emergency_contact = '010-8888-1234'
+        profile.save()
+        self.assertEqual(self._ids('/api/students/?search=7777'), set())
+        self.assertEqual(self._ids('/api/students/?search=8888'), {self.choi.id})
+
+
+class SuggestTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        suggest._index = suggest._version = None
+        self.instructor = User.objects.create(username='instructor', user_type='instructor')
+        self.hong = User.objects.create(
+            username='Hong', phone_number='010-1234-5678', user_type='student'
+        )
+        self.ballet = DanceClass.objects.create(
+            name='발레 기초반', instructor=self.instructor, capacity=10
+        )
+
+    def _ids(self, query, **kwargs):
+        return [(item['type'], item['id']) for item in suggest.suggest(query, **kwargs)]
+
+    def test_prefix_matches_without_queries_once_built(self):
+        suggest.get_index()
+        with self.assertNumQueries(0):
+            self.assertEqual(self._ids('ho'), [('student', self.hong.id)])
+            self.assertEqual(self._ids('010-12'), [('student', self.hong.id)])
+            self.assertEqual(self._ids('기초'), [('class', self.ballet.id)])
+            self.assertEqual(self._ids('기초', kinds=['student']), [])
+            self.assertEqual(self._ids('instructor'), [])
+            self.assertEqual(self._ids(''), [])
+
+    def test_local_changes_apply_incrementally(self):
+        suggest.get_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            jazz = DanceClass.objects.create(name='기초 재즈', instructor=self.instructor, capacity=10)
+            self.hong.delete()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self._ids('기초'), [('class', jazz.id), ('class', self.ballet.id)]
+            )
+            self.assertEqual(self._ids('ho'), [])
+
+    @mock.patch('search.suggest.is_shared', return_value=True)
+    def test_changes_from_other_processes_trigger_rebuild(self, _):
+        suggest.get_index()
+        # 다른 프로세스에서 수정한 것처럼: DB만 바꾸고 버전 증가
+        DanceClass.objects.filter(id=self.ballet.id).update(name='힙합')
+        cache.incr(suggest.VERSION_KEY)
+        self.assertEqual(self._ids('힙'), [('class', self.ballet.id)])
+
+    def test_without_shared_cache_rebuilds_after_ttl(self):
+        suggest.get_index()
+        DanceClass.objects.filter(id=self.ballet.id).update(name='힙합')
+        with self.settings(SEARCH_SUGGEST_LOCAL_TTL=60):
+            with self.assertNumQueries(0):
+                self.assertEqual(self._ids('힙'), [])
+            suggest._built_at -= 61
+            self.assertEqual(self._ids('힙'), [('class', self.ballet.id)])
+
+    def test_build_sorts_once_outside_lock(self):
+        User.objects.create(username='Abe', phone_number='010-9999-0000', user_type='student')
+        build = suggest._build
+
+        def check_unlocked():
+            self.assertFalse(suggest._lock.locked())
+            return build()
+
+        with mock.patch('search.suggest._build', side_effect=check_unlocked):
+            index = suggest.get_index()
+        self.assertEqual(index.entries, sorted(index.entries))
+        self.assertEqual(len(index.entries), 7)
+        self.assertEqual([item['label'] for item in index.lookup(['a', 'h'], {'student'}, 10)], ['Abe', 'Hong'])
+
+    def test_change_during_build_forces_next_rebuild(self):
+        build = suggest._build
+
+        def build_with_concurrent_change():
+            index = build()
+            with self.captureOnCommitCallbacks(execute=True):
+                DanceClass.objects.create(name='힙합', instructor=self.instructor, capacity=10)
+            return index
+
+        with mock.patch('search.suggest._build', side_effect=build_with_concurrent_change):
+            self.assertEqual(self._ids('힙'), [])
+        self.assertEqual(len(self._ids('힙')), 1)
+
+    def test_endpoint_limits_results(self):
+        for i in range(3):
+            User.objects.create(username=f'hong{i}', user_type='student')
+        client = APIClient()
+        client.force_authenticate(self.instructor)
+        response = client.get('/api/search/suggest/', {'q': 'HONG', 'type': 'student', 'limit': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['label'] for item in response.data['results']], ['Hong', 'hong0'])
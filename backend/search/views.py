@@ -0,0 +1,31 @@
+# backend/search/views.py
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from . import suggest
+
+# 자동완성 결과 수
+DEFAULT_SUGGEST_LIMIT = 10
+MAX_SUGGEST_LIMIT = 20
+
+
+@api_view(['GET'])
+def suggestions(request):
+    """
+    검색창 자동완성
+
+    q: 검색어, type: student | class (없으면 둘 다), limit: 최대 개수
+    프로세스 메모리의 접두사 인덱스에서 바로 찾으므로 DB를 조회하지 않는다.
+    """
+    kinds = [
+        kind for kind in request.query_params.getlist('type')
+        if kind in (suggest.STUDENT, suggest.CLASS)
+    ] or [suggest.STUDENT, suggest.CLASS]
+    try:
+        limit = int(request.query_params.get('limit', DEFAULT_SUGGEST_LIMIT))
+    except ValueError:
+        limit = DEFAULT_SUGGEST_LIMIT
+    limit = max(1, min(limit, MAX_SUGGEST_LIMIT))
+
+    return Response({
+        'results': suggest.suggest(request.query_params.get('q', ''), kinds, limit)
+    })
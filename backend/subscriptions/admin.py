@@ -1,7 +1,7 @@
 # backend/subscriptions/admin.py
 
 from django.contrib import admin
-from .models import Subscription, SubscriptionPause
+from .models import Subscription, SubscriptionPause, RevenueDailySummary
 
 class SubscriptionPauseInline(admin.TabularInline):
     model = SubscriptionPause
@@ -36,4 +36,12 @@ class SubscriptionPauseAdmin(admin.ModelAdmin):
     list_display = ('subscription', 'start_date', 'end_date', 'created_at')
     list_filter = ('start_date', 'end_date')
     search_fields = ('subscription__student__username', 'reason')
-    raw_id_fields = ('subscription',)
\ No newline at end of file
+    raw_id_fields = ('subscription',)
+
+@admin.register(RevenueDailySummary)
+class RevenueDailySummaryAdmin(admin.ModelAdmin):
+    list_display = ('date', 'dance_class', 'subscription_type',
+                    'revenue', 'subscription_count', 'active_count')
+    list_filter = ('subscription_type', 'dance_class', 'dance_class__instructor')
+    date_hierarchy = 'date'
+    readonly_fields = ('updated_at',)
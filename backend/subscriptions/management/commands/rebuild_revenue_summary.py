@@ -0,0 +1,34 @@
+# backend/subscriptions/management/commands/rebuild_revenue_summary.py
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from subscriptions.services.rollup_service import RevenueRollupService
+
+
+class Command(BaseCommand):
+    help = '수강권 결제 내역으로부터 일별 매출 집계 테이블을 다시 생성한다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start-date', help='시작일 (YYYY-MM-DD)')
+        parser.add_argument('--end-date', help='종료일 (YYYY-MM-DD)')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        try:
+            start_date = self._parse_date(options['start_date'])
+            end_date = self._parse_date(options['end_date'])
+        except ValueError:
+            raise CommandError('날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)')
+
+        with transaction.atomic():
+            created = RevenueRollupService.rebuild(
+                start_date, end_date, batch_size=options['batch_size']
+            )
+
+        self.stdout.write(self.style.SUCCESS(f'{created}개의 일별 매출 집계를 생성했습니다.'))
+
+    @staticmethod
+    def _parse_date(value):
+        if not value:
+            return None
+        return datetime.strptime(value, '%Y-%m-%d').date()
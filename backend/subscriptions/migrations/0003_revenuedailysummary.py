@@ -0,0 +1,63 @@
+# Generated by Django 4.2.7 on 2026-10-18 20:11
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, Max, Q, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_daily_summary(apps, schema_editor):
+    Subscription = apps.get_model('subscriptions', 'Subscription')
+    RevenueDailySummary = apps.get_model('subscriptions', 'RevenueDailySummary')
+
+    rows = Subscription.objects.order_by().annotate(
+        date=TruncDate('created_at')
+    ).values(
+        'date', 'dance_class_id', 'subscription_type'
+    ).annotate(
+        instructor_id=Max('dance_class__instructor_id'),
+        revenue=Sum('price_paid'),
+        subscription_count=Count('id'),
+        active_count=Count('id', filter=Q(status='active')),
+    )
+    RevenueDailySummary.objects.bulk_create(
+        (RevenueDailySummary(**row) for row in rows.iterator()),
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('classes', '0003_danceclass_current_students_count'),
+        ('subscriptions', '0002_alter_subscription_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevenueDailySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='결제일')),
+                ('subscription_type', models.CharField(choices=[('days', '기간제'), ('counts', '횟수제')], max_length=10, verbose_name='수강권 종류')),
+                ('revenue', models.PositiveBigIntegerField(default=0, verbose_name='매출')),
+                ('subscription_count', models.PositiveIntegerField(default=0, verbose_name='수강권 수')),
+                ('active_count', models.PositiveIntegerField(default=0, verbose_name='이용중 수강권 수')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('dance_class', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revenue_summaries', to='classes.danceclass', verbose_name='수업')),
+                ('instructor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revenue_summaries', to=settings.AUTH_USER_MODEL, verbose_name='강사')),
+            ],
+            options={
+                'verbose_name': '일별 매출 집계',
+                'verbose_name_plural': '일별 매출 집계 목록',
+                'db_table': 'revenue_daily_summary',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='revenuedailysummary',
+            constraint=models.UniqueConstraint(fields=('date', 'dance_class', 'subscription_type'), name='unique_daily_revenue_summary'),
+        ),
+        migrations.RunPython(backfill_daily_summary, migrations.RunPython.noop),
+    ]
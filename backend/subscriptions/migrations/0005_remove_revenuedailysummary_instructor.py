@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 20:46
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('subscriptions', '0004_subscription_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='revenuedailysummary',
+            name='instructor',
+        ),
+    ]
@@ -1,6 +1,6 @@
 # backend/subscriptions/models.py
 
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.utils import timezone
@@ -72,10 +72,27 @@ class Subscription(models.Model):
         verbose_name = '수강권'
         verbose_name_plural = '수강권 목록'
         ordering = ['-created_at']
+        indexes = [
+            # 상태별 만료일 조회 (만료 예정 알림, expiring_soon 필터)
+            models.Index(fields=['status', 'end_date'], name='subscription_status_end_idx'),
+            # 수업별 이용중 수강권 (수강생 수, 오늘의 수업)
+            models.Index(
+                fields=['dance_class'],
+                condition=models.Q(status='active'),
+                name='subscription_active_class_idx'
+            ),
+            # 목록 정렬/키셋 페이지네이션 (-created_at, -id)
+            models.Index(fields=['-created_at', '-id'], name='subscription_created_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.student.username}의 {self.dance_class.name} 수강권"
 
+    def save(self, *args, **kwargs):
+        # 수업의 수강생 수 카운터(signals)가 같은 트랜잭션에서 갱신되도록 묶는다
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     def clean(self):
         if self.subscription_type == 'counts' and not self.total_classes:
             raise ValidationError('횟수제 수강권은 전체 수업 횟수를 지정해야 합니다.')
@@ -112,4 +129,43 @@ class SubscriptionPause(models.Model):
 
     def clean(self):
         if self.end_date <= self.start_date:
-            raise ValidationError('종료일은 시작일보다 이후여야 합니다.')
\ No newline at end of file
+            raise ValidationError('종료일은 시작일보다 이후여야 합니다.')
+
+
+class RevenueDailySummary(models.Model):
+    """
+    일/수업/수강권 종류별 매출 집계 (매출 통계 조회용 롤업 테이블)
+
+    강사는 수업 변경 시 갱신되지 않도록 저장하지 않고 조회 시 dance_class를 통해 조인한다.
+    """
+
+    date = models.DateField(verbose_name='결제일')
+    dance_class = models.ForeignKey(
+        'classes.DanceClass',
+        on_delete=models.CASCADE,
+        related_name='revenue_summaries',
+        verbose_name='수업'
+    )
+    subscription_type = models.CharField(
+        max_length=10,
+        choices=Subscription.TYPE_CHOICES,
+        verbose_name='수강권 종류'
+    )
+    revenue = models.PositiveBigIntegerField(default=0, verbose_name='매출')
+    subscription_count = models.PositiveIntegerField(default=0, verbose_name='수강권 수')
+    active_count = models.PositiveIntegerField(default=0, verbose_name='이용중 수강권 수')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'revenue_daily_summary'
+        verbose_name = '일별 매출 집계'
+        verbose_name_plural = '일별 매출 집계 목록'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date', 'dance_class', 'subscription_type'],
+                name='unique_daily_revenue_summary'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.dance_class_id} ({self.date}, {self.subscription_type}): {self.revenue}"
@@ -0,0 +1,91 @@
+# backend/subscriptions/services/rollup_service.py
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+from ..models import Subscription, RevenueDailySummary
+
+SUMMARY_FIELDS = ['revenue', 'subscription_count', 'active_count', 'updated_at']
+
+
+def summarize(queryset):
+    """수강권을 (결제일, 수업, 수강권 종류) 단위 매출 집계 행으로 변환"""
+    return queryset.order_by().annotate(
+        date=TruncDate('created_at')
+    ).values(
+        'date', 'dance_class_id', 'subscription_type'
+    ).annotate(
+        revenue=Sum('price_paid'),
+        subscription_count=Count('id'),
+        active_count=Count('id', filter=Q(status='active')),
+    )
+
+
+class RevenueRollupService:
+    @staticmethod
+    def refresh(keys):
+        """
+        (date, dance_class_id, subscription_type) 단위로 집계 행을 다시 계산
+
+        수강권 생성/금액·상태 변경/삭제 시 영향을 받은 키만 원본에서 재집계한다.
+        """
+        keys = set(keys)
+        if not keys:
+            return
+
+        query = Q()
+        for date, class_id, subscription_type in keys:
+            query |= Q(
+                created_at__date=date,
+                dance_class_id=class_id,
+                subscription_type=subscription_type
+            )
+
+        summaries = [
+            RevenueDailySummary(**row)
+            for row in summarize(Subscription.objects.filter(query))
+        ]
+        if summaries:
+            RevenueDailySummary.objects.bulk_create(
+                summaries,
+                update_conflicts=True,
+                unique_fields=['date', 'dance_class', 'subscription_type'],
+                update_fields=SUMMARY_FIELDS,
+            )
+
+        # 수강권이 모두 삭제된 키는 집계 행도 제거
+        remaining = {
+            (summary.date, summary.dance_class_id, summary.subscription_type)
+            for summary in summaries
+        }
+        empty_query = Q()
+        for date, class_id, subscription_type in keys - remaining:
+            empty_query |= Q(date=date, dance_class_id=class_id, subscription_type=subscription_type)
+        if empty_query:
+            RevenueDailySummary.objects.filter(empty_query).delete()
+
+    @staticmethod
+    def rebuild(start_date=None, end_date=None, batch_size=1000):
+        """기간 내 매출 집계 테이블 전체 재생성. 생성된 집계 행 수 반환"""
+        subscriptions = Subscription.objects.all()
+        summaries = RevenueDailySummary.objects.all()
+        if start_date:
+            subscriptions = subscriptions.filter(created_at__date__gte=start_date)
+            summaries = summaries.filter(date__gte=start_date)
+        if end_date:
+            subscriptions = subscriptions.filter(created_at__date__lte=end_date)
+            summaries = summaries.filter(date__lte=end_date)
+
+        summaries.delete()
+
+        created = 0
+        batch = []
+        for row in summarize(subscriptions).iterator(chunk_size=batch_size):
+            batch.append(RevenueDailySummary(**row))
+            if len(batch) >= batch_size:
+                RevenueDailySummary.objects.bulk_create(batch)
+                created += len(batch)
+                batch = []
+        if batch:
+            RevenueDailySummary.objects.bulk_create(batch)
+            created += len(batch)
+
+        return created
@@ -1,94 +1,107 @@
 # backend/subscriptions/services/stats_service.py
-from django.db.models import Sum, Count, F, Q, Avg
-from django.db.models.functions import TruncDate, TruncMonth
+from datetime import datetime, time
+from django.db.models import Sum, Count
+from django.db.models.functions import Coalesce, TruncMonth
 from django.utils import timezone
-from datetime import timedelta
-from ..models import Subscription
-from attendance.models import Attendance
-from classes.models import DanceClass
+from backend.async_db import fetch_aggregate, fetch_list, gather_queries
+from ..models import RevenueDailySummary
+
+# 모든 매출 통계는 원본 subscription 테이블 대신
+# 일별 매출 집계 테이블(RevenueDailySummary)에서 조회한다.
+# 강사 정보는 집계 행에 복사하지 않고 dance_class__instructor_id로 조인한다.
+
+
+def _average_price(revenue, count):
+    return revenue / count if count else None
+
 
 class RevenueStatsService:
     @staticmethod
-    async def get_revenue_summary(start_date=None, end_date=None):
-        """매출 요약 통계"""
-        query = Subscription.objects.all()
-        
+    def _filter_period(query, start_date=None, end_date=None):
         if start_date:
-            query = query.filter(created_at__gte=start_date)
+            query = query.filter(date__gte=start_date)
         if end_date:
-            query = query.filter(created_at__lte=end_date)
-            
-        summary = await query.aggregate(
-            total_revenue=Sum('price_paid'),
-            total_subscriptions=Count('id'),
-            active_subscriptions=Count(
-                'id',
-                filter=Q(status='active')
+            query = query.filter(date__lte=end_date)
+        return query
+
+    @staticmethod
+    async def get_revenue_summary(start_date=None, end_date=None):
+        """매출 요약 통계"""
+        query = RevenueStatsService._filter_period(
+            RevenueDailySummary.objects.all(), start_date, end_date
+        )
+
+        summary, subscription_types = await gather_queries(
+            fetch_aggregate(
+                query,
+                total_revenue=Sum('revenue'),
+                total_subscriptions=Coalesce(Sum('subscription_count'), 0),
+                active_subscriptions=Coalesce(Sum('active_count'), 0)
             ),
-            avg_price=Avg('price_paid')
+            # 유형별 매출
+            fetch_list(query.order_by().values(
+                'subscription_type'
+            ).annotate(
+                revenue=Sum('revenue'),
+                count=Sum('subscription_count')
+            ))
         )
-        
-        # 유형별 매출
-        subscription_types = await query.values(
-            'subscription_type'
-        ).annotate(
-            revenue=Sum('price_paid'),
-            count=Count('id')
+        summary['avg_price'] = _average_price(
+            summary['total_revenue'], summary['total_subscriptions']
         )
-        
+
         summary['subscription_types'] = subscription_types
         return summary
 
     @staticmethod
     async def get_monthly_revenue(year=None, month=None):
         """월별 매출 통계"""
-        query = Subscription.objects.all()
-        
+        query = RevenueDailySummary.objects.all()
+
         if year:
-            query = query.filter(created_at__year=year)
+            query = query.filter(date__year=year)
         if month:
-            query = query.filter(created_at__month=month)
-            
-        monthly_data = await query.annotate(
-            month=TruncMonth('created_at')
+            query = query.filter(date__month=month)
+
+        monthly_data = await fetch_list(query.annotate(
+            month=TruncMonth('date')
         ).values(
             'month'
         ).annotate(
-            revenue=Sum('price_paid'),
-            subscriptions=Count('id')
-        ).order_by('month')
-        
+            revenue=Sum('revenue'),
+            subscriptions=Sum('subscription_count')
+        ).order_by('month'))
+
+        # 원본 created_at 기준 TruncMonth와 같은 타입(현재 시간대의 월 시작 datetime)으로 반환
+        for row in monthly_data:
+            row['month'] = timezone.make_aware(datetime.combine(row['month'], time.min))
+
         return monthly_data
 
     @staticmethod
     async def get_class_revenue(class_id, start_date=None, end_date=None):
         """수업별 매출 통계"""
-        query = Subscription.objects.filter(dance_class_id=class_id)
-        
-        if start_date:
-            query = query.filter(created_at__gte=start_date)
-        if end_date:
-            query = query.filter(created_at__lte=end_date)
-            
-        revenue_data = await query.aggregate(
-            total_revenue=Sum('price_paid'),
-            total_subscriptions=Count('id'),
-            active_subscriptions=Count(
-                'id',
-                filter=Q(status='active')
-            )
+        query = RevenueStatsService._filter_period(
+            RevenueDailySummary.objects.filter(dance_class_id=class_id),
+            start_date, end_date
         )
-        
-        # 일별 매출
-        daily_data = await query.annotate(
-            date=TruncDate('created_at')
-        ).values(
-            'date'
-        ).annotate(
-            revenue=Sum('price_paid'),
-            subscriptions=Count('id')
-        ).order_by('date')
-        
+
+        revenue_data, daily_data = await gather_queries(
+            fetch_aggregate(
+                query,
+                total_revenue=Sum('revenue'),
+                total_subscriptions=Coalesce(Sum('subscription_count'), 0),
+                active_subscriptions=Coalesce(Sum('active_count'), 0)
+            ),
+            # 일별 매출
+            fetch_list(query.values(
+                'date'
+            ).annotate(
+                revenue=Sum('revenue'),
+                subscriptions=Sum('subscription_count')
+            ).order_by('date'))
+        )
+
         return {
             'summary': revenue_data,
             'daily_data': daily_data
@@ -97,30 +110,28 @@ class RevenueStatsService:
     @staticmethod
     async def get_instructor_revenue(instructor_id, start_date=None, end_date=None):
         """강사별 매출 통계"""
-        query = Subscription.objects.filter(
-            dance_class__instructor_id=instructor_id
+        query = RevenueStatsService._filter_period(
+            RevenueDailySummary.objects.filter(dance_class__instructor_id=instructor_id),
+            start_date, end_date
         )
-        
-        if start_date:
-            query = query.filter(created_at__gte=start_date)
-        if end_date:
-            query = query.filter(created_at__lte=end_date)
-            
-        revenue_data = await query.aggregate(
-            total_revenue=Sum('price_paid'),
-            total_subscriptions=Count('id'),
-            total_classes=Count('dance_class', distinct=True)
+
+        revenue_data, class_data = await gather_queries(
+            fetch_aggregate(
+                query,
+                total_revenue=Sum('revenue'),
+                total_subscriptions=Coalesce(Sum('subscription_count'), 0),
+                total_classes=Count('dance_class', distinct=True)
+            ),
+            # 수업별 매출
+            fetch_list(query.values(
+                'dance_class__name'
+            ).annotate(
+                revenue=Sum('revenue'),
+                subscriptions=Sum('subscription_count')
+            ).order_by('-revenue'))
         )
-        
-        # 수업별 매출
-        class_data = await query.values(
-            'dance_class__name'
-        ).annotate(
-            revenue=Sum('price_paid'),
-            subscriptions=Count('id')
-        ).order_by('-revenue')
-        
+
         return {
             'summary': revenue_data,
             'class_data': class_data
-        }
\ No newline at end of file
+        }
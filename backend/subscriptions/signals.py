@@ -0,0 +1,61 @@
+# backend/subscriptions/signals.py
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from classes.models import DanceClass
+from .models import Subscription
+from .services.rollup_service import RevenueRollupService
+
+# 카운터/집계에 영향을 주는 필드
+TRACKED_FIELDS = ('dance_class_id', 'status', 'subscription_type', 'price_paid')
+
+
+def _tracked_state(instance):
+    return tuple(getattr(instance, field) for field in TRACKED_FIELDS)
+
+
+def _revenue_key(instance, state):
+    created_date = timezone.localtime(instance.created_at).date()
+    return (created_date, state[0], state[2])
+
+
+@receiver(pre_save, sender=Subscription)
+def remember_previous_state(sender, instance, **kwargs):
+    """저장 전 상태를 기록해 카운터/집계 변화량 계산에 사용"""
+    instance._previous_state = None
+    if instance.pk:
+        instance._previous_state = Subscription.objects.filter(
+            pk=instance.pk
+        ).values_list(*TRACKED_FIELDS).first()
+
+
+@receiver(post_save, sender=Subscription)
+def update_aggregates_on_save(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_state', None)
+    current = _tracked_state(instance)
+
+    if previous == current:
+        return
+
+    # 수업별 현재 수강생 수
+    previous_active = previous and previous[1] == 'active'
+    current_active = current[1] == 'active'
+    if previous_active and (not current_active or previous[0] != current[0]):
+        DanceClass.adjust_students_count(previous[0], -1)
+    if current_active and (not previous_active or previous[0] != current[0]):
+        DanceClass.adjust_students_count(current[0], 1)
+
+    # 일별 매출 집계
+    keys = {_revenue_key(instance, current)}
+    if previous:
+        keys.add(_revenue_key(instance, previous))
+    RevenueRollupService.refresh(keys)
+
+    instance._previous_state = current
+
+
+@receiver(post_delete, sender=Subscription)
+def update_aggregates_on_delete(sender, instance, **kwargs):
+    if instance.status == 'active':
+        DanceClass.adjust_students_count(instance.dance_class_id, -1)
+    RevenueRollupService.refresh({_revenue_key(instance, _tracked_state(instance))})
@@ -1,3 +1,140 @@
+from datetime import date, datetime
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate, TruncMonth
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from backend.testing import QueryPlanAssertionsMixin
+from classes.models import DanceClass
+from .models import Subscription
+from .services.rollup_service import RevenueRollupService
+from .services.stats_service import RevenueStatsService
+from .views import SubscriptionViewSet
+
+User = get_user_model()
+
+
+class SubscriptionIndexUsageTest(QueryPlanAssertionsMixin, TestCase):
+    def _list_queryset(self, **params):
+        view = SubscriptionViewSet()
+        view.request = Request(APIRequestFactory().get('/api/subscriptions/', params))
+        return view.get_queryset()
+
+    def test_expiring_soon_uses_status_end_date_index(self):
+        queryset = self._list_queryset(expiring_soon='true')
+        self.assertUsesIndex(queryset, 'subscription_status_end_idx')
+
+    def test_expiry_notification_uses_status_end_date_index(self):
+        queryset = Subscription.objects.filter(status='active', end_date=date(2024, 1, 8))
+        self.assertUsesIndex(queryset, 'subscription_status_end_idx')
+
+    def test_active_by_class_uses_partial_index(self):
+        queryset = Subscription.objects.filter(dance_class_id=1, status='active')
+        self.assertUsesIndex(queryset, 'subscription_active_class_idx')
+
+    def test_list_ordering_uses_created_id_index(self):
+        queryset = Subscription.objects.order_by('-created_at', '-id')[:10]
+        self.assertUsesIndex(queryset, 'subscription_created_id_idx')
+
+
+class RevenueRollupStatsTest(TestCase):
+    """매출 집계 테이블로 계산한 통계가 원본 수강권으로 계산한 값과 같은지 확인"""
+
+    def setUp(self):
+        self.instructors = [
+            User.objects.create(username=f'instructor{i}', user_type='instructor') for i in range(2)
+        ]
+        self.classes = [
+            DanceClass.objects.create(name=f'class{i}', instructor=self.instructors[0], capacity=20)
+            for i in range(2)
+        ]
+        student = User.objects.create(username='student', user_type='student')
+        rows = [
+            (0, 'days', 'active', 30000, datetime(2024, 1, 31, 23, 30)),
+            (0, 'counts', 'expired', 50000, datetime(2024, 2, 1, 0, 30)),
+            (0, 'days', 'active', 40000, datetime(2024, 2, 1, 12)),
+            (1, 'days', 'cancelled', 20000, datetime(2024, 2, 14, 9)),
+            (1, 'counts', 'active', 70000, datetime(2024, 3, 3, 18)),
+        ]
+        for class_index, subscription_type, status, price, created_at in rows:
+            subscription = Subscription.objects.create(
+                student=student, dance_class=self.classes[class_index],
+                subscription_type=subscription_type, status=status, price_paid=price,
+                start_date=date(2024, 1, 1), end_date=date(2024, 12, 31)
+            )
+            Subscription.objects.filter(pk=subscription.pk).update(
+                created_at=timezone.make_aware(created_at)
+            )
+        RevenueRollupService.rebuild()
+
+    def _raw_totals(self, queryset):
+        return queryset.aggregate(
+            total_revenue=Sum('price_paid'),
+            total_subscriptions=Count('id'),
+        )
+
+    def assertMatchesRaw(self):
+        monthly = async_to_sync(RevenueStatsService.get_monthly_revenue)()
+        raw_monthly = Subscription.objects.annotate(
+            month=TruncMonth('created_at')
+        ).values('month').annotate(
+            revenue=Sum('price_paid'), subscriptions=Count('id')
+        ).order_by('month')
+        self.assertEqual(monthly, list(raw_monthly))
+
+        for dance_class in self.classes:
+            stats = async_to_sync(RevenueStatsService.get_class_revenue)(dance_class.id)
+            raw = Subscription.objects.filter(dance_class=dance_class)
+            self.assertEqual(stats['summary'], {
+                **self._raw_totals(raw),
+                'active_subscriptions': raw.filter(status='active').count(),
+            })
+            raw_daily = raw.annotate(date=TruncDate('created_at')).values('date').annotate(
+                revenue=Sum('price_paid'), subscriptions=Count('id')
+            ).order_by('date')
+            self.assertEqual(stats['daily_data'], list(raw_daily))
+
+        for instructor in self.instructors:
+            stats = async_to_sync(RevenueStatsService.get_instructor_revenue)(instructor.id)
+            raw = Subscription.objects.filter(dance_class__instructor=instructor)
+            self.assertEqual(stats['summary'], {
+                **self._raw_totals(raw),
+                'total_classes': raw.values('dance_class').distinct().count(),
+            } if raw.exists() else {
+                'total_revenue': None, 'total_subscriptions': 0, 'total_classes': 0,
+            })
+            raw_classes = raw.values('dance_class__name').annotate(
+                revenue=Sum('price_paid'), subscriptions=Count('id')
+            ).order_by('-revenue')
+            self.assertEqual(stats['class_data'], list(raw_classes))
+
+    def test_stats_match_raw_subscriptions(self):
+        self.assertMatchesRaw()
+
+    def test_monthly_revenue_keeps_datetime_month(self):
+        monthly = async_to_sync(RevenueStatsService.get_monthly_revenue)(year=2024, month=2)
+        self.assertEqual(monthly, [{
+            'month': timezone.make_aware(datetime(2024, 2, 1)),
+            'revenue': 110000,
+            'subscriptions': 3,
+        }])
+
+    def test_instructor_change_is_reflected_without_rebuild(self):
+        dance_class = self.classes[1]
+        dance_class.instructor = self.instructors[1]
+        dance_class.save()
+        self.assertMatchesRaw()
 
-# Create your tests here.
+    def test_signals_keep_rollup_in_sync(self):
+        subscription = Subscription.objects.filter(dance_class=self.classes[0]).first()
+        subscription.price_paid = 10000
+        subscription.status = 'cancelled'
+        subscription.dance_class = self.classes[1]
+        subscription.save()
+        Subscription.objects.filter(dance_class=self.classes[1], status='active').delete()
+        self.assertMatchesRaw()
@@ -1,14 +1,12 @@
 # backend/subscriptions/views/stats_views.py
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from backend.async_views import async_api_view
 from ..services.stats_service import RevenueStatsService
 from django.utils import timezone
 from datetime import datetime
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@async_api_view
 async def revenue_summary(request):
     """매출 요약 통계"""
     try:
@@ -35,8 +33,7 @@ async def revenue_summary(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@async_api_view
 async def monthly_revenue(request):
     """월별 매출 통계"""
     try:
@@ -61,8 +58,7 @@ async def monthly_revenue(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@async_api_view
 async def class_revenue(request, class_id):
     """수업별 매출 통계"""
     try:
@@ -89,8 +85,7 @@ async def class_revenue(request, class_id):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
+@async_api_view
 async def instructor_revenue(request, instructor_id):
     """강사별 매출 통계"""
     try:
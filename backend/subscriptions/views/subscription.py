@@ -4,7 +4,6 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q
 from datetime import timedelta
 from django.utils import timezone
 
@@ -15,9 +14,20 @@ from ..serializers import (
     SubscriptionCreateSerializer,
     SubscriptionPauseSerializer
 )
+from backend.pagination import KeysetPagination
+from search.filters import IndexedSearchFilter
+
+
+class SubscriptionPagination(KeysetPagination):
+    ordering = ('-created_at', '-id')
+
 
 class SubscriptionViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
+    pagination_class = SubscriptionPagination
+    # 검색: 수강생 아이디 또는 수업명
+    filter_backends = [IndexedSearchFilter]
+    search_index_fields = {'student_id': 'username', 'dance_class_id': 'class_name'}
     
     def get_queryset(self):
         queryset = Subscription.objects.select_related(
@@ -48,14 +58,6 @@ class SubscriptionViewSet(viewsets.ModelViewSet):
                 end_date__lte=thirty_days_later
             )
             
-        # 검색
-        search = self.request.query_params.get('search', None)
-        if search:
-            queryset = queryset.filter(
-                Q(student__username__icontains=search) |
-                Q(dance_class__name__icontains=search)
-            )
-            
         return queryset.order_by('-created_at')
         
     def get_serializer_class(self):
@@ -2,6 +2,7 @@
 import React, { useState, useEffect } from 'react';
 import { BellIcon } from '@heroicons/react/24/outline';
 import { webSocketService } from '../../services/websocket';
+import { notificationService } from '../../services/notificationService';
 import NotificationBadge from './NotificationBadge';
 
 export default function NotificationDropdown() {
@@ -10,7 +11,22 @@ export default function NotificationDropdown() {
   const [isOpen, setIsOpen] = useState(false);
 
   useEffect(() => {
+    // 배지 초기값은 서버에 캐시된 개수로 (목록 조회 없이), 이후엔 웹소켓 변경분만 반영
+    notificationService.getUnreadCount()
+      .then(count => setUnreadCount(count))
+      .catch(() => {});
+
     const handleNotification = (data) => {
+      // 읽음 처리 등으로 바뀐 안 읽은 알림 수 (다른 탭에서 읽은 것 포함)
+      if (data.type === 'unread_delta') {
+        setUnreadCount(prev => Math.max(0, prev + data.delta));
+        return;
+      }
+      // 연결 대기열이 넘쳐 서버가 버린 알림: 목록엔 없지만 읽지 않은 수에는 반영
+      if (data.type === 'notifications_dropped') {
+        setUnreadCount(prev => prev + data.count);
+        return;
+      }
       setNotifications(prev => [data, ...prev].slice(0, 10));
       setUnreadCount(prev => prev + 1);
     };
@@ -23,7 +39,10 @@ export default function NotificationDropdown() {
     };
   }, []);
 
-  const handleRead = (notificationId) => {
+  const handleRead = async (notificationId) => {
+    const target = notifications.find(notification => notification.id === notificationId);
+    if (!target || target.read) return;
+
     setNotifications(prev => 
       prev.map(notification => 
         notification.id === notificationId 
@@ -31,7 +50,12 @@ export default function NotificationDropdown() {
           : notification
       )
     );
-    setUnreadCount(prev => Math.max(0, prev - 1));
+    // 안 읽은 알림 수는 서버가 보내는 unread_delta로 줄어든다
+    try {
+      await notificationService.markAsRead(notificationId);
+    } catch (error) {
+      console.error('Failed to mark notification as read:', error);
+    }
   };
 
   return (
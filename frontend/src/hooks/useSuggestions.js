@@ -0,0 +1,36 @@
+// frontend/src/hooks/useSuggestions.js
+
+import { useState, useEffect, useRef, useCallback } from 'react';
+import { searchService } from '../services/searchService';
+
+// 검색창 자동완성 목록 (type: 'student' | 'class')
+// 입력이 빨라 응답 순서가 뒤바뀌어도 마지막 입력의 결과만 반영하도록 이전 요청은 취소한다
+export function useSuggestions(type) {
+  const [suggestions, setSuggestions] = useState([]);
+  const request = useRef(null);
+
+  const updateSuggestions = useCallback((value) => {
+    if (request.current) {
+      request.current.abort();
+    }
+    const controller = new AbortController();
+    request.current = controller;
+
+    searchService.suggest(value, type, 10, controller.signal)
+      .then((results) => {
+        if (!controller.signal.aborted) setSuggestions(results);
+      })
+      .catch(() => {
+        if (!controller.signal.aborted) setSuggestions([]);
+      });
+  }, [type]);
+
+  // 화면을 벗어나면 진행 중인 요청 취소
+  useEffect(() => () => {
+    if (request.current) {
+      request.current.abort();
+    }
+  }, []);
+
+  return [suggestions, updateSuggestions];
+}
@@ -3,6 +3,7 @@
 import { useState, useEffect, useCallback } from 'react';
 import { classService } from '../../services/classService';
 import { attendanceService } from '../../services/attendanceService';
+import { useSuggestions } from '../../hooks/useSuggestions';
 import LoadingSpinner from '../../components/common/LoadingSpinner';
 import ErrorAlert from '../../components/common/ErrorAlert';
 
@@ -22,6 +23,10 @@ export default function AttendancePage() {
   const [loading, setLoading] = useState(true);
   const [saving, setSaving] = useState(false);
   const [error, setError] = useState(null);
+  const [searchTerm, setSearchTerm] = useState('');
+  // 목록 조회에 쓰는 검색어 (입력이 멈춘 뒤에만 반영)
+  const [query, setQuery] = useState('');
+  const [suggestions, updateSuggestions] = useSuggestions('student');
 
   useEffect(() => {
     fetchClasses();
@@ -47,7 +52,8 @@ export default function AttendancePage() {
         setLoading(true);
         const response = await attendanceService.getAttendanceList({
           class_id: selectedClass,
-          date: selectedDate
+          date: selectedDate,
+          search: query
         });
         setAttendanceData(response.results);
         setError(null);
@@ -57,7 +63,7 @@ export default function AttendancePage() {
       } finally {
         setLoading(false);
       }
-    }, [selectedClass, selectedDate]);
+    }, [selectedClass, selectedDate, query]);
 
     useEffect(() => {
       if (selectedClass && selectedDate) {
@@ -68,6 +74,19 @@ export default function AttendancePage() {
     
 
 
+  const handleSearch = (e) => {
+    const value = e.target.value;
+    setSearchTerm(value);
+    // 자동완성은 매 입력마다 (서버 메모리 인덱스라 가벼움), 목록은 디바운스 후 조회
+    updateSuggestions(value);
+    if (window.searchTimeout) {
+      clearTimeout(window.searchTimeout);
+    }
+    window.searchTimeout = setTimeout(() => {
+      setQuery(value);
+    }, 500);
+  };
+
   const handleAttendanceChange = async (studentId, status) => {
     try {
       setSaving(true);
@@ -134,6 +153,20 @@ export default function AttendancePage() {
           onChange={(e) => setSelectedDate(e.target.value)}
           className="block w-full md:w-48 rounded-md border-gray-300 shadow-sm focus:border-primary-500 focus:ring-primary-500 sm:text-sm"
         />
+
+        <input
+          type="text"
+          placeholder="수강생 검색..."
+          value={searchTerm}
+          onChange={handleSearch}
+          list="attendance-student-suggestions"
+          className="block w-full md:w-64 rounded-md border-gray-300 shadow-sm focus:border-primary-500 focus:ring-primary-500 sm:text-sm"
+        />
+        <datalist id="attendance-student-suggestions">
+          {suggestions.map((suggestion) => (
+            <option key={suggestion.id} value={suggestion.label} />
+          ))}
+        </datalist>
       </div>
 
       {error && <ErrorAlert message={error} />}
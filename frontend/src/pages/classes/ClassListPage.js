@@ -3,6 +3,7 @@
 import { useState, useEffect, useCallback } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { classService } from '../../services/classService';
+import { useSuggestions } from '../../hooks/useSuggestions';
 import LoadingSpinner from '../../components/common/LoadingSpinner';
 import ErrorAlert from '../../components/common/ErrorAlert';
 
@@ -11,6 +12,9 @@ export default function ClassListPage() {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [searchTerm, setSearchTerm] = useState('');
+  // 목록 조회에 쓰는 검색어 (입력이 멈춘 뒤에만 반영)
+  const [query, setQuery] = useState('');
+  const [suggestions, updateSuggestions] = useSuggestions('class');
   const [difficulty, setDifficulty] = useState('');
   const [status, setStatus] = useState('');
   const navigate = useNavigate();
@@ -20,7 +24,7 @@ export default function ClassListPage() {
     try {
       setLoading(true);
       const params = {
-        search: searchTerm,
+        search: query,
         difficulty,
         status
       };
@@ -33,20 +37,22 @@ export default function ClassListPage() {
     } finally {
       setLoading(false);
     }
-  }, [searchTerm, difficulty, status]);  // 의존성 명시
+  }, [query, difficulty, status]);  // 의존성 명시
 
   useEffect(() => {
     fetchClasses();
   }, [fetchClasses]);  // fetchClasses를 의존성으로 추가
 
   const handleSearch = (e) => {
-    setSearchTerm(e.target.value);
-    // 디바운스 처리
+    const value = e.target.value;
+    setSearchTerm(value);
+    // 자동완성은 매 입력마다 (서버 메모리 인덱스라 가벼움), 목록은 디바운스 후 조회
+    updateSuggestions(value);
     if (window.searchTimeout) {
       clearTimeout(window.searchTimeout);
     }
     window.searchTimeout = setTimeout(() => {
-      fetchClasses();
+      setQuery(value);
     }, 500);
   };
 
@@ -79,8 +85,14 @@ export default function ClassListPage() {
           placeholder="수업명, 강사명으로 검색..."
           value={searchTerm}
           onChange={handleSearch}
+          list="class-suggestions"
           className="block w-full md:w-64 rounded-md border-gray-300 shadow-sm focus:border-primary-500 focus:ring-primary-500 sm:text-sm"
         />
+        <datalist id="class-suggestions">
+          {suggestions.map((suggestion) => (
+            <option key={suggestion.id} value={suggestion.label} />
+          ))}
+        </datalist>
         
         <select
           value={difficulty}
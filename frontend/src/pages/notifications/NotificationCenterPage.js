@@ -42,13 +42,36 @@ export default function NotificationCenterPage() {
     }
   };
 
+  const handleMarkAllAsRead = async () => {
+    try {
+      // 목록을 불러온 시점까지의 알림만 (그 뒤에 온 알림은 남긴다)
+      const before = notifications.length > 0 ? notifications[0].created_at : undefined;
+      await notificationService.markAllAsRead(before ? { before } : {});
+      setNotifications(prev =>
+        prev.map(notification => ({ ...notification, read: true }))
+      );
+    } catch (err) {
+      console.error('Error marking all notifications as read:', err);
+    }
+  };
+
   if (loading) return <LoadingSpinner />;
   if (error) return <ErrorAlert message={error} />;
 
   return (
     <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
       <div className="mt-8">
-        <h1 className="text-2xl font-bold text-gray-900 mb-6">알림 센터</h1>
+        <div className="flex items-center justify-between mb-6">
+          <h1 className="text-2xl font-bold text-gray-900">알림 센터</h1>
+          {notifications.some(notification => !notification.read) && (
+            <button
+              onClick={handleMarkAllAsRead}
+              className="text-sm text-primary-600 hover:text-primary-800"
+            >
+              모두 읽음으로 표시
+            </button>
+          )}
+        </div>
 
         <div className="bg-white shadow overflow-hidden sm:rounded-md">
           <ul className="divide-y divide-gray-200">
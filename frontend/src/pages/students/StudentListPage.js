@@ -3,6 +3,7 @@
 import { useState, useEffect, useCallback } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { studentService } from '../../services/studentService';
+import { useSuggestions } from '../../hooks/useSuggestions';
 import LoadingSpinner from '../../components/common/LoadingSpinner';
 import ErrorAlert from '../../components/common/ErrorAlert';
 
@@ -11,12 +12,15 @@ export default function StudentListPage() {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [searchTerm, setSearchTerm] = useState('');
+  // 목록 조회에 쓰는 검색어 (입력이 멈춘 뒤에만 반영)
+  const [query, setQuery] = useState('');
+  const [suggestions, updateSuggestions] = useSuggestions('student');
   const navigate = useNavigate();
 
   const fetchStudents = useCallback(async () => {
     try {
       setLoading(true);
-      const response = await studentService.getStudents({ search: searchTerm });
+      const response = await studentService.getStudents({ search: query });
       setStudents(response.results);
       setError(null);
     } catch (err) {
@@ -25,20 +29,22 @@ export default function StudentListPage() {
     } finally {
       setLoading(false);
     }
-  }, [searchTerm]);
+  }, [query]);
 
   useEffect(() => {
     fetchStudents();
   }, [fetchStudents]);
 
   const handleSearch = (e) => {
-    setSearchTerm(e.target.value);
-    // 디바운스 처리를 위해 setTimeout 사용
+    const value = e.target.value;
+    setSearchTerm(value);
+    // 자동완성은 매 입력마다 (서버 메모리 인덱스라 가벼움), 목록은 디바운스 후 조회
+    updateSuggestions(value);
     if (window.searchTimeout) {
       clearTimeout(window.searchTimeout);
     }
     window.searchTimeout = setTimeout(() => {
-      fetchStudents();
+      setQuery(value);
     }, 500);
   };
 
@@ -71,8 +77,14 @@ export default function StudentListPage() {
           placeholder="이름, 연락처로 검색..."
           value={searchTerm}
           onChange={handleSearch}
+          list="student-suggestions"
           className="block w-full rounded-md border-gray-300 shadow-sm focus:border-primary-500 focus:ring-primary-500 sm:text-sm"
         />
+        <datalist id="student-suggestions">
+          {suggestions.map((suggestion) => (
+            <option key={suggestion.id} value={suggestion.label} />
+          ))}
+        </datalist>
       </div>
 
       {/* Student List Table */}
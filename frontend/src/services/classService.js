@@ -37,5 +37,14 @@ export const classService = {
   async getClassSchedules(id) {
     const response = await axios.get(`${API_URL}/classes/${id}/schedules/`);
     return response.data;
+  },
+
+  // 강의실별 빈 시간 (params: weekday, room, open, close, min_minutes)
+  async getFreeSlots(params) {
+    const response = await axios.get(`${API_URL}/classes/free-slots/`, {
+      params,
+      paramsSerializer: { indexes: null }  // room=A&room=B 형식
+    });
+    return response.data;
   }
 };
\ No newline at end of file
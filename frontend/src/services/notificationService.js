@@ -9,11 +9,22 @@ export const notificationService = {
     return response.data;
   },
 
+  async getUnreadCount() {
+    const response = await axios.get(`${API_URL}/notifications/unread-count/`);
+    return response.data.unread_count;
+  },
+
   async markAsRead(id) {
     const response = await axios.post(`${API_URL}/notifications/${id}/read/`);
     return response.data;
   },
 
+  // params: { type, before } (없으면 전체 읽음 처리)
+  async markAllAsRead(params = {}) {
+    const response = await axios.post(`${API_URL}/notifications/read/`, params);
+    return response.data;
+  },
+
   async updateSettings(settings) {
     const response = await axios.patch(`${API_URL}/notifications/settings/`, settings);
     return response.data;
@@ -0,0 +1,17 @@
+// frontend/src/services/searchService.js
+
+import axios from 'axios';
+
+const API_URL = 'http://localhost:8000/api';
+
+export const searchService = {
+  // 검색창 자동완성 (type: 'student' | 'class', 없으면 둘 다, signal: 요청 취소용 AbortSignal)
+  async suggest(q, type, limit = 10, signal) {
+    if (!q || !q.trim()) return [];
+    const response = await axios.get(`${API_URL}/search/suggest/`, {
+      params: { q, type, limit },
+      signal
+    });
+    return response.data.results;
+  },
+};
@@ -12,8 +12,12 @@ class WebSocketService {
       this.ws = new WebSocket(`ws://localhost:8000/ws/notifications/`);
       
       this.ws.onmessage = (event) => {
+          // 서버는 짧은 시간 동안 모은 알림을 배열 하나로 보낸다
           const data = JSON.parse(event.data);
-          this.handlers.forEach(handler => handler(data));
+          const messages = Array.isArray(data) ? data : [data];
+          messages.forEach(message => {
+              this.handlers.forEach(handler => handler(message));
+          });
       };
 
       this.ws.onclose = () => {